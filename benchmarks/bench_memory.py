@@ -0,0 +1,193 @@
+"""
+Measure the memory of the value objects (``Arg``, ``ArgList``,
+``Violation``, ``ReturnArg``, and ``YieldArg``) that pydoclint creates when
+checking a synthetic corpus, and compare them with dict-backed objects that
+have the same attributes.
+
+Usage::
+
+    python -m benchmarks.bench_memory [--functions 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import gc
+import tracemalloc
+from typing import TYPE_CHECKING, Any
+
+from pydoclint.utils.arg import Arg, ArgList
+from pydoclint.utils.doc import Doc
+from pydoclint.utils.generic import collectFuncArgs
+from pydoclint.utils.violation import Violation
+from pydoclint.utils.yield_arg import YieldArg
+from pydoclint.visitor import Visitor
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+FUNCTIONS_PER_MODULE = 1000
+
+FUNCTION_TEMPLATE = '''
+def func{i}(arg1: int, arg2: dict[str, list[int]], arg3: str = '') -> bool:
+    """
+    Function {i}
+
+    Parameters
+    ----------
+    arg1 : int
+        Arg 1
+    arg2 : dict[str, list[float]]
+        Arg 2
+
+    Returns
+    -------
+    bool
+        Something
+    """
+    return True
+'''
+
+
+class _DictBackedObject:
+    """A plain object that keeps its attributes in a ``__dict__``"""
+
+    def __init__(self, **attributes: Any) -> None:
+        self.__dict__.update(attributes)
+
+
+def _generateModule(start: int, stop: int) -> str:
+    return ''.join(FUNCTION_TEMPLATE.format(i=i) for i in range(start, stop))
+
+
+def _measureBytes(build: Callable[[], list[Any]]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    objects = build()
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return allocated
+
+
+def _collectObjects(numFunctions: int) -> dict[str, list[Any]]:
+    objects: dict[str, list[Any]] = {
+        'Arg': [],
+        'ArgList': [],
+        'Violation': [],
+        'ReturnArg': [],
+        'YieldArg': [],
+    }
+    for start in range(0, numFunctions, FUNCTIONS_PER_MODULE):
+        stop = min(start + FUNCTIONS_PER_MODULE, numFunctions)
+        tree = ast.parse(_generateModule(start, stop))
+
+        visitor = Visitor(style='numpy')
+        visitor.visit(tree)
+        objects['Violation'].extend(visitor.violations)
+
+        for node in tree.body:
+            assert isinstance(node, ast.FunctionDef)
+            args = [Arg.fromAstArg(_) for _ in collectFuncArgs(node)]
+            objects['Arg'].extend(args)
+            objects['ArgList'].append(ArgList(args))
+
+            docstring = ast.get_docstring(node)
+            assert docstring is not None
+            for returnArg in Doc(docstring, style='numpy').returnSection:
+                objects['ReturnArg'].append(returnArg)
+                objects['YieldArg'].append(
+                    YieldArg(
+                        argName=returnArg.argName,
+                        argType=returnArg.argType,
+                        argDescr=returnArg.argDescr,
+                    )
+                )
+
+    return objects
+
+
+def _copy(obj: Any) -> Any:
+    if isinstance(obj, Arg):
+        return Arg(name=obj.name, typeHint=obj.typeHint)
+
+    if isinstance(obj, ArgList):
+        return ArgList(obj.infoList)
+
+    if isinstance(obj, Violation):
+        return Violation(
+            line=obj.line,
+            code=obj.code,
+            msgPrefix=obj.msgPrefix,
+            msgPostfix=obj.msgPostfix,
+            moreMsg=obj.moreMsg,
+        )
+
+    return type(obj)(
+        argName=obj.argName,
+        argType=obj.argType,
+        argDescr=obj.argDescr,
+    )
+
+
+def _copyAsDictBacked(obj: Any) -> _DictBackedObject:
+    if isinstance(obj, Arg):
+        return _DictBackedObject(name=obj.name, typeHint=obj.typeHint)
+
+    if isinstance(obj, ArgList):
+        # The name lookup used to be built eagerly
+        return _DictBackedObject(
+            infoList=obj.infoList,
+            lookup={_.name: _.typeHint for _ in obj.infoList},
+        )
+
+    if isinstance(obj, Violation):
+        # The message used to be rendered eagerly
+        return _DictBackedObject(
+            line=obj.line,
+            code=obj.code,
+            violationMsg=obj.violationMsg,
+            msgPrefix=obj.msgPrefix,
+            msgPostfix=obj.msgPostfix,
+            msg=''.join(obj.msg),  # a new string, like before
+        )
+
+    return _DictBackedObject(
+        argName=obj.argName,
+        argType=obj.argType,
+        argDescr=obj.argDescr,
+    )
+
+
+def main() -> None:
+    """Run the benchmark and print a table of the results"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--functions', type=int, default=100_000)
+    args = parser.parse_args()
+
+    objects = _collectObjects(args.functions)
+
+    print(f'Corpus: {args.functions} functions')
+    print(
+        f'{"class":<10} {"count":>9} {"slotted B/obj":>14}'
+        f' {"dict B/obj":>11} {"saved MB":>9}'
+    )
+    for className, objectsOfClass in objects.items():
+        count = len(objectsOfClass)
+        if count == 0:
+            continue
+
+        slotted = _measureBytes(lambda o=objectsOfClass: [_copy(_) for _ in o])
+        dictBacked = _measureBytes(
+            lambda o=objectsOfClass: [_copyAsDictBacked(_) for _ in o]
+        )
+        print(
+            f'{className:<10} {count:>9} {slotted / count:>14.1f}'
+            f' {dictBacked / count:>11.1f}'
+            f' {(dictBacked - slotted) / 1024 / 1024:>9.1f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,466 @@
+"""
+Time pydoclint end to end (``_checkPaths()``) on synthetic corpora (see
+``benchmarks.corpus``), on the test data, and on the test files from
+lib2to3, and time the hot helpers (``Visitor``, ``parseDocstring()``,
+``specialEqual()``, and ``ArgList``) in isolation.
+
+The in-process caches (of the docstring parsing and of the type hints) are
+cleared before each run, so that every run does the same work. The results
+(the fastest and the median run of each benchmark) are written to a JSON
+file, and ``compare`` flags the benchmarks that got slower than in a stored
+baseline run by more than a threshold (and exits with 1 if there are any).
+
+Usage::
+
+    python -m benchmarks.bench_suite run [--output results.json] [--quick]
+    python -m benchmarks.bench_suite compare BASELINE.json RESULTS.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import dataclasses
+import json
+import os
+import platform
+import re
+import shutil
+import statistics
+import subprocess  # noqa: S404  # only runs git, with fixed args
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from benchmarks.corpus import STYLES, CorpusSpec, generateCorpus
+from pydoclint.main import _checkPaths  # noqa: PLC2701  # what is timed
+from pydoclint.utils.arg import Arg, ArgList
+from pydoclint.utils.doc import Doc
+from pydoclint.utils.generic import (
+    clearTypeHintCache,
+    collectFuncArgs,
+    specialEqual,
+)
+from pydoclint.utils.parse_docstring import (
+    clearDocstringParseCache,
+    parseDocstring,
+)
+from pydoclint.utils.return_anno import parseAnnotation
+from pydoclint.visitor import Visitor
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+RESULTS_FORMAT_VERSION = 1
+
+# A benchmark is flagged if its fastest run is this much slower
+DEFAULT_THRESHOLD = 0.1
+
+DEFAULT_REPEAT = 5
+
+ROOT_DIR = Path(__file__).parent.parent
+TEST_DATA_DIR = ROOT_DIR / 'tests' / 'test_data'
+LIB2TO3_DIR = TEST_DATA_DIR / 'lib2to3_test_cases'
+EXCLUDE_PATTERN = r'\.git|\.tox'
+
+# The corpora are small with --quick (such as for a smoke test in CI)
+FULL_CORPUS = CorpusSpec()
+QUICK_CORPUS = CorpusSpec(numFiles=5, functionsPerFile=10)
+
+# How many times the cheap helpers are called over their inputs in each run,
+# so that a run takes long enough to be timed reliably
+SPECIAL_EQUAL_ROUNDS = 50
+
+
+def runBenchmarks(
+        *,
+        repeat: int = DEFAULT_REPEAT,
+        quick: bool = False,
+        select: str = '',
+) -> dict[str, Any]:
+    """
+    Run the benchmarks.
+
+    Parameters
+    ----------
+    repeat : int, default=DEFAULT_REPEAT
+        How many times to run each benchmark
+    quick : bool, default=False
+        Whether to use small synthetic corpora
+    select : str, default=''
+        A regex; only the benchmarks whose names it matches are run
+
+    Returns
+    -------
+    dict[str, Any]
+        The results, in a JSON-serializable form
+    """
+    corpusSpec: CorpusSpec = QUICK_CORPUS if quick else FULL_CORPUS
+    results: dict[str, dict[str, Any]] = {}
+    with tempfile.TemporaryDirectory() as tempDir:
+        benchmarks = _collectBenchmarks(corpusSpec, Path(tempDir))
+        for name, func in benchmarks.items():
+            if not re.search(select, name):
+                continue
+
+            times: list[float] = _timeRepeatedly(func, repeat)
+            results[name] = {
+                'min': min(times),
+                'median': statistics.median(times),
+                'times': times,
+            }
+            print(f'{name:<40} {min(times) * 1000:>10.2f} ms')
+
+    return {
+        'version': RESULTS_FORMAT_VERSION,
+        'metadata': _collectMetadata(),
+        'corpus': dataclasses.asdict(corpusSpec),
+        'repeat': repeat,
+        'results': results,
+    }
+
+
+def compareResults(
+        baseline: dict[str, Any],
+        current: dict[str, Any],
+        threshold: float = DEFAULT_THRESHOLD,
+) -> list[tuple[str, float | None, float | None, str]]:
+    """
+    Compare the fastest runs of the benchmarks with those of a baseline run.
+
+    Parameters
+    ----------
+    baseline : dict[str, Any]
+        The results of the baseline run (from ``runBenchmarks()``)
+    current : dict[str, Any]
+        The results of the current run
+    threshold : float, default=DEFAULT_THRESHOLD
+        How much slower (or faster) than in the baseline run a benchmark
+        must be to count as a regression (or an improvement), such as 0.1
+        for 10%
+
+    Returns
+    -------
+    list[tuple[str, float | None, float | None, str]]
+        The name of each benchmark, its fastest run in the baseline run and
+        in the current run (None if it's missing from that run), and its
+        status: "regression", "improvement", "ok", "new", or "missing"
+    """
+    baselineResults: dict[str, Any] = baseline['results']
+    currentResults: dict[str, Any] = current['results']
+
+    comparisons: list[tuple[str, float | None, float | None, str]] = []
+    for name in sorted(baselineResults.keys() | currentResults.keys()):
+        before: float | None = baselineResults.get(name, {}).get('min')
+        after: float | None = currentResults.get(name, {}).get('min')
+        status: str
+        if before is None:
+            status = 'new'
+        elif after is None:
+            status = 'missing'
+        elif after > before * (1 + threshold):
+            status = 'regression'
+        elif after < before * (1 - threshold):
+            status = 'improvement'
+        else:
+            status = 'ok'
+
+        comparisons.append((name, before, after, status))
+
+    return comparisons
+
+
+def formatComparison(
+        comparisons: list[tuple[str, float | None, float | None, str]],
+) -> str:
+    """Format the output of ``compareResults()`` as a table"""
+    lines: list[str] = [
+        f'{"benchmark":<40} {"before ms":>10} {"after ms":>10}'
+        f' {"change":>8}  status'
+    ]
+    for name, before, after, status in comparisons:
+        beforeText: str = '-' if before is None else f'{before * 1000:.2f}'
+        afterText: str = '-' if after is None else f'{after * 1000:.2f}'
+        change: str = '-'
+        if before is not None and after is not None:
+            change = f'{(after / before - 1) * 100:+.1f}%'
+
+        lines.append(
+            f'{name:<40} {beforeText:>10} {afterText:>10} {change:>8}'
+            f'  {status}'
+        )
+
+    return '\n'.join(lines)
+
+
+def _clearCaches() -> None:
+    clearDocstringParseCache()
+    clearTypeHintCache()
+    parseAnnotation.cache_clear()
+
+
+def _timeRepeatedly(func: Callable[[], object], repeat: int) -> list[float]:
+    # The wall time of each run, in seconds
+    times: list[float] = []
+    for _ in range(repeat):
+        _clearCaches()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    return times
+
+
+def _collectBenchmarks(
+        corpusSpec: CorpusSpec,
+        tempDir: Path,
+) -> dict[str, Callable[[], object]]:
+    # The name and the function of each benchmark. The inputs are prepared
+    # here, so that only the work itself is timed.
+    benchmarks: dict[str, Callable[[], object]] = {}
+    corpusDirs: dict[str, Path] = {}
+    for style in STYLES:
+        corpusDirs[style] = tempDir / style
+        generateCorpus(
+            dataclasses.replace(corpusSpec, style=style),
+            corpusDirs[style],
+        )
+
+    def _checkPathsIn(path: Path, style: str) -> Callable[[], object]:
+        return lambda: _checkPaths(
+            (str(path),),
+            style=style,
+            quiet=True,
+            exclude=EXCLUDE_PATTERN,
+        )
+
+    for style in STYLES:
+        benchmarks[f'checkPaths/synthetic-{style}'] = _checkPathsIn(
+            corpusDirs[style], style
+        )
+        benchmarks[f'checkPaths/test_data-{style}'] = _checkPathsIn(
+            TEST_DATA_DIR / style, style
+        )
+
+    benchmarks['checkPaths/lib2to3'] = _checkPathsIn(LIB2TO3_DIR, 'numpy')
+
+    treesByStyle: dict[str, list[ast.Module]] = {
+        style: _parseFiles(sorted(corpusDirs[style].glob('*.py')))
+        for style in STYLES
+    }
+    grammarTree: ast.Module = _parseFiles([
+        LIB2TO3_DIR / 'py3_test_grammar.py'
+    ])[0]
+
+    def _visit(trees: list[ast.Module], style: str) -> Callable[[], object]:
+        def _run() -> None:
+            for tree in trees:
+                Visitor(style=style).visit(tree)
+
+        return _run
+
+    benchmarks['Visitor/synthetic-numpy'] = _visit(
+        treesByStyle['numpy'], 'numpy'
+    )
+    benchmarks['Visitor/py3_test_grammar'] = _visit([grammarTree], 'numpy')
+
+    for style in STYLES:
+        docstrings: list[str] = _collectDocstrings(
+            _parseFiles(sorted(TEST_DATA_DIR.joinpath(style).rglob('*.py')))
+            + treesByStyle[style]
+        )
+        benchmarks[f'parseDocstring/{style}'] = (
+            lambda docstrings=docstrings, style=style: [
+                parseDocstring(_, style) for _ in docstrings
+            ]
+        )
+
+    argListPairs: list[tuple[list[Arg], list[Arg]]] = _collectArgListPairs(
+        treesByStyle['numpy']
+    )
+    typeHintPairs: list[tuple[str, str]] = [
+        (sigArg.typeHint, docArg.typeHint)
+        for sigArgs, docArgs in argListPairs
+        for sigArg, docArg in zip(sigArgs, docArgs, strict=False)
+    ]
+
+    def _compareTypeHints() -> None:
+        for _ in range(SPECIAL_EQUAL_ROUNDS):
+            for hint1, hint2 in typeHintPairs:
+                specialEqual(hint1, hint2)
+
+    def _compareArgLists() -> None:
+        for sigArgs, docArgs in argListPairs:
+            sigArgList = ArgList(sigArgs)
+            docArgList = ArgList(docArgs)
+            if not sigArgList.equals(docArgList):
+                sigArgList.subtract(docArgList)
+                if sigArgList.equals(
+                    docArgList, checkTypeHint=False, orderMatters=False
+                ):
+                    sigArgList.findArgsWithDifferentTypeHints(docArgList)
+
+    benchmarks['specialEqual/synthetic'] = _compareTypeHints
+    benchmarks['ArgList/synthetic'] = _compareArgLists
+    return benchmarks
+
+
+def _parseFiles(paths: list[Path]) -> list[ast.Module]:
+    trees: list[ast.Module] = []
+    for path in paths:
+        if not path.is_file():  # some folder names end with ".py"
+            continue
+
+        try:
+            trees.append(ast.parse(path.read_bytes()))
+        except (SyntaxError, ValueError):
+            continue
+
+    return trees
+
+
+def _collectDocstrings(trees: list[ast.Module]) -> list[str]:
+    docstrings: list[str] = []
+    for tree in trees:
+        for node in ast.walk(tree):
+            if isinstance(
+                node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+            ):
+                docstring = ast.get_docstring(node)
+                if docstring:
+                    docstrings.append(docstring)
+
+    return docstrings
+
+
+def _collectArgListPairs(
+        trees: list[ast.Module],
+) -> list[tuple[list[Arg], list[Arg]]]:
+    # The args in the signature and in the docstring of each function
+    pairs: list[tuple[list[Arg], list[Arg]]] = []
+    for tree in trees:
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.FunctionDef) or not node.args.args:
+                continue
+
+            docstring = ast.get_docstring(node)
+            if not docstring:
+                continue
+
+            sigArgs = [
+                Arg.fromAstArg(_)
+                for _ in collectFuncArgs(node)
+                if _.arg != 'self'
+            ]
+            docArgs = Doc(docstring, style='numpy').argList.infoList
+            pairs.append((sigArgs, docArgs))
+
+    return pairs
+
+
+def _gitCommit() -> str | None:
+    # Resolve git to a full path, rather than running it via a PATH lookup
+    git: str | None = shutil.which('git')
+    if git is None:
+        return None
+
+    try:
+        return subprocess.run(  # noqa: S603  # the args are fixed
+            [git, 'rev-parse', 'HEAD'],
+            cwd=ROOT_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _collectMetadata() -> dict[str, Any]:
+    return {
+        'python': sys.version.split()[0],
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'cpuCount': os.cpu_count(),
+        'commit': _gitCommit(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+    }
+
+
+def _loadResults(path: Path) -> dict[str, Any]:
+    results: dict[str, Any] = json.loads(path.read_text(encoding='utf-8'))
+    if results.get('version') != RESULTS_FORMAT_VERSION:
+        msg = f'{path} is not a results file of this benchmark suite'
+        raise SystemExit(msg)
+
+    return results
+
+
+def main() -> None:
+    """Run the benchmarks, or compare two results files"""
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    runParser = subparsers.add_parser('run', help='Run the benchmarks')
+    runParser.add_argument('--output', type=Path, default=None)
+    runParser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT)
+    runParser.add_argument('--quick', action='store_true')
+    runParser.add_argument(
+        '--select',
+        default='',
+        help='A regex of the names of the benchmarks to run',
+    )
+
+    compareParser = subparsers.add_parser(
+        'compare', help='Flag the regressions against a baseline run'
+    )
+    compareParser.add_argument('baseline', type=Path)
+    compareParser.add_argument('results', type=Path)
+    compareParser.add_argument(
+        '--threshold', type=float, default=DEFAULT_THRESHOLD
+    )
+
+    args = parser.parse_args()
+
+    if args.command == 'run':
+        results = runBenchmarks(
+            repeat=args.repeat,
+            quick=args.quick,
+            select=args.select,
+        )
+        if args.output is not None:
+            args.output.write_text(
+                json.dumps(results, indent=2) + '\n', encoding='utf-8'
+            )
+            print(f'The results are written to {args.output}')
+
+        return
+
+    baseline = _loadResults(args.baseline)
+    current = _loadResults(args.results)
+    if baseline['metadata']['platform'] != current['metadata']['platform']:
+        print('Warning: the runs are from different platforms')
+
+    if baseline['corpus'] != current['corpus']:
+        print('Warning: the runs used other synthetic corpora')
+
+    comparisons = compareResults(baseline, current, args.threshold)
+    print(formatComparison(comparisons))
+    numRegressions: int = sum(
+        1 for *_, status in comparisons if status == 'regression'
+    )
+    if numRegressions > 0:
+        print(
+            f'{numRegressions} benchmark(s) got slower by more than'
+            f' {args.threshold:.0%}'
+        )
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
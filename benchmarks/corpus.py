@@ -0,0 +1,403 @@
+"""
+Generate a deterministic synthetic corpus of Python files for the
+benchmarks: the same parameters (including the seed) always produce the
+same files, byte for byte, so that the timings of two runs are comparable.
+
+Each file has ``functionsPerFile`` documented functions, each nested in
+``nestingDepth`` enclosing definitions (alternately classes and functions,
+which are documented too). The type hints of the arguments and the return
+values are nested up to ``typeHintComplexity`` levels deep (such as
+``dict[str, list[int | None]]`` for 2 levels). About 1 in 5 docstrings
+spell a type hint differently from the signature (such as with other
+quotes or spaces), which exercises the type hint comparison, and about 1 in
+20 docstrings miss an argument, which produces violations.
+
+Usage::
+
+    python -m benchmarks.corpus OUTPUT_DIR [--files 50] [--style numpy] ...
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+from dataclasses import dataclass
+from pathlib import Path
+
+STYLES = ('numpy', 'google', 'sphinx')
+
+SIMPLE_TYPES = (
+    'int',
+    'str',
+    'float',
+    'bool',
+    'bytes',
+    'Path',
+    "Literal['r', 'w']",
+)
+
+# Each template wraps 1 type hint (``{0}``) in one more level of nesting
+GENERIC_TEMPLATES = (
+    'list[{0}]',
+    'dict[str, {0}]',
+    'tuple[{0}, ...]',
+    '{0} | None',
+    'Callable[[int], {0}]',
+    'Sequence[{0}]',
+)
+
+RESPELLING_RATE = 0.2
+MISSING_ARG_RATE = 0.05
+RAISES_RATE = 0.3
+MAX_NUM_ARGS = 4
+
+INDENT = '    '
+
+
+@dataclass(frozen=True)
+class CorpusSpec:
+    """The parameters of a synthetic corpus"""
+
+    numFiles: int = 50
+    functionsPerFile: int = 20
+    nestingDepth: int = 1
+    style: str = 'numpy'
+    typeHintComplexity: int = 2
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        if self.style not in STYLES:
+            msg = f'Unknown docstring style: {self.style}'
+            raise ValueError(msg)
+
+
+def generateCorpus(spec: CorpusSpec, directory: Path) -> list[Path]:
+    """
+    Write the files of a synthetic corpus.
+
+    Parameters
+    ----------
+    spec : CorpusSpec
+        The parameters of the corpus
+    directory : Path
+        The directory to write the files to (it is created if needed)
+
+    Returns
+    -------
+    list[Path]
+        The paths of the files, in order
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    paths: list[Path] = []
+    for i in range(spec.numFiles):
+        path = directory / f'module_{i:04d}.py'
+        path.write_text(generateModule(spec, i), encoding='utf-8')
+        paths.append(path)
+
+    return paths
+
+
+def generateModule(spec: CorpusSpec, index: int) -> str:
+    """
+    Generate the source code of one file of the corpus. Each file has its own
+    random generator (seeded by the seed of the corpus and by ``index``), so
+    that a file does not change when the number of files does.
+
+    Parameters
+    ----------
+    spec : CorpusSpec
+        The parameters of the corpus
+    index : int
+        The index of the file in the corpus
+
+    Returns
+    -------
+    str
+        The source code
+    """
+    rng = random.Random(spec.seed * 1_000_003 + index)  # noqa: S311
+    lines: list[str] = [f'"""Synthetic module {index}"""']
+    for i in range(spec.functionsPerFile):
+        lines.extend(['', ''])
+        lines.extend(
+            _generateDefinition(
+                rng,
+                spec,
+                name=f'func_{index}_{i}',
+                indent='',
+                levelsAbove=spec.nestingDepth,
+                isMethod=False,
+            )
+        )
+
+    return '\n'.join(lines) + '\n'
+
+
+def makeTypeHint(rng: random.Random, complexity: int) -> str:
+    """
+    Generate a random type hint nested up to ``complexity`` levels deep.
+
+    Parameters
+    ----------
+    rng : random.Random
+        The random generator
+    complexity : int
+        The maximum number of nested levels (0 for a simple type)
+
+    Returns
+    -------
+    str
+        The type hint
+    """
+    if complexity <= 0:
+        return rng.choice(SIMPLE_TYPES)
+
+    inner: str = makeTypeHint(rng, rng.randint(0, complexity - 1))
+    return rng.choice(GENERIC_TEMPLATES).format(inner)
+
+
+def respellTypeHint(typeHint: str) -> str:
+    """
+    Spell a type hint differently, but so that pydoclint still considers it
+    the same (with other quotes, or without spaces).
+    """
+    if "'" in typeHint:
+        return typeHint.replace("'", '"')
+
+    return typeHint.replace(', ', ',')
+
+
+def _generateDefinition(
+        rng: random.Random,
+        spec: CorpusSpec,
+        *,
+        name: str,
+        indent: str,
+        levelsAbove: int,
+        isMethod: bool,
+) -> list[str]:
+    # A documented function, wrapped in `levelsAbove` enclosing definitions
+    # (a class at the outermost level, then alternately a function and a
+    # class)
+    if levelsAbove == 0:
+        return _generateFunction(rng, spec, name, indent, isMethod=isMethod)
+
+    innerIndent: str = indent + INDENT
+    isClass: bool = (spec.nestingDepth - levelsAbove) % 2 == 0
+    lines: list[str]
+    if isClass:
+        lines = [f'{indent}class {name.title()}Level{levelsAbove}:']
+    else:
+        selfArg: str = 'self' if isMethod else ''
+        lines = [f'{indent}def {name}_level{levelsAbove}({selfArg}) -> None:']
+
+    lines.extend(
+        _generateDocstring(
+            spec.style,
+            innerIndent,
+            summary=f'Level {levelsAbove} around {name}.',
+            args=[],
+            returnType=None,
+            raises=False,
+        )
+    )
+    lines.append('')
+    lines.extend(
+        _generateDefinition(
+            rng,
+            spec,
+            name=name,
+            indent=innerIndent,
+            levelsAbove=levelsAbove - 1,
+            isMethod=isClass,
+        )
+    )
+    return lines
+
+
+def _generateFunction(
+        rng: random.Random,
+        spec: CorpusSpec,
+        name: str,
+        indent: str,
+        *,
+        isMethod: bool,
+) -> list[str]:
+    args: list[tuple[str, str]] = [
+        (f'arg{i}', makeTypeHint(rng, spec.typeHintComplexity))
+        for i in range(rng.randint(1, MAX_NUM_ARGS))
+    ]
+    returnType: str = makeTypeHint(rng, spec.typeHintComplexity)
+    raises: bool = rng.random() < RAISES_RATE
+
+    documentedArgs: list[tuple[str, str]] = list(args)
+    if rng.random() < RESPELLING_RATE:
+        i = rng.randrange(len(args))
+        documentedArgs[i] = (args[i][0], respellTypeHint(args[i][1]))
+
+    if len(args) > 1 and rng.random() < MISSING_ARG_RATE:
+        del documentedArgs[-1]
+
+    signatureArgs: list[str] = ['self'] if isMethod else []
+    signatureArgs.extend(f'{arg}: {typeHint}' for arg, typeHint in args)
+    bodyIndent: str = indent + INDENT
+
+    lines: list[str] = [
+        f'{indent}def {name}({", ".join(signatureArgs)}) -> {returnType}:'
+    ]
+    lines.extend(
+        _generateDocstring(
+            spec.style,
+            bodyIndent,
+            summary=f'Compute {name}.',
+            args=documentedArgs,
+            returnType=returnType,
+            raises=raises,
+        )
+    )
+    if raises:
+        lines.extend([
+            f'{bodyIndent}if arg0 is None:',
+            f"{bodyIndent}{INDENT}raise ValueError('arg0 is None')",
+            '',
+        ])
+
+    lines.append(f'{bodyIndent}return arg0')
+    return lines
+
+
+def _generateDocstring(
+        style: str,
+        indent: str,
+        *,
+        summary: str,
+        args: list[tuple[str, str]],
+        returnType: str | None,
+        raises: bool,
+) -> list[str]:
+    body: list[str]
+    if style == 'numpy':
+        body = _generateNumpySections(args, returnType, raises=raises)
+    elif style == 'google':
+        body = _generateGoogleSections(args, returnType, raises=raises)
+    else:
+        body = _generateSphinxFields(args, returnType, raises=raises)
+
+    lines: list[str] = [f'{indent}"""', f'{indent}{summary}']
+    if body:
+        lines.append('')
+        lines.extend(f'{indent}{_}' if _ else '' for _ in body)
+
+    lines.append(f'{indent}"""')
+    return lines
+
+
+def _generateNumpySections(
+        args: list[tuple[str, str]],
+        returnType: str | None,
+        *,
+        raises: bool,
+) -> list[str]:
+    lines: list[str] = []
+    if args:
+        lines.extend(['Parameters', '----------'])
+        for arg, typeHint in args:
+            lines.extend([f'{arg} : {typeHint}', f'{INDENT}The {arg}'])
+
+    if returnType is not None:
+        lines.extend([
+            '',
+            'Returns',
+            '-------',
+            returnType,
+            f'{INDENT}The result',
+        ])
+
+    if raises:
+        lines.extend([
+            '',
+            'Raises',
+            '------',
+            'ValueError',
+            f'{INDENT}If arg0 is None',
+        ])
+
+    return lines
+
+
+def _generateGoogleSections(
+        args: list[tuple[str, str]],
+        returnType: str | None,
+        *,
+        raises: bool,
+) -> list[str]:
+    lines: list[str] = []
+    if args:
+        lines.append('Args:')
+        lines.extend(
+            f'{INDENT}{arg} ({typeHint}): The {arg}' for arg, typeHint in args
+        )
+
+    if returnType is not None:
+        lines.extend(['', 'Returns:', f'{INDENT}{returnType}: The result'])
+
+    if raises:
+        lines.extend(['', 'Raises:', f'{INDENT}ValueError: If arg0 is None'])
+
+    return lines
+
+
+def _generateSphinxFields(
+        args: list[tuple[str, str]],
+        returnType: str | None,
+        *,
+        raises: bool,
+) -> list[str]:
+    lines: list[str] = []
+    for arg, typeHint in args:
+        lines.extend([f':param {arg}: The {arg}', f':type {arg}: {typeHint}'])
+
+    if returnType is not None:
+        lines.extend([':return: The result', f':rtype: {returnType}'])
+
+    if raises:
+        lines.append(':raises ValueError: If arg0 is None')
+
+    return lines
+
+
+def main() -> None:
+    """Generate a corpus with the parameters from the command line"""
+    defaults = CorpusSpec()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('output_dir', type=Path)
+    parser.add_argument('--files', type=int, default=defaults.numFiles)
+    parser.add_argument(
+        '--functions-per-file', type=int, default=defaults.functionsPerFile
+    )
+    parser.add_argument(
+        '--nesting-depth', type=int, default=defaults.nestingDepth
+    )
+    parser.add_argument('--style', choices=STYLES, default=defaults.style)
+    parser.add_argument(
+        '--type-hint-complexity',
+        type=int,
+        default=defaults.typeHintComplexity,
+    )
+    parser.add_argument('--seed', type=int, default=defaults.seed)
+    args = parser.parse_args()
+
+    spec = CorpusSpec(
+        numFiles=args.files,
+        functionsPerFile=args.functions_per_file,
+        nestingDepth=args.nesting_depth,
+        style=args.style,
+        typeHintComplexity=args.type_hint_complexity,
+        seed=args.seed,
+    )
+    paths = generateCorpus(spec, args.output_dir)
+    print(f'Generated {len(paths)} files in {args.output_dir}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,12 @@
-import importlib.metadata
+from typing import Any
 
-__version__ = importlib.metadata.version('pydoclint')
+
+def __getattr__(name: str) -> Any:
+    # ``importlib.metadata`` is slow to import, so the version is only looked
+    # up when it is actually needed (such as for ``--version``)
+    if name == '__version__':
+        import importlib.metadata  # noqa: PLC0415
+
+        return importlib.metadata.version('pydoclint')
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
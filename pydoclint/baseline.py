@@ -1,12 +1,27 @@
 from __future__ import annotations
 
-from collections import OrderedDict
-from itertools import groupby
-from typing import TYPE_CHECKING
+import contextlib
+import json
+import os
+import stat
+import tempfile
+from collections import Counter, OrderedDict
+from collections.abc import Mapping
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+
+from pydoclint.cache import (
+    computeCacheKey,
+    computeOptionsFingerprint,
+    violationFromJson,
+    violationToJson,
+)
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from collections.abc import Iterable, Iterator
 
+    from pydoclint.cache import MemoryResultCache, ResultCache
+    from pydoclint.utils.profiling import Profiler
     from pydoclint.utils.violation import Violation
 
 SEPARATOR = '--------------------\n'  # 20 dashes
@@ -14,14 +29,38 @@ LEN_INDENT = 4
 ONE_SPACE = ' '
 INDENT = ONE_SPACE * LEN_INDENT
 
+# Baseline files with this suffix are in the structured (JSON Lines) format
+STRUCTURED_BASELINE_SUFFIX = '.jsonl'
+
+# Bump this when the layout of the structured baseline changes
+STRUCTURED_BASELINE_VERSION = 1
+
 
 def generateBaseline(
-        violationsAllFiles: dict[str, list[Violation]] | dict[str, list[str]],
+        violationsAllFiles: (
+            Mapping[str, list[Violation]]
+            | Mapping[str, list[str]]
+            | Iterable[tuple[str, list[Violation]]]
+        ),
         path: Path,
 ) -> None:
-    """Generate baseline file based of passed violations."""
+    """
+    Generate baseline file based of passed violations. They can also be a
+    stream of (file name, violations) pairs, which are written as they come.
+    A baseline file ending with ".jsonl" is written in the structured format
+    (see ``StructuredBaseline``), without the file hashes.
+    """
+    items: Iterable[tuple[str, list[Violation]] | tuple[str, list[str]]] = (
+        violationsAllFiles.items()
+        if isinstance(violationsAllFiles, Mapping)
+        else violationsAllFiles
+    )
+    if isStructuredBaseline(path):
+        StructuredBaseline().write(items, path)  # type: ignore[arg-type]
+        return
+
     with path.open('w', encoding='utf-8') as baseline:
-        for file, violations in violationsAllFiles.items():
+        for file, violations in items:
             if violations:
                 baseline.write(f'{file}\n')
                 for violation in violations:
@@ -31,20 +70,25 @@ def generateBaseline(
 
 
 def parseBaseline(path: Path) -> dict[str, list[str]]:
-    """Parse baseline file."""
+    """Parse baseline file (in either format)."""
+    if isStructuredBaseline(path):
+        return StructuredBaseline.load(path).toMessages()
+
+    parsed: dict[str, list[str]] = {}
     with path.open('r', encoding='utf-8') as baseline:
-        parsed: dict[str, list[str]] = {}
-        splittedFiles = [
-            list(group)
-            for key, group in groupby(
-                baseline.readlines(), lambda x: x == SEPARATOR
-            )
-            if not key
-        ]
-        for file in splittedFiles:
-            parsed[file[0].strip()] = [func.strip() for func in file[1:]]
+        # Stream the lines: the first line after each separator is the file
+        # name, and the following lines are its violations
+        violations: list[str] | None = None
+        for line in baseline:
+            if line == SEPARATOR:
+                violations = None
+            elif violations is None:
+                violations = []
+                parsed[line.strip()] = violations
+            else:
+                violations.append(line.strip())
 
-        return parsed
+    return parsed
 
 
 def updateBaselineWithUnfixedViolations(
@@ -97,14 +141,79 @@ def reEvaluateBaseline(
         file names, and the values (``list[Violation]``) are lists of
         violations (``Violation``) in each file
     """
-    baselineRegenerationNeeded: bool = False
+    evaluator = BaselineEvaluator(baseline)
+    remainingViolationsInAllFiles: dict[str, list[Violation]] = dict(
+        evaluator.evaluate(actualViolationsInAllFiles.items())
+    )
+    return (
+        evaluator.regenerationNeeded,
+        evaluator.unfixedBaselineViolationsInAllFiles,
+        remainingViolationsInAllFiles,
+    )
+
+
+class BaselineEvaluator:
+    """
+    Re-evaluate the baseline against a stream of actual violations, file by
+    file, so that the violations do not need to be collected first.
+
+    Parameters
+    ----------
+    baseline : dict[str, list[str]]
+        The baseline violations, parsed from the baseline file
+    """
+
+    def __init__(self, baseline: dict[str, list[str]]) -> None:
+        self.baseline: dict[str, list[str]] = baseline
+
+        # The baseline violations of each file as a multiset, so that each
+        # actual violation is looked up in O(1), and each baseline entry
+        # (even a duplicated message) matches at most one actual violation
+        self.baselineIndex: dict[str, Counter[str]] = {
+            file: Counter(violations) for file, violations in baseline.items()
+        }
+
+        # Whether the baseline file should be regenerated; only final after
+        # the stream passed to ``evaluate()`` is exhausted
+        self.regenerationNeeded: bool = False
+
+        # The unfixed baseline violations of the files seen so far
+        self.unfixedBaselineViolationsInAllFiles: dict[str, list[str]] = {}
 
-    unfixedBaselineViolationsInAllFiles: dict[str, list[str]] = {}
-    remainingViolationsInAllFiles: dict[str, list[Violation]] = {}
+        # The files whose baseline violations changed, with their unfixed
+        # baseline violations, and whether those are all the violations of
+        # the file (for ``StructuredBaseline.update()``)
+        self.affectedFiles: dict[str, tuple[list[Violation], bool]] = {}
 
-    for file, actualViolations in actualViolationsInAllFiles.items():
-        baselineViolations: list[str] = baseline.get(file, [])
+    def evaluate(
+            self,
+            actualViolationsInAllFiles: Iterable[tuple[str, list[Violation]]],
+            *,
+            profiler: Profiler | None = None,
+    ) -> Iterator[tuple[str, list[Violation]]]:
+        """
+        Yield the remaining violations (those not in the baseline) of each
+        file, as the actual violations of each file come in. With a
+        ``profiler``, the evaluation of each file is timed as the "baseline"
+        phase (excluding the time of checking the files in the stream).
+        """
+        for file, actualViolations in actualViolationsInAllFiles:
+            with (
+                contextlib.nullcontext()
+                if profiler is None
+                else profiler.profilePhase('baseline')
+            ):
+                remainingViolations = self._evaluateFile(
+                    file, actualViolations
+                )
 
+            yield file, remainingViolations
+
+    def _evaluateFile(
+            self,
+            file: str,
+            actualViolations: list[Violation],
+    ) -> list[Violation]:
         unfixedBaselineViolations: list[str]
         remainingViolations: list[Violation]
 
@@ -112,38 +221,394 @@ def reEvaluateBaseline(
             unfixedBaselineViolations,
             remainingViolations,
         ) = calcUnfixedBaselineViolationsAndRemainingViolations(
-            baselineViolations=baselineViolations,
+            baselineViolations=self.baselineIndex.get(file, Counter()),
             actualViolations=actualViolations,
         )
 
-        if unfixedBaselineViolations != baselineViolations:
-            baselineRegenerationNeeded = True
+        if unfixedBaselineViolations != self.baseline.get(file, []):
+            self.regenerationNeeded = True
+            remainingIds: set[int] = {id(_) for _ in remainingViolations}
+            self.affectedFiles[file] = (
+                [_ for _ in actualViolations if id(_) not in remainingIds],
+                not remainingViolations,
+            )
 
-        unfixedBaselineViolationsInAllFiles[file] = unfixedBaselineViolations
-        remainingViolationsInAllFiles[file] = remainingViolations
+        self.unfixedBaselineViolationsInAllFiles[file] = (
+            unfixedBaselineViolations
+        )
+        return remainingViolations
 
-    return (
-        baselineRegenerationNeeded,
-        unfixedBaselineViolationsInAllFiles,
-        remainingViolationsInAllFiles,
+
+def regenerateBaseline(
+        evaluator: BaselineEvaluator,
+        path: Path,
+        *,
+        structuredBaseline: StructuredBaseline | None = None,
+        cwd: str | None = None,
+) -> None:
+    """
+    Rewrite the baseline file without the baseline violations that were
+    fixed, after ``evaluator`` has evaluated all the files.
+
+    Parameters
+    ----------
+    evaluator : BaselineEvaluator
+        The evaluator of the baseline
+    path : Path
+        The baseline file
+    structuredBaseline : StructuredBaseline | None, default=None
+        The loaded baseline, if it is in the structured format (then only
+        the records of the affected files are rewritten)
+    cwd : str | None, default=None
+        The directory that the file names in the baseline are relative to
+        (the current working directory if None)
+
+    Returns
+    -------
+    None
+    """
+    if structuredBaseline is not None:
+        structuredBaseline.update(evaluator.affectedFiles, path, cwd=cwd)
+        return
+
+    updatedBaseline = updateBaselineWithUnfixedViolations(
+        baseline=evaluator.baseline,
+        unfixedBaselineViolations=evaluator.unfixedBaselineViolationsInAllFiles,
     )
+    generateBaseline(violationsAllFiles=updatedBaseline, path=path)
 
 
 def calcUnfixedBaselineViolationsAndRemainingViolations(
-        baselineViolations: list[str],
+        baselineViolations: list[str] | Counter[str],
         actualViolations: list[Violation],
 ) -> tuple[list[str], list[Violation]]:
     """
     Based on the baseline violations and the actual violations, calculate which
     baseline violations have not been fixed, and which violations are new (not
     part of the baseline) and need to be fixed.
+
+    Each baseline violation (a list of messages, or a multiset of them)
+    accounts for at most one actual violation, so if a message appears twice
+    in the baseline but three times in the actual violations, one of them is
+    new.
     """
+    baselineCounts: Counter[str] = (
+        baselineViolations
+        if isinstance(baselineViolations, Counter)
+        else Counter(baselineViolations)
+    )
+    matchedCounts: Counter[str] = Counter()
     unfixedBaselineViolations: list[str] = []
     remainingViolations: list[Violation] = []
     for viol in actualViolations:
-        if str(viol) in baselineViolations:
-            unfixedBaselineViolations.append(str(viol))
+        msg: str = str(viol)
+        if matchedCounts[msg] < baselineCounts[msg]:
+            matchedCounts[msg] += 1
+            unfixedBaselineViolations.append(msg)
         else:
             remainingViolations.append(viol)
 
     return unfixedBaselineViolations, remainingViolations
+
+
+def isStructuredBaseline(path: Path) -> bool:
+    """Whether the baseline file is in the structured (JSON Lines) format"""
+    return path.suffix == STRUCTURED_BASELINE_SUFFIX
+
+
+class StructuredBaseline:
+    """
+    A baseline in the structured (JSON Lines) format. The first line is a
+    header, and each of the other lines is the record of one file:
+
+    .. code-block:: json
+
+        {"file": "a.py", "hash": "...", "violations": [[1, 201, ...], ...]}
+
+    Unlike the text format, a record keeps the whole violations (not only
+    their messages), and a hash of the file's source bytes together with the
+    options that affect the check results (the same key as the result
+    cache). If a file still has this hash, it is unchanged since the record
+    was written, so its violations are served from the record (see
+    ``makeCache()``) without parsing the file.
+
+    The hash is only recorded if the record contains all the violations of
+    the file (for example, not when some violations were new).
+
+    Parameters
+    ----------
+    records : dict[str, dict[str, Any]] | None, default=None
+        The records, keyed by file name
+    lines : dict[str, str] | None, default=None
+        The original line of each record in the baseline file, so that the
+        unaffected records are written back verbatim
+    """
+
+    def __init__(
+            self,
+            records: dict[str, dict[str, Any]] | None = None,
+            lines: dict[str, str] | None = None,
+    ) -> None:
+        self.records: dict[str, dict[str, Any]] = records or {}
+        self.lines: dict[str, str] = lines or {}
+
+        # The fingerprint of the options (set by ``makeCache()``); the file
+        # hashes can only be computed (and used) once it's known
+        self.fingerprint: str | None = None
+
+    @classmethod
+    def load(cls, path: Path) -> StructuredBaseline:
+        """Load a structured baseline file, streaming its lines"""
+        records: dict[str, dict[str, Any]] = {}
+        lines: dict[str, str] = {}
+        with path.open('r', encoding='utf-8') as baseline:
+            header: dict[str, Any] = json.loads(baseline.readline() or '{}')
+            if header.get('version') != STRUCTURED_BASELINE_VERSION:
+                raise ValueError(
+                    f'{path} is not a structured baseline file of version'
+                    f' {STRUCTURED_BASELINE_VERSION}'
+                )
+
+            for line in baseline:
+                if line.strip() == '':
+                    continue
+
+                record: dict[str, Any] = json.loads(line)
+                records[record['file']] = record
+                lines[record['file']] = line.rstrip('\n')
+
+        return cls(records=records, lines=lines)
+
+    def toMessages(self) -> dict[str, list[str]]:
+        """
+        Get the violation messages of each file, in the same form as the
+        parsed text baseline (for ``BaselineEvaluator``)
+        """
+        return {
+            file: [
+                str(violationFromJson(_)).strip() for _ in record['violations']
+            ]
+            for file, record in self.records.items()
+        }
+
+    def makeCache(
+            self,
+            *,
+            options: dict[str, Any],
+            fallback: ResultCache | MemoryResultCache | None = None,
+    ) -> BaselineCache:
+        """
+        Make a cache (with the same interface as ``ResultCache``) that serves
+        the violations of the files that are unchanged since their records
+        were written, and otherwise falls back to ``fallback`` (if any).
+
+        Parameters
+        ----------
+        options : dict[str, Any]
+            The options that affect the check results
+        fallback : ResultCache | MemoryResultCache | None, default=None
+            The result cache for the other files
+
+        Returns
+        -------
+        BaselineCache
+            The cache
+        """
+        self.fingerprint = computeOptionsFingerprint(options)
+        return BaselineCache(
+            fingerprint=self.fingerprint,
+            violationsByHash={
+                record['hash']: record['violations']
+                for record in self.records.values()
+                if record.get('hash') is not None
+            },
+            fallback=fallback,
+        )
+
+    def computeHash(self, file: str, cwd: str | None = None) -> str | None:
+        """
+        Compute the hash of a file (None if the options or the file are
+        unknown). A relative ``file`` is resolved against ``cwd`` (if given).
+        """
+        if self.fingerprint is None:
+            return None
+
+        try:
+            source: bytes = Path(cwd or '', file).read_bytes()
+        except OSError:
+            return None
+
+        return computeCacheKey(self.fingerprint, source)
+
+    def write(
+            self,
+            violationsAllFiles: Iterable[tuple[str, list[Violation]]],
+            path: Path,
+    ) -> None:
+        """
+        Write the baseline file from a stream of (file name, violations)
+        pairs. The hash of each file is computed when its record is written.
+        """
+        with _openAtomically(path) as baseline:
+            baseline.write(self._headerLine() + '\n')
+            for file, violations in violationsAllFiles:
+                if violations:
+                    record = self._makeRecord(
+                        file, violations, hashIsValid=True
+                    )
+                    baseline.write(_dumpRecord(record) + '\n')
+
+    def update(
+            self,
+            affectedFiles: dict[str, tuple[list[Violation], bool]],
+            path: Path,
+            *,
+            cwd: str | None = None,
+    ) -> None:
+        """
+        Rewrite only the records of the affected files; the other records
+        are written back verbatim, in the same order.
+
+        Parameters
+        ----------
+        affectedFiles : dict[str, tuple[list[Violation], bool]]
+            The unfixed baseline violations of each affected file, and
+            whether they are all the violations of the file (only then is the
+            file hash recorded). Files without unfixed violations are
+            dropped from the baseline.
+        path : Path
+            The baseline file
+        cwd : str | None, default=None
+            The directory that the file names are relative to, for hashing
+            the files (the current working directory if None)
+
+        Returns
+        -------
+        None
+        """
+        with _openAtomically(path) as baseline:
+            baseline.write(self._headerLine() + '\n')
+            for file, line in self.lines.items():
+                if file not in affectedFiles:
+                    baseline.write(line + '\n')
+                    continue
+
+                violations, hashIsValid = affectedFiles[file]
+                if violations:
+                    record = self._makeRecord(
+                        file, violations, hashIsValid=hashIsValid, cwd=cwd
+                    )
+                    baseline.write(_dumpRecord(record) + '\n')
+
+    def _makeRecord(
+            self,
+            file: str,
+            violations: list[Violation],
+            *,
+            hashIsValid: bool,
+            cwd: str | None = None,
+    ) -> dict[str, Any]:
+        return {
+            'file': file,
+            'hash': self.computeHash(file, cwd) if hashIsValid else None,
+            'violations': [violationToJson(_) for _ in violations],
+        }
+
+    @staticmethod
+    def _headerLine() -> str:
+        return _dumpRecord({
+            'format': 'pydoclint-baseline',
+            'version': STRUCTURED_BASELINE_VERSION,
+        })
+
+
+class BaselineCache:
+    """
+    A cache (with the same interface as ``ResultCache``) of the violations
+    recorded in a structured baseline, keyed by the file hashes. Since the
+    keys are computed in the same way, the other files are looked up in the
+    fallback result cache with the same keys.
+
+    Parameters
+    ----------
+    fingerprint : str
+        The fingerprint of the options that affect the check results
+    violationsByHash : dict[str, list[list[Any]]]
+        The recorded violations (in JSON form), keyed by the file hashes
+    fallback : ResultCache | MemoryResultCache | None, default=None
+        The result cache for the other files
+    """
+
+    def __init__(
+            self,
+            fingerprint: str,
+            violationsByHash: dict[str, list[list[Any]]],
+            fallback: ResultCache | MemoryResultCache | None = None,
+    ) -> None:
+        self.fingerprint: str = fingerprint
+        self.violationsByHash: dict[str, list[list[Any]]] = violationsByHash
+        self.fallback: ResultCache | MemoryResultCache | None = fallback
+
+    def computeKey(self, source: bytes) -> str:
+        """Compute the hash of a file from its source bytes"""
+        return computeCacheKey(self.fingerprint, source)
+
+    def get(self, key: str) -> list[Violation] | None:
+        """Get the recorded (or cached) violations, or None"""
+        if key in self.violationsByHash:
+            return [violationFromJson(_) for _ in self.violationsByHash[key]]
+
+        return None if self.fallback is None else self.fallback.get(key)
+
+    def put(self, key: str, violations: list[Violation]) -> None:
+        """Store the violations of a file into the fallback cache (if any)"""
+        if self.fallback is not None:
+            self.fallback.put(key, violations)
+
+    def prune(self) -> None:
+        """Prune the fallback cache (if any)"""
+        if self.fallback is not None:
+            self.fallback.prune()
+
+
+def _dumpRecord(record: dict[str, Any]) -> str:
+    return json.dumps(record, ensure_ascii=False, separators=(',', ':'))
+
+
+@contextlib.contextmanager
+def _openAtomically(path: Path) -> Iterator[IO[str]]:
+    """
+    Open a temporary file (in the same folder) for writing, which then
+    atomically replaces ``path``, so that the baseline file is never left
+    half-written. The new file keeps the permissions of the file that it
+    replaces (or the default ones of a new file), instead of the private
+    ones of a temporary file
+    """
+    try:
+        mode: int = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        mode = _defaultFileMode()
+
+    with tempfile.NamedTemporaryFile(
+        'w',
+        encoding='utf-8',
+        dir=path.parent,
+        suffix='.tmp',
+        delete=False,
+    ) as fp:
+        try:
+            yield fp
+        except BaseException:
+            fp.close()
+            Path(fp.name).unlink(missing_ok=True)
+            raise
+
+    Path(fp.name).chmod(mode)
+    Path(fp.name).replace(path)
+
+
+def _defaultFileMode() -> int:
+    # ``os.umask()`` can only be read by setting it, so set it back at once
+    umask: int = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import contextlib
+import functools
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from pydoclint.utils.violation import Violation
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_MAX_SIZE_MB = 64
+DEFAULT_MEMORY_CACHE_MAX_ENTRIES = 4096
+
+# Bump this when the layout of the cache entries changes
+CACHE_FORMAT_VERSION = 2
+
+_BYTES_PER_MB = 1024 * 1024
+
+# A file in the cache folder that marks that entries were written since the
+# last pruning. Without it, pruning is skipped, so that a run with a warm
+# cache does not need to look at every entry.
+_PRUNE_MARKER = '.needs-pruning'
+
+
+class ResultCache:
+    """
+    An on-disk cache of the (post-noqa) violations of each checked file.
+
+    Each entry is keyed by a hash of the file's source bytes together with a
+    fingerprint of all the options that affect the check results (and of
+    pydoclint's own source code), so an unchanged file checked with unchanged
+    options can be served without being parsed again.
+
+    Parameters
+    ----------
+    cacheDir : Path | str
+        The directory where the cache entries are stored
+    options : dict[str, Any]
+        The options that affect the check results
+    maxSizeMb : int, default=DEFAULT_CACHE_MAX_SIZE_MB
+        The maximum total size (in MB) of the cache entries. The least
+        recently used entries are evicted when the cache grows beyond it.
+    """
+
+    def __init__(
+            self,
+            cacheDir: Path | str,
+            options: dict[str, Any],
+            maxSizeMb: int = DEFAULT_CACHE_MAX_SIZE_MB,
+    ) -> None:
+        self.cacheDir = Path(cacheDir)
+        self.maxSizeBytes: int = maxSizeMb * _BYTES_PER_MB
+        self.fingerprint: str = computeOptionsFingerprint(options)
+
+        # Whether this process has written the pruning marker. (In the
+        # --jobs mode, each worker process has its own copy of the cache.)
+        self._markedForPruning: bool = False
+
+    def computeKey(self, source: bytes) -> str:
+        """Compute the cache key of a file from its source bytes"""
+        return computeCacheKey(self.fingerprint, source)
+
+    def get(self, key: str) -> list[Violation] | None:
+        """Get the cached violations; return None if there is no entry"""
+        entryPath = self._entryPath(key)
+        try:
+            with entryPath.open(encoding='utf-8') as fp:
+                entry = json.load(fp)
+
+            violations = [violationFromJson(_) for _ in entry['violations']]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError, KeyError) as exc:
+            # Corrupted entries are treated as misses
+            logger.info('Ignoring unreadable cache entry %s: %s', key, exc)
+            return None
+
+        with contextlib.suppress(OSError):
+            os.utime(entryPath)  # mark as recently used for LRU eviction
+
+        return violations
+
+    def put(self, key: str, violations: list[Violation]) -> None:
+        """Store the violations of a file into the cache"""
+        entryPath = self._entryPath(key)
+        entry = {'violations': [violationToJson(_) for _ in violations]}
+        try:
+            self._ensureCacheDir()
+            self._writeEntry(entryPath, entry)
+            self._markForPruning()
+        except OSError as exc:  # a cache that cannot be written is not fatal
+            logger.info('Failed to write cache entry %s: %s', key, exc)
+
+    def prune(self) -> None:
+        """
+        Evict the least recently used entries beyond the size limit, if any
+        entries were written (by any process) since the last pruning
+        """
+        markerPath: Path = self.cacheDir / _PRUNE_MARKER
+        try:
+            markerPath.unlink()
+        except OSError:  # no marker (or no cache folder): nothing to prune
+            return
+
+        self._markedForPruning = False
+
+        entries: list[tuple[float, int, Path]] = []
+        totalSize: int = 0
+        for entryPath in self.cacheDir.glob('*/*.json'):
+            try:
+                stat = entryPath.stat()
+            except OSError:
+                continue
+
+            entries.append((stat.st_mtime, stat.st_size, entryPath))
+            totalSize += stat.st_size
+
+        if totalSize <= self.maxSizeBytes:
+            return
+
+        entries.sort()  # oldest first
+        for _, size, entryPath in entries:
+            if totalSize <= self.maxSizeBytes:
+                break
+
+            try:
+                entryPath.unlink()
+            except OSError:
+                continue
+
+            totalSize -= size
+
+    def _entryPath(self, key: str) -> Path:
+        return self.cacheDir / key[:2] / f'{key}.json'
+
+    @staticmethod
+    def _writeEntry(entryPath: Path, entry: dict[str, Any]) -> None:
+        entryPath.parent.mkdir(exist_ok=True)
+        # Write to a temporary file first, and then atomically move it into
+        # place, so that concurrent workers never see partial entries
+        with tempfile.NamedTemporaryFile(
+            'w',
+            encoding='utf-8',
+            dir=entryPath.parent,
+            suffix='.tmp',
+            delete=False,
+        ) as fp:
+            json.dump(entry, fp)
+
+        Path(fp.name).replace(entryPath)
+
+    def _markForPruning(self) -> None:
+        if not self._markedForPruning:
+            (self.cacheDir / _PRUNE_MARKER).touch()
+            self._markedForPruning = True
+
+    def _ensureCacheDir(self) -> None:
+        if self.cacheDir.is_dir():
+            return
+
+        self.cacheDir.mkdir(parents=True, exist_ok=True)
+        # Keep the cache out of version control, similar to pytest's cache
+        (self.cacheDir / '.gitignore').write_text(
+            '# Created by pydoclint automatically.\n*\n', encoding='utf-8'
+        )
+
+
+class MemoryResultCache:
+    """
+    An in-memory LRU cache of the violations of each checked file, for
+    long-running processes (such as the daemon). It has the same interface
+    as ``ResultCache``.
+
+    Parameters
+    ----------
+    options : dict[str, Any]
+        The options that affect the check results
+    maxEntries : int, default=DEFAULT_MEMORY_CACHE_MAX_ENTRIES
+        The maximum number of files whose violations are kept
+    """
+
+    def __init__(
+            self,
+            options: dict[str, Any],
+            maxEntries: int = DEFAULT_MEMORY_CACHE_MAX_ENTRIES,
+    ) -> None:
+        self.maxEntries: int = maxEntries
+        self.fingerprint: str = computeOptionsFingerprint(options)
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: OrderedDict[str, list[Violation]] = OrderedDict()
+
+    def computeKey(self, source: bytes) -> str:
+        """Compute the cache key of a file from its source bytes"""
+        return computeCacheKey(self.fingerprint, source)
+
+    def get(self, key: str) -> list[Violation] | None:
+        """Get the cached violations; return None if there is no entry"""
+        violations: list[Violation] | None = self._entries.get(key)
+        if violations is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)  # mark as recently used
+        return list(violations)
+
+    def put(self, key: str, violations: list[Violation]) -> None:
+        """Store the violations of a file into the cache"""
+        self._entries[key] = list(violations)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxEntries:
+            self._entries.popitem(last=False)  # the least recently used
+
+    def prune(self) -> None:
+        """Do nothing: the size limit is already enforced in ``put()``"""
+
+
+def computeOptionsFingerprint(options: dict[str, Any]) -> str:
+    """
+    Compute a fingerprint of the options that affect the check results. The
+    pydoclint version and a hash of pydoclint's source files are also part of
+    it, because changed checker code (even without a version bump, such as in
+    an editable install) may report different violations for the same file.
+    """
+    # Imported here, because looking up the version is slow, and it is only
+    # needed when the cache is in use
+    from pydoclint import __version__  # noqa: PLC0415
+
+    payload = json.dumps(
+        {
+            'cacheFormatVersion': CACHE_FORMAT_VERSION,
+            'pydoclintVersion': __version__,
+            'pydoclintSource': computeSourceFingerprint(),
+            'options': options,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def computeSourceFingerprint() -> str:
+    """Compute a hash of the source files of the pydoclint package"""
+    packageDir: Path = Path(__file__).parent
+    hasher = hashlib.sha256()
+    for path in sorted(packageDir.rglob('*.py')):
+        hasher.update(path.relative_to(packageDir).as_posix().encode('utf-8'))
+        hasher.update(b'\0')
+        hasher.update(path.read_bytes())
+
+    return hasher.hexdigest()
+
+
+def computeCacheKey(fingerprint: str, source: bytes) -> str:
+    """Compute the key of a file from the options fingerprint and its bytes"""
+    hasher = hashlib.sha256(fingerprint.encode('utf-8'))
+    hasher.update(source)
+    return hasher.hexdigest()
+
+
+def violationToJson(violation: Violation) -> list[Any]:
+    """Convert a violation into a JSON-serializable list"""
+    return [
+        violation.line,
+        violation.code,
+        violation.msgPrefix,
+        violation.msgPostfix,
+        violation.moreMsg,
+    ]
+
+
+def violationFromJson(data: list[Any]) -> Violation:
+    """Convert a list from ``violationToJson()`` back into a violation"""
+    line, code, msgPrefix, msgPostfix, moreMsg = data
+    return Violation(
+        line=line,
+        code=code,
+        msgPrefix=msgPrefix,
+        msgPostfix=msgPostfix,
+        moreMsg=moreMsg,
+    )
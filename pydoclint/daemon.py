@@ -0,0 +1,330 @@
+"""
+A long-running daemon (``pydoclint --daemon``) that answers check requests
+over a Unix domain socket.
+
+The daemon pays the start-up costs (Python start-up, importing the parsers,
+and parsing the config) only once. Between requests, it keeps the warm
+caches: the docstring parsing cache, and an in-memory cache of the results
+of each file. The client side is ``pydoclint.daemon_client``.
+"""
+
+from __future__ import annotations
+
+import base64
+import contextlib
+import json
+import logging
+import socket
+import socketserver
+from collections import deque
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pydoclint.baseline import (
+    BaselineEvaluator,
+    StructuredBaseline,
+    isStructuredBaseline,
+    parseBaseline,
+    regenerateBaseline,
+)
+from pydoclint.cache import DEFAULT_MEMORY_CACHE_MAX_ENTRIES, MemoryResultCache
+from pydoclint.daemon_client import DaemonError, sendDaemonRequest
+from pydoclint.main import _iterCheckPaths
+from pydoclint.utils.profiling import Profiler, writeChromeTrace
+
+if TYPE_CHECKING:
+    from pydoclint.utils.violation import Violation
+
+logger = logging.getLogger(__name__)
+
+# The most recent spans that the daemon keeps for the trace file
+MAX_TRACE_EVENTS = 200_000
+
+
+class DaemonState:
+    """
+    The state that the daemon keeps between requests.
+
+    Parameters
+    ----------
+    checkPathsOptions : dict[str, Any]
+        The options (from the command line and the config file) to check
+        files with; they are keyword arguments of ``_checkPaths()``
+    memoryCacheMaxEntries : int, default=DEFAULT_MEMORY_CACHE_MAX_ENTRIES
+        The maximum number of files whose results are kept in memory
+    traceFile : str | None, default=None
+        If not None, the timeline of the requests (with the spans of the
+        files and the phases of checking them) is written to this file in
+        the Chrome trace event format after each request. Only the most
+        recent ``MAX_TRACE_EVENTS`` spans are kept.
+    baseline : str | None, default=None
+        The baseline file. If not None, the violations in it are not
+        reported, like in ``pydoclint --baseline``. The file is read again
+        whenever it changes.
+    autoRegenerateBaseline : bool, default=True
+        Whether to regenerate the baseline file when some of its violations
+        were fixed (like ``--auto-regenerate-baseline``)
+    """
+
+    def __init__(
+            self,
+            checkPathsOptions: dict[str, Any],
+            memoryCacheMaxEntries: int = DEFAULT_MEMORY_CACHE_MAX_ENTRIES,
+            traceFile: str | None = None,
+            baseline: str | None = None,
+            autoRegenerateBaseline: bool = True,  # noqa: FBT001, FBT002
+    ) -> None:
+        self.checkPathsOptions: dict[str, Any] = checkPathsOptions
+        self.resultCache = MemoryResultCache(
+            options=checkPathsOptions,
+            maxEntries=memoryCacheMaxEntries,
+        )
+        self.shouldStop: bool = False
+
+        # The files of the daemon are resolved at start-up, because the
+        # paths in the requests are relative to the clients' directories
+        self.traceFile: Path | None = None
+        if traceFile is not None:
+            self.traceFile = Path(traceFile).absolute()
+
+        self.baseline: Path | None = None
+        if baseline is not None:
+            self.baseline = Path(baseline).absolute()
+
+        self.autoRegenerateBaseline: bool = autoRegenerateBaseline
+
+        # The loaded baseline, and the state of the file when it was loaded
+        self._baselineStamp: tuple[int, int, int] | None = None
+        self._baselineMessages: dict[str, list[str]] = {}
+        self._structuredBaseline: StructuredBaseline | None = None
+
+        self.profiler: Profiler | None = (
+            None if traceFile is None else Profiler(recordTrace=True)
+        )
+        self.traceEvents: deque[dict[str, Any]] = deque(
+            maxlen=MAX_TRACE_EVENTS
+        )
+
+    def handleRequest(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Handle one request, and return the response"""
+        command = request.get('command', 'check')
+        if command == 'ping':
+            return {'ok': True}
+
+        if command == 'shutdown':
+            self.shouldStop = True
+            return {'ok': True}
+
+        if command == 'check':
+            return self._check(request)
+
+        return {'ok': False, 'error': f'Unknown command: {command!r}'}
+
+    def _check(self, request: dict[str, Any]) -> dict[str, Any]:
+        # The paths (and the exclude pattern) are relative to the client's
+        # working directory. The buffers are base64-encoded bytes, so that
+        # their encoding is detected (such as from a PEP 263 cookie) in the
+        # same way as that of the files.
+        cwd: str = request.get('cwd') or str(Path.cwd())
+        paths: list[str] = request.get('paths', [])
+        try:
+            buffers: dict[str, bytes] = {
+                name: base64.b64decode(source, validate=True)
+                for name, source in request.get('buffers', {}).items()
+            }
+        except ValueError as exc:
+            return {'ok': False, 'error': f'Invalid buffer: {exc}'}
+
+        missingPaths = [
+            _ for _ in paths if _ not in buffers and not Path(cwd, _).exists()
+        ]
+        if missingPaths:
+            return {
+                'ok': False,
+                'error': f'These paths do not exist: {missingPaths}',
+            }
+
+        try:
+            with (
+                contextlib.nullcontext()
+                if self.profiler is None
+                else self.profiler.profilePhase('request')
+            ):
+                violationsInAllFiles, baselineStatus = self._checkPaths(
+                    paths, buffers=buffers, cwd=cwd
+                )
+        except Exception as exc:  # keep the daemon alive for later requests
+            logger.exception('Failed to handle the request')
+            return {'ok': False, 'error': f'{type(exc).__name__}: {exc}'}
+        finally:
+            self._writeTrace()
+
+        return {
+            'ok': True,
+            'violations': {
+                filename: [
+                    [_.line, _.fullErrorCode, _.msg] for _ in violations
+                ]
+                for filename, violations in violationsInAllFiles.items()
+            },
+            'baseline': baselineStatus,
+        }
+
+    def _checkPaths(
+            self,
+            paths: list[str],
+            *,
+            buffers: dict[str, bytes],
+            cwd: str,
+    ) -> tuple[dict[str, list[Violation]], str | None]:
+        # The violations of each file (without those in the baseline), and
+        # what happened to the baseline: None if nothing needs to be done,
+        # "regenerated", or "outdated" (it should be regenerated)
+        structuredBaseline: StructuredBaseline | None = None
+        if self.baseline is not None:
+            structuredBaseline = self._loadBaseline(self.baseline)
+
+        violationsInAllFiles = _iterCheckPaths(
+            tuple(paths),
+            quiet=True,
+            sources=buffers,
+            resultCache=self.resultCache,
+            structuredBaseline=structuredBaseline,
+            profiler=self.profiler,
+            cwd=cwd,
+            **self.checkPathsOptions,
+        )
+        if self.baseline is None:
+            return dict(violationsInAllFiles), None
+
+        evaluator = BaselineEvaluator(self._baselineMessages)
+        remainingViolations = dict(
+            evaluator.evaluate(violationsInAllFiles, profiler=self.profiler)
+        )
+        if not evaluator.regenerationNeeded:
+            return remainingViolations, None
+
+        if not self.autoRegenerateBaseline:
+            return remainingViolations, 'outdated'
+
+        regenerateBaseline(
+            evaluator,
+            self.baseline,
+            structuredBaseline=structuredBaseline,
+            cwd=cwd,
+        )
+        return remainingViolations, 'regenerated'
+
+    def _loadBaseline(self, baseline: Path) -> StructuredBaseline | None:
+        # Load the baseline file again only if it changed since it was last
+        # loaded (such as when it was regenerated)
+        stat = baseline.stat()
+        stamp = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if stamp != self._baselineStamp:
+            self._structuredBaseline = None
+            if isStructuredBaseline(baseline):
+                self._structuredBaseline = StructuredBaseline.load(baseline)
+                self._baselineMessages = self._structuredBaseline.toMessages()
+            else:
+                self._baselineMessages = parseBaseline(baseline)
+
+            self._baselineStamp = stamp
+
+        return self._structuredBaseline
+
+    def _writeTrace(self) -> None:
+        if self.profiler is None or self.traceFile is None:
+            return
+
+        # Only the spans are kept; the other profiling data would grow
+        # with every request
+        self.traceEvents.extend(self.profiler.drain()['traceEvents'])
+        try:
+            writeChromeTrace(self.traceEvents, self.traceFile)
+        except OSError:  # a trace that cannot be written is not fatal
+            logger.exception('Failed to write the trace file')
+
+
+def serveDaemon(
+        socketPath: str,
+        checkPathsOptions: dict[str, Any],
+        traceFile: str | None = None,
+        baseline: str | None = None,
+        autoRegenerateBaseline: bool = True,  # noqa: FBT001, FBT002
+) -> None:
+    """
+    Listen on the Unix domain socket and answer the requests, until a
+    "shutdown" request arrives.
+
+    Parameters
+    ----------
+    socketPath : str
+        The path of the Unix domain socket to listen on. Only the owner can
+        connect to it.
+    checkPathsOptions : dict[str, Any]
+        The options to check files with (see ``DaemonState``)
+    traceFile : str | None, default=None
+        The file to write the timeline of the requests to (see
+        ``DaemonState``)
+    baseline : str | None, default=None
+        The baseline file (see ``DaemonState``)
+    autoRegenerateBaseline : bool, default=True
+        Whether to regenerate the baseline file (see ``DaemonState``)
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    DaemonError
+        If Unix domain sockets are not supported, or another daemon is
+        already listening on ``socketPath``
+    """
+    if not hasattr(socket, 'AF_UNIX'):
+        raise DaemonError('Unix domain sockets are not supported here')
+
+    socketPath = str(Path(socketPath).absolute())
+    if Path(socketPath).exists():
+        try:
+            sendDaemonRequest(socketPath, {'command': 'ping'}, timeout=1.0)
+        except DaemonError:
+            Path(socketPath).unlink()  # left behind by a daemon that crashed
+        else:
+            raise DaemonError(
+                f'A pydoclint daemon is already listening on "{socketPath}"'
+            )
+
+    state = DaemonState(
+        checkPathsOptions,
+        traceFile=traceFile,
+        baseline=baseline,
+        autoRegenerateBaseline=autoRegenerateBaseline,
+    )
+
+    class RequestHandler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            try:
+                request = json.loads(self.rfile.readline())
+            except ValueError as exc:
+                response = {'ok': False, 'error': f'Invalid request: {exc}'}
+            else:
+                response = state.handleRequest(request)
+
+            self.wfile.write(json.dumps(response).encode('utf-8') + b'\n')
+
+    # Requests are handled one at a time, so that they can share the
+    # (non-thread-safe) caches
+    with socketserver.UnixStreamServer(
+        socketPath, RequestHandler, bind_and_activate=False
+    ) as server:
+        server.server_bind()
+        try:
+            # Other users could read the checked files through the daemon,
+            # so the socket is made private before it starts listening
+            Path(socketPath).chmod(0o600)
+            server.server_activate()
+            while not state.shouldStop:
+                server.handle_request()
+        finally:
+            Path(socketPath).unlink()
@@ -0,0 +1,267 @@
+"""
+A thin client of the pydoclint daemon (``pydoclint --daemon``).
+
+This module deliberately imports only the standard library (and nothing else
+from pydoclint), so that each invocation stays fast: the heavy lifting
+(importing the docstring parsers, parsing the config, and checking the
+files) is done once by the long-running daemon.
+
+The protocol is one JSON object per line: the client sends one request, and
+the daemon sends back one response before closing the connection.
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+import socket
+import sys
+from pathlib import Path
+from typing import Any
+
+DEFAULT_DAEMON_SOCKET = '.pydoclint_daemon.sock'
+DEFAULT_CLIENT_TIMEOUT_SECONDS = 600.0
+
+_RECEIVE_BUFFER_SIZE = 65536
+
+_ANSI_RED_BOLD = '\033[1;31m'
+_ANSI_GREEN_BOLD = '\033[1;32m'
+_ANSI_YELLOW_BOLD = '\033[1;33m'
+_ANSI_RESET = '\033[0m'
+
+
+class DaemonError(Exception):
+    """The daemon cannot be reached, or it could not handle the request"""
+
+
+def sendDaemonRequest(
+        socketPath: str,
+        request: dict[str, Any],
+        timeout: float = DEFAULT_CLIENT_TIMEOUT_SECONDS,
+) -> dict[str, Any]:
+    """
+    Send a request to the daemon and return its response.
+
+    Parameters
+    ----------
+    socketPath : str
+        The path of the Unix domain socket that the daemon listens on
+    request : dict[str, Any]
+        The request, such as ``{"command": "check", "paths": [...]}``
+    timeout : float, default=DEFAULT_CLIENT_TIMEOUT_SECONDS
+        The timeout (in seconds) of the socket operations
+
+    Returns
+    -------
+    dict[str, Any]
+        The response of the daemon
+
+    Raises
+    ------
+    DaemonError
+        If the daemon cannot be reached or its response is invalid
+    """
+    if not hasattr(socket, 'AF_UNIX'):
+        raise DaemonError('Unix domain sockets are not supported here')
+
+    try:
+        data: bytes = _exchange(
+            socketPath,
+            json.dumps(request).encode('utf-8') + b'\n',
+            timeout=timeout,
+        )
+    except OSError as exc:
+        raise DaemonError(
+            f'Cannot talk to the pydoclint daemon at "{socketPath}": {exc}.'
+            ' Please start it with `pydoclint --daemon`.'
+        ) from exc
+
+    try:
+        response: dict[str, Any] = json.loads(data)
+    except ValueError as exc:
+        raise DaemonError(f'Invalid response from the daemon: {exc}') from exc
+
+    return response
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point of the pydoclint daemon client"""
+    parser = argparse.ArgumentParser(
+        prog='pydoclint-client',
+        description=(
+            'Check Python files with a running pydoclint daemon (started by'
+            ' `pydoclint --daemon`), using the config that the daemon loaded'
+        ),
+    )
+    parser.add_argument('paths', nargs='*', help='Files or folders to check')
+    parser.add_argument(
+        '--daemon-socket',
+        default=DEFAULT_DAEMON_SOCKET,
+        help='The Unix domain socket that the daemon listens on',
+    )
+    parser.add_argument(
+        '--stdin-filename',
+        default=None,
+        help=(
+            'Read the source code from stdin (such as an unsaved editor'
+            ' buffer), and report it under this file name'
+        ),
+    )
+    parser.add_argument(
+        '-q',
+        '--quiet',
+        action='store_true',
+        help='If set, do not print the success message',
+    )
+    parser.add_argument(
+        '--show-filenames-in-every-violation-message',
+        action='store_true',
+        help='If set, show the file name in every violation message',
+    )
+    parser.add_argument(
+        '--shutdown',
+        action='store_true',
+        help='Ask the daemon to shut down',
+    )
+    args = parser.parse_args(argv)
+
+    request: dict[str, Any]
+    if args.shutdown:
+        request = {'command': 'shutdown'}
+    else:
+        # The buffers are sent as (base64-encoded) bytes, so that the daemon
+        # decodes them like files, honoring any PEP 263 encoding cookie
+        buffers: dict[str, str] = {}
+        paths: list[str] = list(args.paths)
+        if args.stdin_filename is not None:
+            buffers[args.stdin_filename] = base64.b64encode(
+                sys.stdin.buffer.read()
+            ).decode('ascii')
+            paths.append(args.stdin_filename)
+
+        if len(paths) == 0:
+            parser.error('You did not specify a path to run pydoclint on.')
+
+        request = {
+            'command': 'check',
+            'cwd': str(Path.cwd()),
+            'paths': paths,
+            'buffers': buffers,
+        }
+
+    try:
+        response = sendDaemonRequest(args.daemon_socket, request)
+    except DaemonError as exc:
+        _echo(_style(str(exc), _ANSI_RED_BOLD))
+        return 2
+
+    if not response.get('ok'):
+        _echo(_style(str(response.get('error')), _ANSI_RED_BOLD))
+        return 2
+
+    if args.shutdown:
+        return 0
+
+    violationCounter: int = _printViolations(
+        response['violations'],
+        showFilenames=args.show_filenames_in_every_violation_message,
+    )
+
+    # The same messages as those of ``pydoclint --baseline``
+    if response.get('baseline') == 'regenerated':
+        _echo(
+            _style(
+                'Some old violations were fixed, and'
+                ' the baseline file was successfully re-generated',
+                _ANSI_GREEN_BOLD,
+            )
+        )
+    elif response.get('baseline') == 'outdated':
+        _echo(
+            _style(
+                'Some old violations were fixed. Please regenerate'
+                ' your baseline file after fixing new problems.\n'
+                'Use `--generate-baseline=True`. Or you can use'
+                ' `--auto-regenerate-baseline=True` to do this'
+                ' automatically in the future.',
+                _ANSI_RED_BOLD,
+            )
+        )
+
+    if violationCounter > 0:
+        return 1
+
+    if not args.quiet:
+        _echo(_style('🎉 No violations 🎉', _ANSI_GREEN_BOLD))
+
+    return 0
+
+
+def _printViolations(
+        violationsInAllFiles: dict[str, list[list[Any]]],
+        *,
+        showFilenames: bool,
+) -> int:
+    # The same format as the output of ``pydoclint.main.main()``. Returns
+    # the number of violations.
+    violationCounter: int = 0
+    for counter, (filename, violationsInThisFile) in enumerate(
+        violationsInAllFiles.items(),
+        start=1,
+    ):
+        if len(violationsInThisFile) == 0:
+            continue
+
+        if counter > 1:
+            _echo('')
+
+        if not showFilenames:
+            _echo(_style(filename, _ANSI_YELLOW_BOLD))
+
+        for line, fullErrorCode, msg in violationsInThisFile:
+            violationCounter += 1
+            prefix: str = (
+                f'{_style(filename, _ANSI_YELLOW_BOLD)}:'
+                if showFilenames
+                else '    '
+            )
+            _echo(
+                f'{prefix}{line}: {_style(fullErrorCode, _ANSI_RED_BOLD)}:'
+                f' {msg}'
+            )
+
+    return violationCounter
+
+
+def _exchange(socketPath: str, payload: bytes, *, timeout: float) -> bytes:
+    # Send the payload, and read until the daemon closes its side of the
+    # connection
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(socketPath)
+        sock.sendall(payload)
+        sock.shutdown(socket.SHUT_WR)
+        chunks: list[bytes] = []
+        while True:
+            chunk: bytes = sock.recv(_RECEIVE_BUFFER_SIZE)
+            if not chunk:
+                return b''.join(chunks)
+
+            chunks.append(chunk)
+
+
+def _style(text: str, ansiCode: str) -> str:
+    if not sys.stderr.isatty():
+        return text
+
+    return f'{ansiCode}{text}{_ANSI_RESET}'
+
+
+def _echo(text: str) -> None:
+    # Like ``pydoclint.main``, all output goes to stderr
+    print(text, file=sys.stderr)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -330,6 +330,18 @@ class Plugin:
                 'to numpy style for now.)'
             ),
         )
+        parser.add_option(
+            '--parser',
+            action='store',
+            default='compat',
+            parse_from_config=True,
+            help=(
+                'Which docstring parser to use: "compat" (docstring_parser) or'
+                ' "fast" (an experimental built-in scanner that only extracts'
+                ' what pydoclint checks, and falls back to docstring_parser'
+                ' for the docstrings that it cannot scan exactly).'
+            ),
+        )
 
     @classmethod
     def parse_options(cls, options: Any) -> None:  # noqa: D102
@@ -381,6 +393,7 @@ class Plugin:
         cls.check_style_mismatch = options.check_style_mismatch
         cls.check_arg_defaults = options.check_arg_defaults
         cls.style = options.style
+        cls.parser = options.parser
 
     def run(self) -> Generator[tuple[int, int, str, Any], None, None]:
         """Run the linter and yield the violation information"""
@@ -496,6 +509,11 @@ class Plugin:
                 ' or "sphinx"'
             )
 
+        if self.parser not in {'fast', 'compat'}:
+            raise ValueError(
+                'Invalid value for "--parser": must be "fast" or "compat"'
+            )
+
         v = Visitor(
             argTypeHintsInSignature=argTypeHintsInSignature,
             argTypeHintsInDocstring=argTypeHintsInDocstring,
@@ -530,6 +548,7 @@ class Plugin:
             checkStyleMismatch=checkStyleMismatch,
             checkArgDefaults=checkArgDefaults,
             style=self.style,
+            parser=self.parser,
         )
         v.visit(self._tree)
         violationInfo = [_.getInfoForFlake8() for _ in v.violations]
@@ -1,30 +1,58 @@
 from __future__ import annotations
 
 import ast
+import contextlib
+import io
+import itertools
 import logging
+import os
 import re
+from collections import deque
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, TextIO
 
 import click
 
-from pydoclint import __version__
-from pydoclint.baseline import (
-    generateBaseline,
-    parseBaseline,
-    reEvaluateBaseline,
-    updateBaselineWithUnfixedViolations,
+from pydoclint.cache import (
+    DEFAULT_CACHE_MAX_SIZE_MB,
+    MemoryResultCache,
+    ResultCache,
 )
+from pydoclint.daemon_client import DEFAULT_DAEMON_SOCKET
 from pydoclint.parse_config import (
     injectDefaultOptionsFromUserSpecifiedTomlFilePath,
 )
+from pydoclint.utils import profiling
+from pydoclint.utils.diff import parseUnifiedDiff, resolveDiffPaths
+from pydoclint.utils.file_discovery import iterPythonFiles
 from pydoclint.utils.invisible_chars import replaceInvisibleChars
 from pydoclint.utils.noqa import (
     codeIsSuppressed,
     collectNativeNoqaSuppression,
     collectNoqaCodesByLine,
 )
+from pydoclint.utils.rule_selection import (
+    compileRuleSelection,
+    parseCodePrefixes,
+)
 from pydoclint.utils.violation import Violation
-from pydoclint.visitor import Visitor
+
+if TYPE_CHECKING:
+    import mmap
+    from collections.abc import Callable, Iterable, Iterator
+    from concurrent.futures import Future
+
+    from pydoclint.baseline import (
+        BaselineCache,
+        BaselineEvaluator,
+        StructuredBaseline,
+    )
+    from pydoclint.utils.profiling import Profiler
+
+# To keep the start-up fast (such as for `--help` and `--version`, or when
+# every path is excluded), the heavier modules, such as the visitor (with the
+# docstring parsers), the baseline, and the process pool, are imported only
+# where they are needed.
 
 # Due to a potential bug in Windows + pre-commit, non-ASCII
 # characters cannot be rendered correctly as stdout in the terminal.
@@ -32,6 +60,14 @@ from pydoclint.visitor import Visitor
 # (More details in https://github.com/jsh9/pydoclint/issues/20)
 echoAsError = True
 
+# The maximum number of files per task of a worker process (with `--jobs`);
+# smaller tasks let the first results stream out sooner
+MAX_PARALLEL_CHUNK_SIZE = 16
+
+# Source files at least this large are memory-mapped instead of being read
+# into memory
+MMAP_SIZE_THRESHOLD = 1024 * 1024
+
 
 def validateStyleValue(
         context: click.Context,  # noqa: ARG001
@@ -62,6 +98,44 @@ def validateNativeModeNoqaLocation(
     return value
 
 
+def validateJobsValue(
+        context: click.Context,  # noqa: ARG001
+        param: click.Parameter,  # noqa: ARG001
+        value: str | int,
+) -> int:
+    """Validate the value of the 'jobs' option and resolve it to an int"""
+    if str(value).strip().lower() == 'auto':
+        return os.cpu_count() or 1
+
+    try:
+        jobs = int(value)
+    except ValueError as exc:
+        raise click.BadParameter(
+            '"--jobs" must be a positive integer or "auto"'
+        ) from exc
+
+    if jobs < 1:
+        raise click.BadParameter(
+            '"--jobs" must be a positive integer or "auto"'
+        )
+
+    return jobs
+
+
+def validateCodePrefixes(
+        context: click.Context,  # noqa: ARG001
+        param: click.Parameter,
+        value: str,
+) -> str:
+    """Validate the violation code prefixes of '--select' or '--ignore'"""
+    try:
+        prefixes: tuple[str, ...] = parseCodePrefixes(value)
+    except ValueError as exc:
+        raise click.BadParameter(f'"--{param.name}": {exc}') from exc
+
+    return ','.join(prefixes)
+
+
 @click.command(
     context_settings={'help_option_names': ['-h', '--help']},
     help='Pydoclint, a linter for Python docstring styles',
@@ -84,6 +158,17 @@ def validateNativeModeNoqaLocation(
         ' command line.'
     ),
 )
+@click.option(
+    '--respect-gitignore',
+    type=bool,
+    show_default=True,
+    default=False,
+    help=(
+        'If True, skip the files and folders ignored by the .gitignore files'
+        ' and by .git/info/exclude (the files given on the command line are'
+        ' always checked).'
+    ),
+)
 @click.option(
     '--style',
     type=str,
@@ -372,6 +457,30 @@ def validateNativeModeNoqaLocation(
         'to numpy style for now.)'
     ),
 )
+@click.option(
+    '--select',
+    type=str,
+    show_default=True,
+    default='',
+    callback=validateCodePrefixes,
+    help=(
+        'Comma-separated violation code prefixes (such as "DOC1,DOC501") to'
+        ' report; all codes are reported if empty. The checks none of whose'
+        ' codes can be reported are skipped entirely.'
+    ),
+)
+@click.option(
+    '--ignore',
+    type=str,
+    show_default=True,
+    default='',
+    callback=validateCodePrefixes,
+    help=(
+        'Comma-separated violation code prefixes (such as "DOC6,DOC003") not'
+        ' to report. A code matched by both --select and --ignore is'
+        ' reported only if its --select prefix is longer.'
+    ),
+)
 @click.option(
     '--baseline',
     type=click.Path(
@@ -430,6 +539,120 @@ def validateNativeModeNoqaLocation(
         ' or "docstring" for the line containing the closing docstring.'
     ),
 )
+@click.option(
+    '--parser',
+    type=click.Choice(['fast', 'compat']),
+    show_default=True,
+    default='compat',
+    help=(
+        'Which docstring parser to use: "compat" (docstring_parser) or "fast"'
+        ' (an experimental built-in scanner that only extracts what pydoclint'
+        ' checks, and falls back to docstring_parser for the docstrings that'
+        ' it cannot scan exactly). Both produce the same violations.'
+    ),
+)
+@click.option(
+    '-j',
+    '--jobs',
+    type=str,
+    show_default=True,
+    default='1',
+    callback=validateJobsValue,
+    help=(
+        'Number of worker processes used to check files in parallel.'
+        ' Use "auto" to use as many workers as there are CPUs.'
+    ),
+)
+@click.option(
+    '--cache-dir',
+    type=click.Path(file_okay=False, dir_okay=True, writable=True),
+    default=None,
+    help=(
+        'The folder where the check results of each file are cached, so'
+        ' that unchanged files are not checked again in subsequent runs.'
+        ' If not specified, the results are not cached.'
+    ),
+)
+@click.option(
+    '--no-cache',
+    is_flag=True,
+    default=False,
+    help=(
+        'If True, neither read from nor write to the result cache, even if'
+        ' --cache-dir is specified (such as in the config file).'
+    ),
+)
+@click.option(
+    '--cache-max-size',
+    type=click.IntRange(min=1),
+    show_default=True,
+    default=DEFAULT_CACHE_MAX_SIZE_MB,
+    help=(
+        'The maximum size (in MB) of the result cache. The least recently'
+        ' used entries are evicted when the cache grows beyond this size.'
+    ),
+)
+@click.option(
+    '--diff-only',
+    type=click.File('r', encoding='utf-8'),
+    default=None,
+    help=(
+        'A unified diff file (such as the output of `git diff`), or "-" to'
+        ' read the diff from stdin. If specified, only the functions and'
+        ' classes that overlap with the changed lines are checked. The file'
+        ' paths in the diff are relative to the current working directory.'
+    ),
+)
+@click.option(
+    '--daemon',
+    is_flag=True,
+    default=False,
+    help=(
+        'If set, start a long-running daemon instead of checking any files.'
+        ' The daemon listens on a Unix domain socket (see --daemon-socket)'
+        ' and answers the check requests from `pydoclint-client`, keeping'
+        ' the config and the caches warm between requests.'
+    ),
+)
+@click.option(
+    '--daemon-socket',
+    type=click.Path(dir_okay=False, path_type=str),
+    default=DEFAULT_DAEMON_SOCKET,
+    show_default=True,
+    help='The Unix domain socket that the daemon listens on',
+)
+@click.option(
+    '--profile',
+    is_flag=True,
+    default=False,
+    help=(
+        'If set, time the phases of checking each file (such as reading,'
+        ' parsing, visiting, docstring parsing, type hint comparison, and'
+        ' noqa filtering), and print the total time of each phase and the'
+        ' slowest files and definitions at the end.'
+    ),
+)
+@click.option(
+    '--profile-json',
+    type=click.Path(dir_okay=False, writable=True, path_type=str),
+    default=None,
+    help=(
+        'If specified, profile the run (like --profile) and also write the'
+        ' raw per-file, per-phase timings to this JSON file.'
+    ),
+)
+@click.option(
+    '--trace-file',
+    type=click.Path(dir_okay=False, writable=True, path_type=str),
+    default=None,
+    help=(
+        'If specified, write a timeline of the run (the file discovery, each'
+        ' file, and each phase of checking it, in every worker process) to'
+        ' this file in the Chrome trace event format, which can be opened in'
+        ' chrome://tracing or Perfetto. With --daemon, the timeline of all'
+        ' the requests is written after each request.'
+    ),
+)
 @click.argument(
     'paths',
     nargs=-1,
@@ -461,13 +684,14 @@ def validateNativeModeNoqaLocation(
         ' over the .toml file'
     ),
 )
-@click.version_option(__version__)
+@click.version_option(package_name='pydoclint')
 @click.pass_context
 def main(  # noqa: C901, PLR0915
         ctx: click.Context,
         *,
         quiet: bool,
         exclude: str,
+        respect_gitignore: bool,
         style: str,
         paths: tuple[str, ...],
         type_hints_in_signature: str,
@@ -496,11 +720,24 @@ def main(  # noqa: C901, PLR0915
         should_declare_assert_error_if_assert_statement_exists: bool,
         check_style_mismatch: bool,
         check_arg_defaults: bool,
+        select: str,
+        ignore: str,
         generate_baseline: bool,
         auto_regenerate_baseline: bool,
         baseline: str,
         show_filenames_in_every_violation_message: bool,
         native_mode_noqa_location: str,
+        parser: str,
+        jobs: int,
+        cache_dir: str | None,
+        no_cache: bool,
+        cache_max_size: int,
+        diff_only: TextIO | None,
+        daemon: bool,
+        daemon_socket: str,
+        profile: bool,
+        profile_json: str | None,
+        trace_file: str | None,
         config: str | None,  # noqa: ARG001, (don't remove `config` b/c it's required by `click`)
 ) -> None:
     """Command-line entry point of pydoclint"""
@@ -566,10 +803,12 @@ def main(  # noqa: C901, PLR0915
             )
             ctx.exit(1)
 
-    if len(paths) == 0:
+    if generate_baseline and diff_only is not None:
         click.echo(
             click.style(
-                'You did not specify a path to run pydoclint on.',
+                'The baseline file cannot be generated in the --diff-only'
+                ' mode, because the definitions outside of the diff are not'
+                ' checked.',
                 fg='red',
                 bold=True,
             ),
@@ -577,55 +816,62 @@ def main(  # noqa: C901, PLR0915
         )
         ctx.exit(1)
 
-    violationsInAllFiles: dict[str, list[Violation]] = _checkPaths(
-        quiet=quiet,
-        exclude=exclude,
-        style=style,
-        paths=paths,
-        argTypeHintsInSignature=arg_type_hints_in_signature,
-        argTypeHintsInDocstring=arg_type_hints_in_docstring,
-        checkArgOrder=check_arg_order,
-        skipCheckingShortDocstrings=skip_checking_short_docstrings,
-        skipCheckingRaises=skip_checking_raises,
-        skipCheckingPrivateFunctions=skip_checking_private_functions,
-        allowInitDocstring=allow_init_docstring,
-        checkReturnTypes=check_return_types,
-        checkYieldTypes=check_yield_types,
-        ignoreUnderscoreArgs=ignore_underscore_args,
-        ignorePrivateArgs=ignore_private_args,
-        checkClassAttributes=check_class_attributes,
-        shouldDocumentPrivateClassAttributes=(
+    # The options that stay the same in the daemon mode
+    checkPathsOptions: dict[str, Any] = {
+        'exclude': exclude,
+        'respectGitignore': respect_gitignore,
+        'style': style,
+        'argTypeHintsInSignature': arg_type_hints_in_signature,
+        'argTypeHintsInDocstring': arg_type_hints_in_docstring,
+        'checkArgOrder': check_arg_order,
+        'skipCheckingShortDocstrings': skip_checking_short_docstrings,
+        'skipCheckingRaises': skip_checking_raises,
+        'skipCheckingPrivateFunctions': skip_checking_private_functions,
+        'allowInitDocstring': allow_init_docstring,
+        'checkReturnTypes': check_return_types,
+        'checkYieldTypes': check_yield_types,
+        'ignoreUnderscoreArgs': ignore_underscore_args,
+        'ignorePrivateArgs': ignore_private_args,
+        'checkClassAttributes': check_class_attributes,
+        'shouldDocumentPrivateClassAttributes': (
             should_document_private_class_attributes
         ),
-        treatPropertyMethodsAsClassAttributes=(
+        'treatPropertyMethodsAsClassAttributes': (
             treat_property_methods_as_class_attributes
         ),
-        onlyAttrsWithClassVarAreTreatedAsClassAttrs=(
+        'onlyAttrsWithClassVarAreTreatedAsClassAttrs': (
             only_attrs_with_classvar_are_treated_as_class_attrs
         ),
-        requireInlineClassVarDocs=require_inline_class_var_docs,
-        requireReturnSectionWhenReturningNothing=(
+        'requireInlineClassVarDocs': require_inline_class_var_docs,
+        'requireReturnSectionWhenReturningNothing': (
             require_return_section_when_returning_nothing
         ),
-        requireYieldSectionWhenYieldingNothing=(
+        'requireYieldSectionWhenYieldingNothing': (
             require_yield_section_when_yielding_nothing
         ),
-        shouldDocumentStarArguments=should_document_star_arguments,
-        omitStarsWhenDocumentingVarargs=omit_stars_when_documenting_varargs,
-        shouldDeclareAssertErrorIfAssertStatementExists=(
+        'shouldDocumentStarArguments': should_document_star_arguments,
+        'omitStarsWhenDocumentingVarargs': omit_stars_when_documenting_varargs,
+        'shouldDeclareAssertErrorIfAssertStatementExists': (
             should_declare_assert_error_if_assert_statement_exists
         ),
-        checkStyleMismatch=check_style_mismatch,
-        checkArgDefaults=check_arg_defaults,
-        nativeModeNoqaLocation=native_mode_noqa_location,
-    )
+        'checkStyleMismatch': check_style_mismatch,
+        'checkArgDefaults': check_arg_defaults,
+        'select': select,
+        'ignore': ignore,
+        'nativeModeNoqaLocation': native_mode_noqa_location,
+        'parser': parser,
+    }
 
-    if generate_baseline:
-        if baseline is None:
+    if daemon:
+        # Imported here, because the daemon module imports this module
+        from pydoclint.daemon import DaemonError, serveDaemon  # noqa: PLC0415
+
+        if generate_baseline:
             click.echo(
                 click.style(
-                    'The baseline file was not specified. Use the'
-                    ' --baseline option or specify it in your config file',
+                    'The baseline file cannot be generated in the --daemon'
+                    ' mode. Please generate it with `pydoclint'
+                    ' --generate-baseline=True` first.',
                     fg='red',
                     bold=True,
                 ),
@@ -633,102 +879,206 @@ def main(  # noqa: C901, PLR0915
             )
             ctx.exit(1)
 
-        generateBaseline(violationsInAllFiles, baselinePath)
+        # The socket path is fixed at start-up, so that the clients can find
+        # it regardless of their working directories
+        daemonSocketPath: str = str(Path(daemon_socket).absolute())
+        if not quiet:
+            click.echo(
+                click.style(
+                    f'The pydoclint daemon is listening on {daemonSocketPath}',
+                    fg='green',
+                    bold=True,
+                ),
+                err=echoAsError,
+            )
+
+        try:
+            serveDaemon(
+                socketPath=daemonSocketPath,
+                checkPathsOptions=checkPathsOptions,
+                traceFile=trace_file,
+                baseline=baseline,
+                autoRegenerateBaseline=auto_regenerate_baseline,
+            )
+        except DaemonError as exc:
+            click.echo(
+                click.style(str(exc), fg='red', bold=True), err=echoAsError
+            )
+            ctx.exit(1)
+
+        ctx.exit(0)
+
+    if len(paths) == 0:
         click.echo(
             click.style(
-                'The baseline file was successfully generated',
-                fg='green',
+                'You did not specify a path to run pydoclint on.',
+                fg='red',
                 bold=True,
             ),
             err=echoAsError,
         )
-        ctx.exit(0)
+        ctx.exit(1)
 
+    # A structured baseline also lets the files that are unchanged since
+    # their records were written skip checking
+    structuredBaseline: StructuredBaseline | None = None
     if baseline is not None:
-        parsedBaseline: dict[str, list[str]] = parseBaseline(baselinePath)
-        (
-            baselineRegenerationNeeded,
-            unfixedBaselineViolationsInAllFiles,
-            violationsInAllFiles,
-        ) = reEvaluateBaseline(parsedBaseline, violationsInAllFiles)
-        if baselineRegenerationNeeded:
-            if auto_regenerate_baseline:
-                updatedBaseline = updateBaselineWithUnfixedViolations(
-                    baseline=parsedBaseline,
-                    unfixedBaselineViolations=(
-                        unfixedBaselineViolationsInAllFiles
-                    ),
-                )
-                generateBaseline(
-                    violationsAllFiles=updatedBaseline,
-                    path=baselinePath,
-                )
-                click.echo(
-                    click.style(
-                        'Some old violations were fixed, and'
-                        ' the baseline file was successfully re-generated',
-                        fg='green',
-                        bold=True,
-                    ),
-                    err=echoAsError,
+        from pydoclint.baseline import (  # noqa: PLC0415
+            StructuredBaseline,
+            isStructuredBaseline,
+        )
+
+        if isStructuredBaseline(baselinePath):
+            try:
+                structuredBaseline = (
+                    StructuredBaseline()
+                    if generate_baseline
+                    else StructuredBaseline.load(baselinePath)
                 )
-            else:
+            except ValueError as exc:  # including JSON decoding errors
                 click.echo(
                     click.style(
-                        'Some old violations were fixed. Please regenerate'
-                        ' your baseline file after fixing new problems.\n'
-                        'Use `--generate-baseline=True`. Or you can use'
-                        ' `--auto-regenerate-baseline=True` to do this'
-                        ' automatically in the future.',
+                        f'Cannot read the baseline file: {exc}',
                         fg='red',
                         bold=True,
                     ),
                     err=echoAsError,
                 )
+                ctx.exit(1)
 
-    # Print violation messages nicely to the terminal
-    violationCounter: int = 0
-    if len(violationsInAllFiles) > 0:
-        for counter, (filename, violationsInThisFile) in enumerate(
-            violationsInAllFiles.items(),
-            start=1,
-        ):
-            if len(violationsInThisFile) > 0:
-                if counter > 1:
-                    click.echo('', err=echoAsError)
-
-                if not show_filenames_in_every_violation_message:
-                    click.echo(
-                        click.style(filename, fg='yellow', bold=True),
-                        err=echoAsError,
-                    )
-
-                for violation in violationsInThisFile:
-                    violationCounter += 1
-                    if not show_filenames_in_every_violation_message:
-                        fourSpaces = '    '
-                        click.echo(fourSpaces, nl=False, err=echoAsError)
-                    else:
-                        click.echo(
-                            click.style(filename, fg='yellow', bold=True),
-                            nl=False,
-                            err=echoAsError,
-                        )
-                        click.echo(':', nl=False, err=echoAsError)
-
-                    click.echo(
-                        f'{violation.line}: ', nl=False, err=echoAsError
-                    )
-                    click.echo(
-                        click.style(
-                            f'{violation.fullErrorCode}',
-                            fg='red',
-                            bold=True,
-                        ),
-                        nl=False,
-                        err=echoAsError,
-                    )
-                    click.echo(f': {violation.msg}', err=echoAsError)
+    profiler: Profiler | None = None
+    if profile or profile_json is not None or trace_file is not None:
+        from pydoclint.utils.profiling import Profiler  # noqa: PLC0415
+
+        profiler = Profiler(recordTrace=trace_file is not None)
+
+    # The violations of each file are streamed: they are printed (or written
+    # to the baseline file) as soon as the file is checked
+    violationsInAllFiles: Iterator[tuple[str, list[Violation]]] = (
+        _iterCheckPaths(
+            paths=paths,
+            quiet=quiet,
+            jobs=jobs,
+            cacheDir=None if no_cache else cache_dir,
+            cacheMaxSize=cache_max_size,
+            changedLinesByFile=(
+                None
+                if diff_only is None
+                else resolveDiffPaths(parseUnifiedDiff(diff_only.read()))
+            ),
+            structuredBaseline=structuredBaseline,
+            profiler=profiler,
+            **checkPathsOptions,
+        )
+    )
+
+    if generate_baseline:
+        from pydoclint.baseline import generateBaseline  # noqa: PLC0415
+
+        if baseline is None:
+            click.echo(
+                click.style(
+                    'The baseline file was not specified. Use the'
+                    ' --baseline option or specify it in your config file',
+                    fg='red',
+                    bold=True,
+                ),
+                err=echoAsError,
+            )
+            ctx.exit(1)
+
+        if structuredBaseline is not None:
+            structuredBaseline.write(violationsInAllFiles, baselinePath)
+        else:
+            generateBaseline(violationsInAllFiles, baselinePath)
+
+        if profiler is not None:
+            _reportProfile(
+                profiler,
+                printReport=profile or profile_json is not None,
+                profileJson=profile_json,
+                traceFile=trace_file,
+            )
+
+        click.echo(
+            click.style(
+                'The baseline file was successfully generated',
+                fg='green',
+                bold=True,
+            ),
+            err=echoAsError,
+        )
+        ctx.exit(0)
+
+    baselineEvaluator: BaselineEvaluator | None = None
+    if baseline is not None:
+        from pydoclint.baseline import (  # noqa: PLC0415
+            BaselineEvaluator,
+            parseBaseline,
+        )
+
+        baselineEvaluator = BaselineEvaluator(
+            parseBaseline(baselinePath)
+            if structuredBaseline is None
+            else structuredBaseline.toMessages()
+        )
+        violationsInAllFiles = baselineEvaluator.evaluate(
+            violationsInAllFiles, profiler=profiler
+        )
+
+    violationCounter: int = _printViolations(
+        violationsInAllFiles,
+        showFilenamesInEveryViolationMessage=(
+            show_filenames_in_every_violation_message
+        ),
+    )
+
+    if profiler is not None:
+        _reportProfile(
+            profiler,
+            printReport=profile or profile_json is not None,
+            profileJson=profile_json,
+            traceFile=trace_file,
+        )
+
+    # In the --diff-only mode, the baseline violations that are not reported
+    # may just be outside of the diff (not checked), rather than fixed, so
+    # the baseline file is left as it is
+    if (
+        baselineEvaluator is not None
+        and baselineEvaluator.regenerationNeeded
+        and diff_only is None
+    ):
+        if auto_regenerate_baseline:
+            from pydoclint.baseline import regenerateBaseline  # noqa: PLC0415
+
+            regenerateBaseline(
+                baselineEvaluator,
+                baselinePath,
+                structuredBaseline=structuredBaseline,
+            )
+            click.echo(
+                click.style(
+                    'Some old violations were fixed, and'
+                    ' the baseline file was successfully re-generated',
+                    fg='green',
+                    bold=True,
+                ),
+                err=echoAsError,
+            )
+        else:
+            click.echo(
+                click.style(
+                    'Some old violations were fixed. Please regenerate'
+                    ' your baseline file after fixing new problems.\n'
+                    'Use `--generate-baseline=True`. Or you can use'
+                    ' `--auto-regenerate-baseline=True` to do this'
+                    ' automatically in the future.',
+                    fg='red',
+                    bold=True,
+                ),
+                err=echoAsError,
+            )
 
     if violationCounter > 0:
         ctx.exit(1)
@@ -742,7 +1092,99 @@ def main(  # noqa: C901, PLR0915
         ctx.exit(0)
 
 
+def _reportProfile(
+        profiler: Profiler,
+        *,
+        printReport: bool,
+        profileJson: str | None,
+        traceFile: str | None,
+) -> None:
+    """
+    Print the profiling report, and write the raw data and the trace (if
+    requested)
+    """
+    if printReport:
+        click.echo(
+            click.style('Profile', fg='yellow', bold=True), err=echoAsError
+        )
+        click.echo(profiler.formatReport(), err=echoAsError)
+
+    if profileJson is not None:
+        import json  # noqa: PLC0415
+
+        with Path(profileJson).open('w', encoding='utf-8') as fp:
+            json.dump(profiler.toJson(), fp, indent=2)
+
+    if traceFile is not None:
+        profiling.writeChromeTrace(profiler.traceEvents, traceFile)
+
+
+def _printViolations(
+        violationsInAllFiles: Iterable[tuple[str, list[Violation]]],
+        *,
+        showFilenamesInEveryViolationMessage: bool,
+) -> int:
+    """
+    Print the violation messages nicely to the terminal, file by file as they
+    arrive, and return the total number of violations.
+    """
+    violationCounter: int = 0
+    for counter, (filename, violationsInThisFile) in enumerate(
+        violationsInAllFiles,
+        start=1,
+    ):
+        if len(violationsInThisFile) == 0:
+            continue
+
+        if counter > 1:
+            click.echo('', err=echoAsError)
+
+        if not showFilenamesInEveryViolationMessage:
+            click.echo(
+                click.style(filename, fg='yellow', bold=True),
+                err=echoAsError,
+            )
+
+        for violation in violationsInThisFile:
+            violationCounter += 1
+            if not showFilenamesInEveryViolationMessage:
+                fourSpaces = '    '
+                click.echo(fourSpaces, nl=False, err=echoAsError)
+            else:
+                click.echo(
+                    click.style(filename, fg='yellow', bold=True),
+                    nl=False,
+                    err=echoAsError,
+                )
+                click.echo(':', nl=False, err=echoAsError)
+
+            click.echo(f'{violation.line}: ', nl=False, err=echoAsError)
+            click.echo(
+                click.style(
+                    f'{violation.fullErrorCode}',
+                    fg='red',
+                    bold=True,
+                ),
+                nl=False,
+                err=echoAsError,
+            )
+            click.echo(f': {violation.msg}', err=echoAsError)
+
+    return violationCounter
+
+
 def _checkPaths(
+        paths: tuple[str, ...],
+        **kwargs: Any,
+) -> dict[str, list[Violation]]:
+    """
+    Check the files in ``paths``, and collect the violations of all of them.
+    The keyword arguments are the same as those of ``_iterCheckPaths()``.
+    """
+    return dict(_iterCheckPaths(paths, **kwargs))
+
+
+def _iterCheckPaths(
         paths: tuple[str, ...],
         *,
         style: str = 'numpy',
@@ -769,11 +1211,41 @@ def _checkPaths(
         shouldDeclareAssertErrorIfAssertStatementExists: bool = False,
         checkStyleMismatch: bool = False,
         checkArgDefaults: bool = False,
+        select: str = '',
+        ignore: str = '',
         nativeModeNoqaLocation: str = 'docstring',
+        parser: str = 'compat',
         quiet: bool = False,
         exclude: str = '',
-) -> dict[str, list[Violation]]:
-    filenames: list[Path] = []
+        respectGitignore: bool = False,
+        jobs: int = 1,
+        cacheDir: str | None = None,
+        cacheMaxSize: int = DEFAULT_CACHE_MAX_SIZE_MB,
+        changedLinesByFile: dict[str, set[int]] | None = None,
+        sources: dict[str, bytes] | None = None,
+        resultCache: ResultCache | MemoryResultCache | None = None,
+        structuredBaseline: StructuredBaseline | None = None,
+        profiler: Profiler | None = None,
+        cwd: str | None = None,
+) -> Iterator[tuple[str, list[Violation]]]:
+    """
+    Check the files in ``paths``, and yield the violations of each file as
+    soon as it is checked (rather than after all files are checked). The
+    files are yielded in a deterministic order, even with ``jobs > 1``.
+    Checking starts before all the files are discovered. The violations of
+    the files that are unchanged since their records in
+    ``structuredBaseline`` were written are taken from the records. If
+    ``profiler`` is given, the checks (including those in the worker
+    processes) are timed with it. If ``cwd`` is given, the relative paths
+    are resolved against it rather than the current working directory (but
+    the violations are still reported under the paths as given).
+    """
+    # In-memory file contents (such as unsaved editor buffers), which take
+    # precedence over the files on disk
+    sourcesByPath: dict[str, bytes] = {
+        Path(path_).as_posix(): source
+        for path_, source in (sources or {}).items()
+    }
 
     if not quiet:
         skipMsg = f'Skipping files that match this pattern: {exclude}'
@@ -781,69 +1253,280 @@ def _checkPaths(
             click.style(skipMsg, fg='yellow', bold=True), err=echoAsError
         )
 
-    excludePattern = re.compile(exclude)
+    filesToCheck: Iterator[tuple[Path, set[int] | None]]
+    filesToCheck = _pairWithChangedLines(
+        iterPythonFiles(
+            paths,
+            excludePattern=re.compile(exclude),
+            respectGitignore=respectGitignore,
+            virtualFiles=sourcesByPath,
+            cwd=cwd,
+        ),
+        changedLinesByFile,
+    )
+    if profiler is not None:
+        # The discovery is lazy, so each step of it is timed separately
+        filesToCheck = profiling.timeIteration(filesToCheck, 'discovery')
+
+    checkFileOptions: dict[str, Any] = {
+        'style': style,
+        'argTypeHintsInSignature': argTypeHintsInSignature,
+        'argTypeHintsInDocstring': argTypeHintsInDocstring,
+        'checkArgOrder': checkArgOrder,
+        'skipCheckingShortDocstrings': skipCheckingShortDocstrings,
+        'skipCheckingRaises': skipCheckingRaises,
+        'skipCheckingPrivateFunctions': skipCheckingPrivateFunctions,
+        'allowInitDocstring': allowInitDocstring,
+        'checkReturnTypes': checkReturnTypes,
+        'checkYieldTypes': checkYieldTypes,
+        'ignoreUnderscoreArgs': ignoreUnderscoreArgs,
+        'ignorePrivateArgs': ignorePrivateArgs,
+        'checkClassAttributes': checkClassAttributes,
+        'shouldDocumentPrivateClassAttributes': (
+            shouldDocumentPrivateClassAttributes
+        ),
+        'treatPropertyMethodsAsClassAttributes': (
+            treatPropertyMethodsAsClassAttributes
+        ),
+        'onlyAttrsWithClassVarAreTreatedAsClassAttrs': (
+            onlyAttrsWithClassVarAreTreatedAsClassAttrs
+        ),
+        'requireInlineClassVarDocs': requireInlineClassVarDocs,
+        'requireReturnSectionWhenReturningNothing': (
+            requireReturnSectionWhenReturningNothing
+        ),
+        'requireYieldSectionWhenYieldingNothing': (
+            requireYieldSectionWhenYieldingNothing
+        ),
+        'shouldDocumentStarArguments': shouldDocumentStarArguments,
+        'omitStarsWhenDocumentingVarargs': omitStarsWhenDocumentingVarargs,
+        'shouldDeclareAssertErrorIfAssertStatementExists': (
+            shouldDeclareAssertErrorIfAssertStatementExists
+        ),
+        'checkStyleMismatch': checkStyleMismatch,
+        'checkArgDefaults': checkArgDefaults,
+        'select': select,
+        'ignore': ignore,
+        'nativeModeNoqaLocation': nativeModeNoqaLocation,
+        'parser': parser,
+    }
+
+    # Results of the --diff-only mode depend on the diff, so are not cached
+    if changedLinesByFile is None:
+        # The cache fingerprints must be computed before the cache itself is
+        # added to the options
+        cache: ResultCache | MemoryResultCache | BaselineCache | None = None
+        if resultCache is not None:
+            cache = resultCache
+        elif cacheDir is not None:
+            cache = ResultCache(
+                cacheDir=cacheDir,
+                options=checkFileOptions,
+                maxSizeMb=cacheMaxSize,
+            )
+
+        if structuredBaseline is not None:
+            cache = structuredBaseline.makeCache(
+                options=checkFileOptions,
+                fallback=cache,
+            )
+
+        if cache is not None:
+            checkFileOptions['cache'] = cache
+
+    # Like the cache, the directory does not affect the check results, so it
+    # is not part of the fingerprints
+    if cwd is not None:
+        checkFileOptions['cwd'] = cwd
+
+    results: Iterator[tuple[Path, list[Violation]]]
+    if jobs > 1 and not sourcesByPath:
+        results = _checkFilesInParallel(
+            filesToCheck,
+            jobs=jobs,
+            checkFileOptions=checkFileOptions,
+            profiler=profiler,
+        )
+    else:
+        results = (
+            (
+                filename,
+                _checkFile(
+                    filename,
+                    changedLines=changedLines,
+                    source=sourcesByPath.get(filename.as_posix()),
+                    **checkFileOptions,
+                ),
+            )
+            for filename, changedLines in filesToCheck
+        )
+
+    previousProfiler: Profiler | None = profiling.activeProfiler
+    if profiler is not None:
+        profiling.activeProfiler = profiler
+
+    try:
+        for filename, violationsInThisFile in results:
+            if not quiet:
+                click.echo(
+                    click.style(filename, fg='cyan', bold=True),
+                    err=echoAsError,
+                )
 
-    for path_ in paths:
-        path = Path(path_)
-        if path.is_file():
-            filenames.append(path)
-        elif path.is_dir():
-            filenames.extend(sorted(path.rglob('*.py')))
+            yield filename.as_posix(), violationsInThisFile
+    finally:
+        profiling.activeProfiler = previousProfiler
+        if 'cache' in checkFileOptions:
+            checkFileOptions['cache'].prune()
 
-    allViolations: dict[str, list[Violation]] = {}
 
+def _pairWithChangedLines(
+        filenames: Iterator[Path],
+        changedLinesByFile: dict[str, set[int]] | None,
+) -> Iterator[tuple[Path, set[int] | None]]:
+    """
+    Pair each file with its changed lines (None if all lines are checked).
+    In the --diff-only mode, files without changes are not checked at all,
+    and the changed lines are looked up by the absolute file paths.
+    """
     for filename in filenames:
-        if excludePattern.search(filename.as_posix()):
+        if changedLinesByFile is None:
+            yield filename, None
             continue
 
-        if not quiet:
-            click.echo(
-                click.style(filename, fg='cyan', bold=True), err=echoAsError
-            )
+        absPath: str = filename.resolve().as_posix()
+        if absPath in changedLinesByFile:
+            yield filename, changedLinesByFile[absPath]
+
+
+# The violations of each file in a chunk, and the chunk's profiling data
+_WorkerResult = tuple[list[list[Violation]], dict[str, Any] | None]
+
+# The options of ``_checkFile()`` in each worker process. They are sent once
+# per worker (via the pool initializer) rather than once per file.
+_workerCheckFileOptions: dict[str, Any] = {}
 
-        violationsInThisFile: list[Violation] = _checkFile(
+
+def _initWorker(
+        checkFileOptions: dict[str, Any],
+        profile: bool = False,  # noqa: FBT001, FBT002
+        recordTrace: bool = False,  # noqa: FBT001, FBT002
+) -> None:
+    _workerCheckFileOptions.clear()
+    _workerCheckFileOptions.update(checkFileOptions)
+    if profile:
+        from pydoclint.utils.profiling import Profiler  # noqa: PLC0415
+
+        profiling.activeProfiler = Profiler(recordTrace=recordTrace)
+
+
+def _checkFilesInWorker(
+        filenames: list[Path],
+        changedLinesInEachFile: list[set[int] | None],
+) -> tuple[list[list[Violation]], dict[str, Any] | None]:
+    # The violations of each file, and the profiling data of the chunk (if
+    # profiling is on), which the main process merges into its profiler
+    results: list[list[Violation]] = [
+        _checkFile(
             filename,
-            style=style,
-            argTypeHintsInSignature=argTypeHintsInSignature,
-            argTypeHintsInDocstring=argTypeHintsInDocstring,
-            checkArgOrder=checkArgOrder,
-            skipCheckingShortDocstrings=skipCheckingShortDocstrings,
-            skipCheckingRaises=skipCheckingRaises,
-            skipCheckingPrivateFunctions=skipCheckingPrivateFunctions,
-            allowInitDocstring=allowInitDocstring,
-            checkReturnTypes=checkReturnTypes,
-            checkYieldTypes=checkYieldTypes,
-            ignoreUnderscoreArgs=ignoreUnderscoreArgs,
-            ignorePrivateArgs=ignorePrivateArgs,
-            checkClassAttributes=checkClassAttributes,
-            shouldDocumentPrivateClassAttributes=(
-                shouldDocumentPrivateClassAttributes
-            ),
-            treatPropertyMethodsAsClassAttributes=(
-                treatPropertyMethodsAsClassAttributes
-            ),
-            onlyAttrsWithClassVarAreTreatedAsClassAttrs=(
-                onlyAttrsWithClassVarAreTreatedAsClassAttrs
-            ),
-            requireInlineClassVarDocs=requireInlineClassVarDocs,
-            requireReturnSectionWhenReturningNothing=(
-                requireReturnSectionWhenReturningNothing
-            ),
-            requireYieldSectionWhenYieldingNothing=(
-                requireYieldSectionWhenYieldingNothing
-            ),
-            shouldDocumentStarArguments=shouldDocumentStarArguments,
-            omitStarsWhenDocumentingVarargs=omitStarsWhenDocumentingVarargs,
-            shouldDeclareAssertErrorIfAssertStatementExists=(
-                shouldDeclareAssertErrorIfAssertStatementExists
-            ),
-            checkStyleMismatch=checkStyleMismatch,
-            checkArgDefaults=checkArgDefaults,
-            nativeModeNoqaLocation=nativeModeNoqaLocation,
+            changedLines=changedLines,
+            **_workerCheckFileOptions,
         )
-        allViolations[filename.as_posix()] = violationsInThisFile
+        for filename, changedLines in zip(
+            filenames, changedLinesInEachFile, strict=True
+        )
+    ]
+    profiler: Profiler | None = profiling.activeProfiler
+    return results, None if profiler is None else profiler.drain()
+
+
+def _checkFilesInParallel(
+        filesToCheck: Iterator[tuple[Path, set[int] | None]],
+        *,
+        jobs: int,
+        checkFileOptions: dict[str, Any],
+        profiler: Profiler | None = None,
+) -> Iterator[tuple[Path, list[Violation]]]:
+    """
+    Check files (each paired with its changed lines) in a pool of ``jobs``
+    worker processes, and yield the result of each file as soon as it (and
+    every file before it) is checked, so that the output is streamed in the
+    same order as ``filesToCheck``.
+    """
+    # Several files per task to amortize the inter-process overhead, while
+    # still leaving enough tasks for the workers to balance their load. The
+    # cap keeps the first results coming quickly on large repos. (Beyond the
+    # first files, the cap always applies, so the discovery of the other
+    # files does not need to finish before checking starts.)
+    firstFiles: list[tuple[Path, set[int] | None]] = list(
+        itertools.islice(filesToCheck, jobs * 4 * MAX_PARALLEL_CHUNK_SIZE)
+    )
+    if len(firstFiles) <= 1:  # not worth starting the worker processes
+        for filename, changedLines in firstFiles:
+            yield (
+                filename,
+                _checkFile(
+                    filename, changedLines=changedLines, **checkFileOptions
+                ),
+            )
+
+        return
+
+    from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+    chunkSize: int = max(
+        1, min(MAX_PARALLEL_CHUNK_SIZE, len(firstFiles) // (jobs * 4))
+    )
+    chunks: Iterator[tuple[list[Path], list[set[int] | None]]] = _iterChunks(
+        itertools.chain(firstFiles, filesToCheck),
+        chunkSize,
+    )
+
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_initWorker,
+        initargs=(
+            checkFileOptions,
+            profiler is not None,
+            profiler is not None and profiler.recordTrace,
+        ),
+    ) as executor:
+        # The reorder buffer: the chunks in flight, in the submission order.
+        # A chunk that finishes early waits here until the chunks before it
+        # are yielded. Its bounded size also bounds the memory held by the
+        # results that are not yet yielded.
+        inFlight: deque[tuple[list[Path], Future[_WorkerResult]]]
+        inFlight = deque(
+            (chunk[0], executor.submit(_checkFilesInWorker, *chunk))
+            for chunk in itertools.islice(chunks, jobs * 4)
+        )
+        while inFlight:
+            chunkFilenames, future = inFlight.popleft()
+            nextChunk = next(chunks, None)
+            if nextChunk is not None:  # keep the pool busy
+                inFlight.append((
+                    nextChunk[0],
+                    executor.submit(_checkFilesInWorker, *nextChunk),
+                ))
+
+            chunkResults, profileData = future.result()
+            if profiler is not None and profileData is not None:
+                profiler.merge(profileData)
+
+            yield from zip(chunkFilenames, chunkResults, strict=True)
 
-    return allViolations
+
+def _iterChunks(
+        filesToCheck: Iterator[tuple[Path, set[int] | None]],
+        chunkSize: int,
+) -> Iterator[tuple[list[Path], list[set[int] | None]]]:
+    # Split into chunks of (filenames, their changed lines)
+    while True:
+        chunk = list(itertools.islice(filesToCheck, chunkSize))
+        if not chunk:
+            return
+
+        yield [_[0] for _ in chunk], [_[1] for _ in chunk]
 
 
 def _checkFile(
@@ -873,84 +1556,278 @@ def _checkFile(
         shouldDeclareAssertErrorIfAssertStatementExists: bool = False,
         checkStyleMismatch: bool = False,
         checkArgDefaults: bool = False,
+        select: str = '',
+        ignore: str = '',
         nativeModeNoqaLocation: str = 'docstring',
+        parser: str = 'compat',
+        cache: ResultCache | MemoryResultCache | BaselineCache | None = None,
+        changedLines: set[int] | None = None,
+        source: bytes | None = None,
+        cwd: str | None = None,
 ) -> list[Violation]:
-    if not filename.is_file():  # sometimes folder names can end with `.py`
-        return []
+    # `source`: in-memory contents, such as an editor buffer
+    # `cwd`: the directory that `filename` is relative to (if not the
+    # current working directory)
+    diskPath: Path = filename if cwd is None else Path(cwd, filename)
+    if source is None and not diskPath.is_file():
+        return []  # sometimes folder names can end with `.py`
+
+    visitorOptions: dict[str, Any] = {
+        'style': style,
+        'parser': parser,
+        'argTypeHintsInSignature': argTypeHintsInSignature,
+        'argTypeHintsInDocstring': argTypeHintsInDocstring,
+        'checkArgOrder': checkArgOrder,
+        'skipCheckingShortDocstrings': skipCheckingShortDocstrings,
+        'skipCheckingRaises': skipCheckingRaises,
+        'skipCheckingPrivateFunctions': skipCheckingPrivateFunctions,
+        'allowInitDocstring': allowInitDocstring,
+        'checkReturnTypes': checkReturnTypes,
+        'checkYieldTypes': checkYieldTypes,
+        'ignoreUnderscoreArgs': ignoreUnderscoreArgs,
+        'ignorePrivateArgs': ignorePrivateArgs,
+        'checkClassAttributes': checkClassAttributes,
+        'shouldDocumentPrivateClassAttributes': (
+            shouldDocumentPrivateClassAttributes
+        ),
+        'treatPropertyMethodsAsClassAttributes': (
+            treatPropertyMethodsAsClassAttributes
+        ),
+        'onlyAttrsWithClassVarAreTreatedAsClassAttrs': (
+            onlyAttrsWithClassVarAreTreatedAsClassAttrs
+        ),
+        'requireInlineClassVarDocs': requireInlineClassVarDocs,
+        'requireReturnSectionWhenReturningNothing': (
+            requireReturnSectionWhenReturningNothing
+        ),
+        'requireYieldSectionWhenYieldingNothing': (
+            requireYieldSectionWhenYieldingNothing
+        ),
+        'shouldDocumentStarArguments': shouldDocumentStarArguments,
+        'omitStarsWhenDocumentingVarargs': omitStarsWhenDocumentingVarargs,
+        'shouldDeclareAssertErrorIfAssertStatementExists': (
+            shouldDeclareAssertErrorIfAssertStatementExists
+        ),
+        'checkStyleMismatch': checkStyleMismatch,
+        'checkArgDefaults': checkArgDefaults,
+        'select': select,
+        'ignore': ignore,
+        'changedLines': changedLines,
+    }
+
+    with (
+        profiling.timeFile(filename.as_posix()),
+        _openSource(diskPath, source) as rawSrc,
+    ):
+        return _checkSource(
+            rawSrc,
+            visitorOptions=visitorOptions,
+            nativeModeNoqaLocation=nativeModeNoqaLocation,
+            cache=cache,
+        )
+
+
+@contextlib.contextmanager
+def _openSource(
+        filename: Path,
+        source: bytes | None,
+) -> Iterator[bytes | mmap.mmap]:
+    """
+    Provide the raw bytes of the source code: ``source`` if it is not None,
+    or else the contents of the file, in one binary read. Files of at least
+    ``MMAP_SIZE_THRESHOLD`` bytes are memory-mapped instead (read-only, and
+    only while the file is checked).
+    """
+    if source is not None:
+        yield source
+        return
+
+    with filename.open('rb') as fp:
+        if os.fstat(fp.fileno()).st_size < MMAP_SIZE_THRESHOLD:
+            with profiling.timePhase('read'):
+                src: bytes = fp.read()
+
+            yield src
+            return
+
+        import mmap  # noqa: PLC0415
+
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def _checkSource(
+        rawSrc: bytes | mmap.mmap,
+        *,
+        visitorOptions: dict[str, Any],
+        nativeModeNoqaLocation: str,
+        cache: ResultCache | MemoryResultCache | BaselineCache | None,
+) -> list[Violation]:
+    """Check the raw source code (or get its violations from the cache)"""
+    cacheKey: str = ''
+    if cache is not None:
+        with profiling.timePhase('cache'):
+            cacheKey = cache.computeKey(rawSrc)
+            cachedViolations: list[Violation] | None = cache.get(cacheKey)
 
-    with Path(filename).open(encoding='utf-8', errors='replace') as fp:
-        # Note: errors='replace' would replace unrecognized characters with
-        #       question marks. This may not be a perfect solution, but for
-        #       not this may be good enough.
-        src: str = ''.join(fp.readlines())
+        if cachedViolations is not None:
+            return cachedViolations
 
-    tree: ast.Module
+    tree: ast.Module | None
+    syntaxErrorViolation: Violation | None
+    with profiling.timePhase('parse'):
+        tree, syntaxErrorViolation = _parseRawSourceCode(rawSrc)
+    if tree is None:
+        assert syntaxErrorViolation is not None  # narrow type
+        violations: list[Violation] = [syntaxErrorViolation]
+        if not compileRuleSelection(
+            visitorOptions['select'],
+            visitorOptions['ignore'],
+        ).isEnabled(syntaxErrorViolation.code):
+            violations = []
+    else:
+        violations = _checkTree(
+            tree,
+            rawSrc,
+            visitorOptions=visitorOptions,
+            nativeModeNoqaLocation=nativeModeNoqaLocation,
+        )
+
+    if cache is not None:
+        with profiling.timePhase('cache'):
+            cache.put(cacheKey, violations)
+
+    return violations
+
+
+def _parseRawSourceCode(
+        rawSrc: bytes | mmap.mmap,
+) -> tuple[ast.Module | None, Violation | None]:
+    """
+    Parse the raw source code, which ``ast.parse()`` decodes with the
+    encoding declared in the file (PEP 263), or UTF-8 by default. If that
+    fails (such as because of undecodable bytes or invisible characters),
+    parse the leniently decoded text instead (see ``_parseSourceCode()``).
+    """
+    try:
+        return ast.parse(rawSrc), None
+    except SyntaxError:
+        return _parseSourceCode(_decodeSource(rawSrc))
+
+
+def _decodeSource(rawSrc: bytes | mmap.mmap) -> str:
+    """
+    Decode the raw source code with the encoding declared in it (by the
+    PEP 263 encoding cookie or the UTF-8 BOM), or UTF-8 by default.
+
+    Undecodable bytes are replaced with U+FFFD, and the line endings are
+    normalized (like in the text mode of ``open()``), so that the line
+    numbers of the text match those of the syntax tree.
+
+    Parameters
+    ----------
+    rawSrc : bytes | mmap.mmap
+        The raw source code
+
+    Returns
+    -------
+    str
+        The decoded source code
+    """
+    import tokenize  # noqa: PLC0415
+
+    # (At most the first 2 lines are read, without copying an mmap)
+    readline: Callable[[], bytes]
+    if isinstance(rawSrc, bytes):
+        readline = io.BytesIO(rawSrc).readline
+    else:
+        rawSrc.seek(0)
+        readline = rawSrc.readline
+
+    try:
+        encoding, _ = tokenize.detect_encoding(readline)
+    except SyntaxError:  # such as an unknown encoding in the cookie
+        encoding = 'utf-8'
+
+    src: str = str(rawSrc, encoding, 'replace')
+    if '\r' in src:
+        src = src.replace('\r\n', '\n').replace('\r', '\n')
+
+    return src
+
+
+def _parseSourceCode(src: str) -> tuple[ast.Module | None, Violation | None]:
+    """
+    Parse the source code. If it has syntax errors, return None and a DOC002
+    violation instead of the syntax tree.
+    """
     try:
-        tree = ast.parse(src)
+        return ast.parse(src), None
     except SyntaxError as e:
         if str(e).startswith('invalid non-printable character'):
             src_ = replaceInvisibleChars(src)
             try:
                 # In case there's another syntax error after fixing
                 # this invalid non-printable character error
-                tree = ast.parse(src_)
+                return ast.parse(src_), None
             except SyntaxError as e2:
-                return [Violation(code=2, line=0, msgPostfix=str(e2))]
+                return None, Violation(code=2, line=0, msgPostfix=str(e2))
         else:  # other syntax errors
-            return [Violation(code=2, line=0, msgPostfix=str(e))]
+            return None, Violation(code=2, line=0, msgPostfix=str(e))
     except Exception:  # other non-SyntaxError exceptions
         raise
 
-    visitor = Visitor(
-        style=style,
-        argTypeHintsInSignature=argTypeHintsInSignature,
-        argTypeHintsInDocstring=argTypeHintsInDocstring,
-        checkArgOrder=checkArgOrder,
-        skipCheckingShortDocstrings=skipCheckingShortDocstrings,
-        skipCheckingRaises=skipCheckingRaises,
-        skipCheckingPrivateFunctions=skipCheckingPrivateFunctions,
-        allowInitDocstring=allowInitDocstring,
-        checkReturnTypes=checkReturnTypes,
-        checkYieldTypes=checkYieldTypes,
-        ignoreUnderscoreArgs=ignoreUnderscoreArgs,
-        ignorePrivateArgs=ignorePrivateArgs,
-        checkClassAttributes=checkClassAttributes,
-        shouldDocumentPrivateClassAttributes=(
-            shouldDocumentPrivateClassAttributes
-        ),
-        treatPropertyMethodsAsClassAttributes=(
-            treatPropertyMethodsAsClassAttributes
-        ),
-        onlyAttrsWithClassVarAreTreatedAsClassAttrs=(
-            onlyAttrsWithClassVarAreTreatedAsClassAttrs
-        ),
-        requireInlineClassVarDocs=requireInlineClassVarDocs,
-        requireReturnSectionWhenReturningNothing=(
-            requireReturnSectionWhenReturningNothing
-        ),
-        requireYieldSectionWhenYieldingNothing=(
-            requireYieldSectionWhenYieldingNothing
-        ),
-        shouldDocumentStarArguments=shouldDocumentStarArguments,
-        omitStarsWhenDocumentingVarargs=omitStarsWhenDocumentingVarargs,
-        shouldDeclareAssertErrorIfAssertStatementExists=(
-            shouldDeclareAssertErrorIfAssertStatementExists
-        ),
-        checkStyleMismatch=checkStyleMismatch,
-        checkArgDefaults=checkArgDefaults,
-    )
-    visitor.visit(tree)
 
-    codesByLine = collectNoqaCodesByLine(src)
+def _checkTree(
+        tree: ast.Module,
+        rawSrc: bytes | mmap.mmap,
+        *,
+        visitorOptions: dict[str, Any],
+        nativeModeNoqaLocation: str,
+) -> list[Violation]:
+    """Check the syntax tree, and drop the violations suppressed by noqa"""
+    from pydoclint.visitor import Visitor  # noqa: PLC0415
+
+    visitor = Visitor(**visitorOptions)
+    with profiling.timePhase('visit'):
+        visitor.visit(tree)
+
+    # The noqa comments are only looked for when they can make a difference,
+    # so clean files (i.e., most files) skip the tokenization entirely
+    if not visitor.violations:
+        return []
+
+    with profiling.timePhase('noqa'):
+        return _dropSuppressedViolations(
+            visitor.violations,
+            tree,
+            rawSrc,
+            nativeModeNoqaLocation=nativeModeNoqaLocation,
+        )
+
+
+def _dropSuppressedViolations(
+        violations: list[Violation],
+        tree: ast.Module,
+        rawSrc: bytes | mmap.mmap,
+        *,
+        nativeModeNoqaLocation: str,
+) -> list[Violation]:
+    """Drop the violations suppressed by the noqa comments in the source"""
+    codesByLine = collectNoqaCodesByLine(_decodeSource(rawSrc))
+    if not codesByLine:
+        return violations
+
     suppressionByDefinitionLine = collectNativeNoqaSuppression(
         tree=tree,
         codesByLine=codesByLine,
         location=nativeModeNoqaLocation,
+        definitionLines={_.line for _ in violations},
     )
 
     return [  # filter violations
         violation
-        for violation in visitor.violations
+        for violation in violations
         if not codeIsSuppressed(
             violation.fullErrorCode,
             suppressionByDefinitionLine.get(violation.line, set()),
@@ -13,10 +13,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-if sys.version_info >= (3, 11):
-    import tomllib
-else:
-    import tomli as tomllib
+# The options whose values are comma-separated lists, which can also be
+# written as arrays in the config file
+COMMA_SEPARATED_OPTIONS = ('select', 'ignore')
 
 
 class MissingPydoclintSectionError(RuntimeError):
@@ -103,6 +102,13 @@ def parseOneTomlFile(
 
         return {}
 
+    # Imported here, so that the start-up does not pay for it if there is no
+    # config file to load
+    if sys.version_info >= (3, 11):
+        import tomllib  # noqa: PLC0415
+    else:
+        import tomli as tomllib  # noqa: PLC0415
+
     try:
         with Path(tomlFilename).open('rb') as fp:
             rawConfig = tomllib.load(fp)
@@ -131,6 +137,9 @@ def parseOneTomlFile(
         finalConfig = {
             k.replace('-', '_'): v for k, v in pydoclintSection.items()
         }
+        for option in COMMA_SEPARATED_OPTIONS:
+            if isinstance(finalConfig.get(option), list):
+                finalConfig[option] = ','.join(finalConfig[option])
 
     if len(finalConfig) > 0:
         logger.info('Found options defined in %s:', tomlFilename)
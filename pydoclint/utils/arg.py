@@ -8,10 +8,11 @@ if TYPE_CHECKING:
 
 from pydoclint.utils.edge_case_error import EdgeCaseError
 from pydoclint.utils.generic import (
+    canonicalizeTypeHint,
     specialEqual,
     stripCommentsFromTypeHints,
-    stripQuotes,
 )
+from pydoclint.utils.profiling import timePhase
 from pydoclint.utils.unparser_custom import unparseName
 
 
@@ -20,9 +21,12 @@ class Arg:
     A class to hold function input/return arguments.
 
     This class also defines some essential behaviors of an argument, such as
-    comparison, equality, hashing, etc.
+    comparison, equality, hashing, etc. Its objects are treated as immutable
+    values (a new object is created instead of changing one).
     """
 
+    __slots__ = ('name', 'typeHint')
+
     def __init__(self, name: str, typeHint: str) -> None:
         if len(name) == 0:
             raise ValueError('`name` cannot be an empty string')
@@ -60,7 +64,8 @@ class Arg:
         return self < other or self == other
 
     def __hash__(self) -> int:
-        return hash((self.name, stripQuotes(self.typeHint)))
+        # Consistent with ``__eq__()``: equal args have equal hashes
+        return hash((self.name, canonicalizeTypeHint(self.typeHint)))
 
     def nameEquals(self, other: Arg) -> bool:
         """More lenient equality: only compare names"""
@@ -152,7 +157,8 @@ class Arg:
 
     @classmethod
     def _typeHintsEq(cls, hint1: str, hint2: str) -> bool:
-        # We parse and then unparse so that cases like this can be
+        # The type hints are parsed and then unparsed (once per distinct
+        # type hint, thanks to the cache) so that cases like this can be
         # treated as equal:
         #
         # >>> Literal['abc', 'def', 'ghi']
@@ -162,17 +168,11 @@ class Arg:
         # >>>     "def",
         # >>>     "ghi",
         # >>> ]
-        try:
-            hint1_: str = unparseName(ast.parse(stripQuotes(hint1)))
-        except SyntaxError:
-            hint1_ = hint1
-
-        try:
-            hint2_: str = unparseName(ast.parse(stripQuotes(hint2)))
-        except SyntaxError:
-            hint2_ = hint2
+        if hint1 == hint2:
+            return True
 
-        return specialEqual(hint1_, hint2_)
+        with timePhase('type hints'):
+            return canonicalizeTypeHint(hint1) == canonicalizeTypeHint(hint2)
 
     @classmethod
     def _removeEscapeChar(cls, string: str) -> str:
@@ -193,12 +193,25 @@ class ArgList:
     equality, length calculation, etc.
     """
 
+    __slots__ = ('_lookup', 'infoList')
+
     def __init__(self, infoList: list[Arg]) -> None:
         if not all(isinstance(_, Arg) for _ in infoList):
             raise TypeError('All elements of `infoList` must be Arg.')
 
-        self.infoList = infoList
-        self.lookup = {_.name: _.typeHint for _ in infoList}
+        self.infoList: list[Arg] = infoList
+        self._lookup: dict[str, str] | None = None
+
+    @property
+    def lookup(self) -> dict[str, str]:
+        """
+        The mapping from the arg names to the type hints (only built when it
+        is first needed, because many lists are never looked up by name)
+        """
+        if self._lookup is None:
+            self._lookup = {_.name: _.typeHint for _ in self.infoList}
+
+        return self._lookup
 
     def __repr__(self) -> str:
         return self.__str__()
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import re
+from pathlib import Path
+
+_HUNK_HEADER_PATTERN = re.compile(
+    r'^@@ -\d+(?:,(?P<oldCount>\d+))? \+(?P<newStart>\d+)'
+    r'(?:,(?P<newCount>\d+))? @@'
+)
+_NULL_PATH = '/dev/null'
+
+
+def parseUnifiedDiff(diffText: str) -> dict[str, set[int]]:
+    """
+    Parse a unified diff (such as the output of ``git diff``) and collect the
+    changed line numbers in the new version of each file.
+
+    Parameters
+    ----------
+    diffText : str
+        The full text of the unified diff
+
+    Returns
+    -------
+    dict[str, set[int]]
+        Mapping from the file paths (as written in the diff, without the
+        ``a/`` or ``b/`` prefixes) to the line numbers that are added or
+        modified in the new version of the file. A pure deletion (one not
+        replaced by added lines) is attributed to the line right before it,
+        so that the definition that contained the deleted lines is also
+        regarded as changed.
+    """
+    changedLines: dict[str, set[int]] = {}
+
+    currentFile: set[int] | None = None
+    newLineNum: int = 0
+    hasPendingDeletion: bool = False
+
+    # The numbers of lines still to be read in the current hunk. We need them
+    # to tell a file header ("--- a/x.py") from a deleted line ("-- x").
+    oldLinesLeft: int = 0
+    newLinesLeft: int = 0
+
+    for line in diffText.splitlines():
+        if oldLinesLeft > 0 or newLinesLeft > 0:  # inside a hunk
+            if line.startswith('\\'):  # "\ No newline at end of file"
+                continue
+
+            if line.startswith('+'):
+                if currentFile is not None:
+                    currentFile.add(newLineNum)
+
+                hasPendingDeletion = False  # the deleted lines are replaced
+                newLineNum += 1
+                newLinesLeft -= 1
+            elif line.startswith('-'):
+                hasPendingDeletion = True
+                oldLinesLeft -= 1
+            else:  # context line
+                if hasPendingDeletion and currentFile is not None:
+                    currentFile.add(max(newLineNum - 1, 1))
+
+                hasPendingDeletion = False
+                newLineNum += 1
+                newLinesLeft -= 1
+                oldLinesLeft -= 1
+
+            if hasPendingDeletion and oldLinesLeft <= 0 and newLinesLeft <= 0:
+                # The hunk ends with deleted lines
+                if currentFile is not None:
+                    currentFile.add(max(newLineNum - 1, 1))
+
+                hasPendingDeletion = False
+
+            continue
+
+        if line.startswith('+++ '):
+            path = _stripDiffPathPrefix(line[4:])
+            if path == _NULL_PATH:  # the file is deleted
+                currentFile = None
+            else:
+                currentFile = changedLines.setdefault(path, set())
+
+            continue
+
+        hunkHeader = _HUNK_HEADER_PATTERN.match(line)
+        if hunkHeader is not None:
+            oldCount = hunkHeader.group('oldCount')
+            newCount = hunkHeader.group('newCount')
+            oldLinesLeft = 1 if oldCount is None else int(oldCount)
+            newLinesLeft = 1 if newCount is None else int(newCount)
+            newLineNum = int(hunkHeader.group('newStart'))
+
+    return changedLines
+
+
+def resolveDiffPaths(
+        changedLines: dict[str, set[int]],
+        root: Path | None = None,
+) -> dict[str, set[int]]:
+    """
+    Resolve the (relative) file paths in a parsed diff against ``root``
+    (default: the current working directory), so that they can be matched
+    against the paths of the files being checked.
+    """
+    root_ = Path.cwd() if root is None else root
+    return {
+        (root_ / path).resolve().as_posix(): lines
+        for path, lines in changedLines.items()
+    }
+
+
+def _stripDiffPathPrefix(path: str) -> str:
+    # Remove the timestamp that some diff tools append after a tab
+    path = path.split('\t', maxsplit=1)[0].strip()
+    if path.startswith(('a/', 'b/')):
+        return path[2:]
+
+    return path
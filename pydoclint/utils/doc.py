@@ -1,43 +1,109 @@
 from __future__ import annotations
 
 import pprint
-from typing import Any
-
-from docstring_parser.common import (
-    Docstring,
-    DocstringReturns,
-    DocstringYields,
-)
-from docstring_parser.google import GoogleParser
-from docstring_parser.numpydoc import NumpydocParser
-from docstring_parser.rest import parse as parseSphinx
+from typing import TYPE_CHECKING, Any
 
 from pydoclint.utils.arg import ArgList
 from pydoclint.utils.edge_case_error import EdgeCaseError
 from pydoclint.utils.return_arg import ReturnArg
 from pydoclint.utils.yield_arg import YieldArg
 
+if TYPE_CHECKING:
+    from docstring_parser.common import (
+        Docstring,
+        DocstringReturns,
+        DocstringYields,
+    )
+    from docstring_parser.google import GoogleParser
+    from docstring_parser.numpydoc import NumpydocParser
 
-class Doc:
-    """A class to hold docstring and to provide info on the parsed docstring"""
+# The parsers of docstring_parser are imported when the first docstring is
+# parsed (rather than at the top of this module), so that the start-up does
+# not pay for them when no docstring needs to be parsed (such as when all
+# the results come from the cache).
+
+# "fast": pydoclint's own docstring scanner; "compat": docstring_parser
+DOCSTRING_PARSERS = ('fast', 'compat')
 
-    def __init__(self, docstring: str, style: str = 'numpy') -> None:
+
+class Doc:
+    """
+    A class to hold docstring and to provide info on the parsed docstring
+
+    Parameters
+    ----------
+    docstring : str
+        The docstring
+    style : str, default='numpy'
+        The docstring style: "numpy", "google", or "sphinx"
+    parser : str, default='compat'
+        Which parser to use: "fast" (pydoclint's own scanner, which falls
+        back to docstring_parser for the docstrings that it cannot scan
+        exactly) or "compat" (always docstring_parser)
+
+    Raises
+    ------
+    EdgeCaseError
+        If the style or the parser is unknown
+    """
+
+    def __init__(
+            self,
+            docstring: str,
+            style: str = 'numpy',
+            parser: str = 'compat',
+    ) -> None:
         self.docstring = docstring
         self.style = style
+        self.parser = parser
+
+        if style not in {'numpy', 'google', 'sphinx'}:
+            msg = f'Unknown style "{style}"; please contact the authors'
+            raise EdgeCaseError(msg)
+
+        if parser not in DOCSTRING_PARSERS:
+            raise EdgeCaseError(f'Unknown docstring parser "{parser}"')
+
+        parsed: Docstring | None = None
+        if parser == 'fast':
+            from pydoclint.utils.docstring_scanner import (  # noqa: PLC0415
+                scanDocstring,
+            )
+
+            parsed = scanDocstring(docstring, style)
+
+        if parsed is None:
+            parsed = self._parseWithDocstringParser(docstring, style)
 
+        self.parsed: Docstring = parsed
+        self.docstringSize = self.parsed.size
+
+    @classmethod
+    def _parseWithDocstringParser(
+            cls,
+            docstring: str,
+            style: str,
+    ) -> Docstring:
         parser: NumpydocParser | GoogleParser
         if style == 'numpy':
+            from docstring_parser.numpydoc import (  # noqa: PLC0415
+                NumpydocParser,
+            )
+
             parser = NumpydocParser()
-            self.parsed = parser.parse(docstring)
-        elif style == 'google':
+            return parser.parse(docstring)
+
+        if style == 'google':
+            from docstring_parser.google import GoogleParser  # noqa: PLC0415
+
             parser = GoogleParser()
-            self.parsed = parser.parse(docstring)
-        elif style == 'sphinx':
-            self.parsed = parseSphinx(docstring)
-        else:
-            raise self._createUnknownStyleError()
+            return parser.parse(docstring)
 
-        self.docstringSize = self.parsed.size
+        from docstring_parser.rest import (  # noqa: PLC0415
+            parse as parseSphinx,
+        )
+
+        return parseSphinx(docstring)
 
     def __repr__(self) -> str:
         return pprint.pformat(self.__dict__, indent=2)
@@ -111,6 +177,8 @@ class Doc:
     @property
     def returnSection(self) -> list[ReturnArg]:
         """Get the return section of the docstring"""
+        from docstring_parser.common import Docstring  # noqa: PLC0415
+
         if isinstance(self.parsed, Docstring):  # Google, numpy, Sphinx styles
             returnSection: list[DocstringReturns] = self.parsed.many_returns
             return [
@@ -127,6 +195,8 @@ class Doc:
     @property
     def yieldSection(self) -> list[YieldArg]:
         """Get the yield section of the docstring"""
+        from docstring_parser.common import Docstring  # noqa: PLC0415
+
         if isinstance(self.parsed, Docstring):  # Google, numpy, Sphinx styles
             yieldSection: list[DocstringYields] = self.parsed.many_yields
             return [
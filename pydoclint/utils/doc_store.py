@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pydoclint.utils.generic import getDocstring
+from pydoclint.utils.parse_docstring import (
+    parseDocstringInDetectedStyle,
+    parseDocstringInGivenStyle,
+)
+
+if TYPE_CHECKING:
+    from docstring_parser import ParseError
+
+    from pydoclint.utils.ast_types import ClassOrFunctionDef
+    from pydoclint.utils.doc import Doc
+
+
+class DocStore:
+    """
+    The parsed docstrings of one file, keyed by the node that owns each
+    docstring (and the style), so that every docstring is parsed at most once
+    per style, no matter how many checks use it. For example, a class
+    docstring is used by the class attribute checks, by the class/constructor
+    checks, and in place of the docstring of ``__init__()``.
+
+    The parsing itself still goes through the (cross-file) memoized
+    functions in ``parse_docstring``; this store only avoids repeating the
+    lookups and the style detection within a file.
+
+    Parameters
+    ----------
+    parser : str, default='compat'
+        The docstring parser ("fast" or "compat")
+    """
+
+    def __init__(self, parser: str = 'compat') -> None:
+        self.parser: str = parser
+        self._docstrings: dict[ClassOrFunctionDef, str] = {}
+        self._parsed: dict[
+            tuple[ClassOrFunctionDef, str],
+            tuple[Doc, ParseError | None],
+        ] = {}
+        self._parsedInDetectedStyle: dict[
+            tuple[ClassOrFunctionDef, str],
+            tuple[Doc, ParseError | None, bool],
+        ] = {}
+
+        # How many times a stored result has been reused (see the tests)
+        self.numReused: int = 0
+
+    def getDocstring(self, node: ClassOrFunctionDef) -> str:
+        """Get the docstring of the node ('' if there is none)"""
+        if node not in self._docstrings:
+            self._docstrings[node] = getDocstring(node)
+
+        return self._docstrings[node]
+
+    def parseInGivenStyle(
+            self,
+            node: ClassOrFunctionDef,
+            style: str,
+    ) -> tuple[Doc, ParseError | None]:
+        """
+        Parse the docstring of the node in the given style.
+
+        Parameters
+        ----------
+        node : ClassOrFunctionDef
+            The node that owns the docstring
+        style : str
+            The docstring style
+
+        Returns
+        -------
+        tuple[Doc, ParseError | None]
+            The parsed docstring and the parsing error (if any)
+        """
+        key = (node, style)
+        if key in self._parsed:
+            self.numReused += 1
+            return self._parsed[key]
+
+        self._parsed[key] = parseDocstringInGivenStyle(
+            self.getDocstring(node),
+            style,
+            self.parser,
+        )
+        return self._parsed[key]
+
+    def parseInDetectedStyle(
+            self,
+            node: ClassOrFunctionDef,
+            userSpecifiedStyle: str,
+    ) -> tuple[Doc, ParseError | None, bool]:
+        """
+        Parse the docstring of the node in its most likely style, which is
+        parsed (and stored) in the same way as in ``parseInGivenStyle()``.
+
+        Parameters
+        ----------
+        node : ClassOrFunctionDef
+            The node that owns the docstring
+        userSpecifiedStyle : str
+            The docstring style specified by the user
+
+        Returns
+        -------
+        tuple[Doc, ParseError | None, bool]
+            The parsed docstring, the parsing error (if any), and whether
+            there is a style mismatch
+        """
+        key = (node, userSpecifiedStyle)
+        if key in self._parsedInDetectedStyle:
+            self.numReused += 1
+            return self._parsedInDetectedStyle[key]
+
+        self._parsedInDetectedStyle[key] = parseDocstringInDetectedStyle(
+            self.getDocstring(node),
+            userSpecifiedStyle,
+            parseInGivenStyle=lambda style: self.parseInGivenStyle(
+                node,
+                style,
+            ),
+        )
+        return self._parsedInDetectedStyle[key]
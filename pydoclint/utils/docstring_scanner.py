@@ -0,0 +1,703 @@
+"""
+A fast, single-pass line scanner for numpy, Google, and Sphinx docstrings
+(``--parser=fast``).
+
+``docstring_parser`` (``--parser=compat``) builds the full ``Docstring``
+object, including all the descriptions. pydoclint only needs the names and
+the types of the arguments and the attributes, and the returns, yields, and
+raises sections, so this scanner only extracts those. It produces the same
+``Docstring`` objects as ``docstring_parser`` (so the rest of pydoclint does
+not need to know which parser is used), except that the descriptions are
+left empty unless pydoclint needs them.
+
+When a docstring contains something that this scanner does not reproduce
+exactly (such as a malformed section that ``docstring_parser`` rejects, or
+a rarely used construct like the ``.. deprecated::`` directive),
+``scanDocstring()`` returns None, and the caller falls back to
+``docstring_parser``. This keeps the violations identical in both modes.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import re
+import textwrap
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from docstring_parser.common import Docstring, DocstringMeta
+
+# The kinds of numpy sections (determined from the section classes of
+# docstring_parser, so that both parsers recognize the same sections)
+_PARAM = 'param'
+_ATTR = 'attr'
+_RAISES = 'raises'
+_RETURNS = 'returns'
+_YIELDS = 'yields'
+_EXAMPLES = 'examples'
+_OTHER = 'other'
+
+# The same as ``[ \t\r\f\v]`` in the section title regex of docstring_parser
+_GOOGLE_TITLE_TRAILING_WHITESPACE = ' \t\r\f\v'
+
+_SPHINX_ATTRIBUTE_DIRECTIVE = '.. attribute ::'
+
+_UNINDENTED_LINE_PATTERN = re.compile(r'\n\S')
+
+
+def scanDocstring(docstring: str, style: str) -> Docstring | None:
+    """
+    Scan the docstring and extract the parts that pydoclint checks.
+
+    Parameters
+    ----------
+    docstring : str
+        The docstring
+    style : str
+        The docstring style: "numpy", "google", or "sphinx"
+
+    Returns
+    -------
+    Docstring | None
+        The scanned docstring, or None if this scanner cannot guarantee the
+        same results as ``docstring_parser`` for this docstring
+
+    Raises
+    ------
+    ValueError
+        If the style is not supported
+    """
+    if style == 'numpy':
+        return _scanNumpy(docstring)
+
+    if style == 'google':
+        return _scanGoogle(docstring)
+
+    if style == 'sphinx':
+        return _scanSphinx(docstring)
+
+    raise ValueError(f'Unsupported docstring style: "{style}"')
+
+
+def _cleandoc(docstring: str) -> str:
+    # The docstrings from ``ast.get_docstring()`` are already cleaned up, so
+    # the (relatively slow) ``inspect.cleandoc()`` can often be skipped: the
+    # docstring is already clean if it has no tabs, does not start or end
+    # with whitespace, and its lines (after the first one) are not indented
+    # by a common margin
+    if (
+        docstring[:1].strip()
+        and docstring[-1:].strip()
+        and '\t' not in docstring
+        and (
+            '\n' not in docstring
+            or _UNINDENTED_LINE_PATTERN.search(docstring) is not None
+        )
+    ):
+        return docstring
+
+    return inspect.cleandoc(docstring)
+
+
+def _newDocstring(descriptionChunk: str) -> Docstring:
+    from docstring_parser import common  # noqa: PLC0415
+
+    # The same as how docstring_parser splits the description
+    result = common.Docstring()
+    parts: list[str] = descriptionChunk.split('\n', 1)
+    result.short_description = parts[0] or None
+    if len(parts) > 1:
+        result.long_description = parts[1].strip() or None
+
+    return result
+
+
+def _newDocstringBefore(lines: list[str], firstSectionIdx: int) -> Docstring:
+    # The docstring with the description (the lines before the first section)
+    return _newDocstring(
+        '\n'.join(lines[:firstSectionIdx]) + '\n'
+        if firstSectionIdx > 0
+        else ''
+    )
+
+
+def _splitNameAndType(key: str) -> tuple[str | None, str | None]:
+    # Equivalent to ``PARAM_KEY_REGEX`` and ``RETURN_KEY_REGEX`` in
+    # docstring_parser's numpydoc module: the name ends before the first
+    # colon (and the whitespace before it), and the type starts after the
+    # colon (and the whitespace after it)
+    colonIndex: int = key.find(':')
+    if colonIndex == -1:
+        return None, None
+
+    return key[:colonIndex].rstrip(), key[colonIndex + 1 :].lstrip()
+
+
+def _stripNumpyTypeModifiers(typeName: str) -> str:
+    # Equivalent to ``PARAM_OPTIONAL_REGEX`` and ``PARAM_DEFAULT_REGEX``
+    if typeName.endswith((', optional', '(optional)')):
+        typeName = typeName[: -len(', optional')]
+
+    defaultIndices: list[int] = [
+        idx
+        for idx in (typeName.find(', default'), typeName.find('(default)'))
+        if idx != -1
+    ]
+    if defaultIndices:
+        typeName = typeName[: min(defaultIndices)]
+
+    return typeName
+
+
+@functools.cache
+def _getNumpySectionKinds() -> dict[str, tuple[str, str]]:
+    from docstring_parser import numpydoc  # noqa: PLC0415
+
+    kinds: dict[str, tuple[str, str]] = {}
+    for section in numpydoc.DEFAULT_SECTIONS:
+        kind: str
+        # Subclasses are checked before their base classes
+        if isinstance(section, numpydoc.AttrSection):
+            kind = _ATTR
+        elif isinstance(section, numpydoc.ParamSection):
+            kind = _PARAM
+        elif isinstance(section, numpydoc.RaisesSection):
+            kind = _RAISES
+        elif isinstance(section, numpydoc.YieldsSection):
+            kind = _YIELDS
+        elif isinstance(section, numpydoc.ReturnsSection):
+            kind = _RETURNS
+        elif isinstance(section, numpydoc.ExamplesSection):
+            kind = _EXAMPLES
+        elif isinstance(section, numpydoc.DeprecationSection):
+            continue  # the ``.. deprecated::`` directive is not scanned
+        else:
+            kind = _OTHER
+
+        kinds[section.title] = (kind, section.key)
+
+    return kinds
+
+
+def _scanNumpy(docstring: str) -> Docstring | None:
+    sectionKinds: dict[str, tuple[str, str]] = _getNumpySectionKinds()
+    lines: list[str] = _cleandoc(docstring).split('\n')
+    headers: list[tuple[int, str]] | None = _findNumpyHeaders(
+        lines,
+        sectionKinds,
+    )
+    if headers is None:
+        return None
+
+    if len(headers) == 0:
+        return _newDocstring('\n'.join(lines))
+
+    result = _newDocstringBefore(lines, headers[0][0])
+    for headerNum, (headerIdx, title) in enumerate(headers):
+        isLastSection: bool = headerNum == len(headers) - 1
+        bodyEnd: int = (
+            len(lines) if isLastSection else headers[headerNum + 1][0]
+        )
+        kind, key = sectionKinds[title]
+        sectionMeta: list[DocstringMeta] | None = _scanNumpySection(
+            kind,
+            key,
+            lines[headerIdx + 2 : bodyEnd],
+            isLastSection=isLastSection,
+        )
+        if sectionMeta is None:
+            return None  # docstring_parser raises ParseError
+
+        result.meta.extend(sectionMeta)
+
+    return result
+
+
+def _findNumpyHeaders(
+        lines: list[str],
+        sectionKinds: dict[str, tuple[str, str]],
+) -> list[tuple[int, str]] | None:
+    # A section header is a known title, underlined by exactly as many
+    # dashes. Any other line of dashes (or a directive) may be interpreted
+    # differently by docstring_parser, so it is not scanned (None).
+    headers: list[tuple[int, str]] = []
+    underlineIdx: int = -1
+    for i, line in enumerate(lines):
+        strippedLine: str = line.rstrip()
+        if strippedLine.startswith('..'):
+            return None
+
+        if strippedLine != '' and strippedLine.strip('-') == '':
+            if i != underlineIdx:
+                return None
+
+            continue
+
+        if (
+            strippedLine in sectionKinds
+            and i + 1 < len(lines)
+            and lines[i + 1].rstrip() == '-' * len(strippedLine)
+        ):
+            headers.append((i, strippedLine))
+            underlineIdx = i + 1
+
+    return headers
+
+
+def _scanNumpySection(
+        kind: str,
+        key: str,
+        body: list[str],
+        *,
+        isLastSection: bool,
+) -> list[DocstringMeta] | None:
+    # The items of a section (None if docstring_parser rejects the section)
+    from docstring_parser import common  # noqa: PLC0415
+
+    if kind == _OTHER:
+        return [_newMeta(key)]
+
+    # An empty section is only allowed at the end of the docstring
+    isEmptyLastSection: bool = isLastSection and len(body) == 0
+
+    if kind == _EXAMPLES:
+        numExamples: int = _countNumpyExamples(body)
+        if numExamples == 0 and not isEmptyLastSection:
+            return None
+
+        return [
+            common.DocstringExample([key], snippet=None, description=None)
+            for _ in range(numExamples)
+        ]
+
+    # Each item starts with a line that is not indented
+    itemKeys: list[str] = [_ for _ in body if _ and not _[0].isspace()]
+    if len(itemKeys) == 0 and not isEmptyLastSection:
+        return None
+
+    return [_numpyItemMeta(kind, key, _) for _ in itemKeys]
+
+
+def _numpyItemMeta(kind: str, key: str, itemKey: str) -> DocstringMeta:
+    from docstring_parser import common  # noqa: PLC0415
+
+    if kind in {_PARAM, _ATTR}:
+        argName, typeName = _splitNameAndType(itemKey)
+        if argName is None:
+            argName = itemKey
+        elif typeName is not None:
+            typeName = _stripNumpyTypeModifiers(typeName)
+
+        paramClass = (
+            common.DocstringParam if kind == _PARAM else common.DocstringAttr
+        )
+        return paramClass(
+            args=[key, argName],
+            description=None,
+            arg_name=argName,
+            type_name=typeName,
+            is_optional=None,
+            default=None,
+        )
+
+    if kind == _RAISES:
+        return common.DocstringRaises(
+            args=[key, itemKey],
+            description=None,
+            type_name=itemKey if len(itemKey) > 0 else None,
+        )
+
+    # Returns or yields
+    returnName, returnType = _splitNameAndType(itemKey)
+    if returnName is None:
+        returnType = itemKey
+
+    if kind == _RETURNS:
+        return common.DocstringReturns(
+            args=[key],
+            description=None,
+            type_name=returnType,
+            is_generator=False,
+            return_name=returnName,
+        )
+
+    return common.DocstringYields(
+        args=[key],
+        description=None,
+        type_name=returnType,
+        is_generator=True,
+        yield_name=returnName,
+    )
+
+
+def _countNumpyExamples(body: list[str]) -> int:
+    # The same grouping as docstring_parser's ``ExamplesSection``: each
+    # example is a run of ">>>" lines followed by a run of other lines
+    lines: list[str] = textwrap.dedent('\n'.join(body)).strip().splitlines()
+    count: int = 0
+    inSnippet: bool = False
+    for i, line in enumerate(lines):
+        isSnippetLine: bool = line.startswith('>>>')
+        if i == 0 or (isSnippetLine and not inSnippet):
+            count += 1
+
+        inSnippet = isSnippetLine
+
+    return count
+
+
+def _newMeta(key: str) -> DocstringMeta:
+    from docstring_parser import common  # noqa: PLC0415
+
+    return common.DocstringMeta([key], description=None)
+
+
+@functools.cache
+def _getGoogleSections() -> dict[str, tuple[str, int]]:
+    from docstring_parser import google  # noqa: PLC0415
+
+    return {
+        f'{_.title}:': (_.key, int(_.type)) for _ in google.DEFAULT_SECTIONS
+    }
+
+
+def _scanGoogle(docstring: str) -> Docstring | None:
+    sections: dict[str, tuple[str, int]] = _getGoogleSections()
+    lines: list[str] = _cleandoc(docstring).split('\n')
+
+    headers: list[tuple[int, str]] = [
+        (i, title)
+        for i, title in enumerate(
+            _.rstrip(_GOOGLE_TITLE_TRAILING_WHITESPACE) for _ in lines
+        )
+        if title in sections
+    ]
+
+    if len(headers) == 0:
+        return _newDocstring('\n'.join(lines))
+
+    result = _newDocstringBefore(lines, headers[0][0])
+    for title, body in _findGoogleSectionBodies(lines, headers).items():
+        key, sectionType = sections[title]
+        sectionMeta: list[DocstringMeta] | None = _scanGoogleSection(
+            key,
+            sectionType,
+            '\n'.join(body).strip('\n'),
+        )
+        if sectionMeta is None:
+            return None
+
+        result.meta.extend(sectionMeta)
+
+    return result
+
+
+def _findGoogleSectionBodies(
+        lines: list[str],
+        headers: list[tuple[int, str]],
+) -> dict[str, list[str]]:
+    # Like docstring_parser, a repeated title replaces the earlier content
+    # (but keeps the earlier position), and a section ends at the first line
+    # that is not indented
+    bodies: dict[str, list[str]] = {}
+    for headerNum, (headerIdx, title) in enumerate(headers):
+        bodyEnd: int = (
+            len(lines)
+            if headerNum == len(headers) - 1
+            else headers[headerNum + 1][0]
+        )
+        body: list[str] = []
+        for line in lines[headerIdx + 1 : bodyEnd]:
+            if line and not line[0].isspace():
+                break
+
+            body.append(line)
+
+        bodies[title] = body
+
+    return bodies
+
+
+def _scanGoogleSection(
+        key: str,
+        sectionType: int,
+        chunk: str,
+) -> list[DocstringMeta] | None:
+    # The items of a section (None if this scanner cannot reproduce what
+    # docstring_parser does with the section)
+    from docstring_parser import google  # noqa: PLC0415
+
+    firstLine: str = chunk.split('\n', 1)[0]
+    if firstLine.strip() == '' and chunk.strip() != '':
+        return None  # docstring_parser infers a multi-line indentation
+
+    if sectionType != google.SectionType.MULTIPLE:
+        return [_googleSingularMeta(key, sectionType, chunk)]
+
+    # Each item starts with a line that has exactly the indentation of
+    # the first line of the section
+    indent: str = firstLine[: len(firstLine) - len(firstLine.lstrip())]
+    if indent == '':
+        return None  # docstring_parser raises ParseError
+
+    items: list[list[str]] = []
+    for line in chunk.split('\n'):
+        rest: str = line[len(indent) :]
+        if line.startswith(indent) and rest and not rest[0].isspace():
+            items.append([rest])
+        elif len(items) == 0:
+            return None  # docstring_parser raises ParseError
+        else:
+            items[-1].append(line)
+
+    meta: list[DocstringMeta] = []
+    for itemLines in items:
+        itemText: str = '\n'.join(itemLines).strip('\n')
+        if ':' not in itemText:
+            return None  # docstring_parser raises ParseError
+
+        meta.append(_googleItemMeta(key, _googleItemSpec(itemText)))
+
+    return meta
+
+
+def _googleSingularMeta(
+        key: str,
+        sectionType: int,
+        chunk: str,
+) -> DocstringMeta:
+    # The meta of a section that is not a list of items (such as "Returns:")
+    from docstring_parser import common, google  # noqa: PLC0415
+
+    part: str = inspect.cleandoc(chunk)
+    typeName: str | None = None
+    if sectionType != google.SectionType.SINGULAR and ':' in part:
+        typeName = _googleItemSpec(part)
+
+    if key in common.RETURNS_KEYWORDS:
+        return common.DocstringReturns(
+            args=[key] if typeName is None else [key, typeName],
+            description=None,
+            type_name=typeName,
+            is_generator=False,
+        )
+
+    if key in common.YIELDS_KEYWORDS:
+        return common.DocstringYields(
+            args=[key] if typeName is None else [key, typeName],
+            description=None,
+            type_name=typeName,
+            is_generator=True,
+        )
+
+    return common.DocstringExample([key], snippet=None, description=None)
+
+
+def _googleItemMeta(key: str, spec: str) -> DocstringMeta:
+    from docstring_parser import common, google  # noqa: PLC0415
+
+    if key in common.PARAM_KEYWORDS | common.ATTR_KEYWORDS:
+        isOptional: bool | None = None
+        match = google.GOOGLE_TYPED_ARG_REGEX.match(spec)
+        if match:
+            argName, argType = match.group(1, 2)
+            isOptional = False
+            if argType.endswith(', optional'):
+                isOptional = True
+                argType = argType[: -len(', optional')]
+            elif argType.endswith('?'):
+                isOptional = True
+                argType = argType[:-1]
+        else:
+            argName, argType = spec, None
+
+        paramClass = (
+            common.DocstringParam
+            if key in common.PARAM_KEYWORDS
+            else common.DocstringAttr
+        )
+        return paramClass(
+            args=[key, spec],
+            description=None,
+            arg_name=argName,
+            type_name=argType,
+            is_optional=isOptional,
+            default=None,
+        )
+
+    if key in common.RAISES_KEYWORDS:
+        return common.DocstringRaises(
+            args=[key, spec],
+            description=None,
+            type_name=spec,
+        )
+
+    return _newMeta(key)
+
+
+def _googleItemSpec(text: str) -> str:
+    # The part of an item before the first colon, which has the name and
+    # the type of the item
+    spec: str = text.split(':', 1)[0]
+    if '\n' in spec:
+        firstLine, rest = spec.split('\n', 1)
+        spec = firstLine + inspect.cleandoc(rest)
+
+    return spec
+
+
+def _scanSphinx(docstring: str) -> Docstring | None:
+    if _SPHINX_ATTRIBUTE_DIRECTIVE in docstring:
+        return None  # attribute blocks are not scanned
+
+    lines: list[str] = _cleandoc(docstring).split('\n')
+    fieldStarts: list[int] = [
+        i for i, line in enumerate(lines) if line.startswith(':')
+    ]
+
+    if len(fieldStarts) == 0:
+        return _newDocstring('\n'.join(lines))
+
+    result = _newDocstringBefore(lines, fieldStarts[0])
+    types: dict[str, str] = {}
+    rtypes: dict[str | None, str] = {}
+    ytypes: dict[str | None, str] = {}
+    for fieldNum, fieldStart in enumerate(fieldStarts):
+        fieldEnd: int = (
+            len(lines)
+            if fieldNum == len(fieldStarts) - 1
+            else fieldStarts[fieldNum + 1]
+        )
+        field: str = '\n'.join(lines[fieldStart:fieldEnd])
+        fieldParts: list[str] = field.lstrip(':').split(':', 1)
+        if len(fieldParts) != 2:  # noqa: PLR2004
+            return None  # docstring_parser raises ParseError
+
+        args: list[str] = fieldParts[0].split()
+        rawDesc: str = fieldParts[1]
+
+        if len(args) == 2 and args[0] == 'type':  # noqa: PLR2004
+            types[args[1]] = _sphinxDescription(rawDesc)
+        elif len(args) in {1, 2} and args[0] in {'rtype', 'ytype'}:
+            returnTypes = rtypes if args[0] == 'rtype' else ytypes
+            returnTypes[None if len(args) == 1 else args[1]] = (
+                _sphinxDescription(rawDesc)
+            )
+        else:
+            item: DocstringMeta | None = _sphinxFieldMeta(args, rawDesc)
+            if item is None:
+                return None  # docstring_parser raises ParseError
+
+            result.meta.append(item)
+
+    _fillSphinxTypes(result.meta, types=types, rtypes=rtypes, ytypes=ytypes)
+    return result
+
+
+def _sphinxFieldMeta(args: list[str], rawDesc: str) -> DocstringMeta | None:
+    # The meta of a field other than the type fields (None if
+    # docstring_parser rejects the field)
+    from docstring_parser import common  # noqa: PLC0415
+
+    if len(args) == 0:
+        return None  # docstring_parser fails on fields without a keyword
+
+    if args[0] in common.PARAM_KEYWORDS:
+        if len(args) == 3:  # noqa: PLR2004
+            _, typeName, argName = args
+            isOptional: bool | None = typeName.endswith('?')
+            if isOptional:
+                typeName = typeName[:-1]
+        elif len(args) == 2:  # noqa: PLR2004
+            _, argName = args
+            typeName, isOptional = None, None
+        else:
+            return None
+
+        return common.DocstringParam(
+            args=args,
+            description=None,
+            arg_name=argName,
+            type_name=typeName,
+            is_optional=isOptional,
+            default=None,
+        )
+
+    if args[0] in common.RETURNS_KEYWORDS | common.YIELDS_KEYWORDS:
+        if len(args) > 2:  # noqa: PLR2004
+            return None
+
+        returnClass = (
+            common.DocstringReturns
+            if args[0] in common.RETURNS_KEYWORDS
+            else common.DocstringYields
+        )
+        return returnClass(
+            args=args,
+            description=None,
+            type_name=args[1] if len(args) > 1 else None,
+            is_generator=args[0] in common.YIELDS_KEYWORDS,
+        )
+
+    if args[0] in common.RAISES_KEYWORDS:
+        if len(args) > 2:  # noqa: PLR2004
+            return None
+
+        return common.DocstringRaises(
+            args=args,
+            # Needed for the ":raises: ValueError: ..." format
+            description=_sphinxDescription(rawDesc),
+            type_name=args[1] if len(args) > 1 else None,
+        )
+
+    if args[0] in common.DEPRECATION_KEYWORDS:
+        return common.DocstringDeprecated(
+            args=args, description=None, version=None
+        )
+
+    return _newMeta(args[0])
+
+
+def _fillSphinxTypes(
+        meta: list[DocstringMeta],
+        *,
+        types: dict[str, str],
+        rtypes: dict[str | None, str],
+        ytypes: dict[str | None, str],
+) -> None:
+    # Fill in the types from the ":type:", ":rtype:", and ":ytype:" fields,
+    # the same way as docstring_parser
+    from docstring_parser import common  # noqa: PLC0415
+
+    for item in meta:
+        if isinstance(item, common.DocstringParam):
+            item.type_name = item.type_name or types.get(item.arg_name)
+        elif isinstance(item, common.DocstringReturns):
+            item.type_name = item.type_name or rtypes.get(item.return_name)
+        elif isinstance(item, common.DocstringYields):
+            item.type_name = item.type_name or ytypes.get(item.yield_name)
+
+    if rtypes and not any(
+        isinstance(_, common.DocstringReturns) for _ in meta
+    ):
+        meta.extend(
+            common.DocstringReturns(
+                args=[],
+                description=None,
+                type_name=rtype,
+                is_generator=False,
+                return_name=returnName,
+            )
+            for returnName, rtype in rtypes.items()
+        )
+
+
+def _sphinxDescription(rawDesc: str) -> str:
+    # The same clean-up of the description as docstring_parser
+    desc: str = rawDesc.strip()
+    if '\n' in desc:
+        firstLine, rest = desc.split('\n', 1)
+        desc = firstLine + '\n' + inspect.cleandoc(rest)
+
+    return desc
@@ -0,0 +1,377 @@
+from __future__ import annotations
+
+import os
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterator
+
+# The regex syntax whose match depends on what follows the matched text (end
+# anchors, word boundaries, and lookarounds). If an exclude pattern has none
+# of these, a match on a folder's path (followed by "/") is also a match on
+# the path of every file inside that folder. (Escaped characters such as
+# "\$" are also caught, which only means that nothing is pruned.)
+_CONTEXT_DEPENDENT_SYNTAX: re.Pattern[str] = re.compile(
+    r'\$|\\[ZzbB]|\(\?<?[=!]'
+)
+
+
+class GitIgnoreRule:
+    """
+    One pattern of a ``.gitignore`` file (or of ``.git/info/exclude``).
+
+    Parameters
+    ----------
+    pattern : str
+        The pattern (a line of the file), which must not be blank or a
+        comment
+    """
+
+    __slots__ = ('dirOnly', 'negated', 'regex')
+
+    def __init__(self, pattern: str) -> None:
+        self.negated: bool = pattern.startswith('!')
+        if self.negated:
+            pattern = pattern[1:]
+
+        self.dirOnly: bool = pattern.endswith('/')
+        pattern = pattern.rstrip('/')
+
+        # A slash at the beginning or in the middle anchors the pattern to
+        # the directory of the .gitignore file; otherwise it can match at
+        # any level below that directory
+        anchored: bool = '/' in pattern
+        pattern = pattern.lstrip('/')
+        prefix: str = '' if anchored else '(?:.*/)?'
+        self.regex: re.Pattern[str] = re.compile(
+            prefix + _translateGlob(pattern) + r'\Z',
+            re.DOTALL,
+        )
+
+    def matches(self, relativePath: str, isDir: bool) -> bool:  # noqa: FBT001
+        """
+        Whether the pattern matches the path (relative to the directory of
+        the .gitignore file, with "/" as the separator)
+        """
+        if self.dirOnly and not isDir:
+            return False
+
+        return self.regex.match(relativePath) is not None
+
+
+def parseGitIgnore(text: str) -> list[GitIgnoreRule]:
+    """
+    Parse the contents of a ``.gitignore`` file.
+
+    Parameters
+    ----------
+    text : str
+        The contents of the file
+
+    Returns
+    -------
+    list[GitIgnoreRule]
+        The rules, in the order of the file
+    """
+    rules: list[GitIgnoreRule] = []
+    for line in text.splitlines():
+        if line.startswith('#'):
+            continue
+
+        # Trailing spaces are ignored unless they are escaped
+        pattern = line.rstrip(' ')
+        if pattern.endswith('\\') and len(line) > len(pattern):
+            pattern += ' '
+
+        # (A leading "\#" or "\!" is an escape, like anywhere else)
+        if pattern != '':
+            rules.append(GitIgnoreRule(pattern))
+
+    return rules
+
+
+def _translateGlob(pattern: str) -> str:
+    # Translate the glob syntax of .gitignore into a regex
+    regex: list[str] = []
+    i: int = 0
+    n: int = len(pattern)
+    while i < n:
+        char = pattern[i]
+        if pattern.startswith('**', i):
+            atStart: bool = i == 0 or pattern[i - 1] == '/'
+            atEnd: bool = i + 2 == n or pattern[i + 2] == '/'
+            if atStart and i + 2 == n:  # "foo/**": everything inside
+                regex.append('.*')
+                i += 2
+            elif atStart and atEnd:  # "**/foo" or "a/**/b": 0+ directories
+                regex.append('(?:.*/)?')
+                i += 3
+            else:  # other consecutive asterisks are regular asterisks
+                regex.append('[^/]*')
+                i += 2
+        elif char == '*':
+            regex.append('[^/]*')
+            i += 1
+        elif char == '?':
+            regex.append('[^/]')
+            i += 1
+        elif char == '[':
+            end: int = pattern.find(']', i + 2)
+            if end == -1:  # not a character class
+                regex.append(re.escape(char))
+                i += 1
+            else:
+                content: str = pattern[i + 1 : end]
+                if content.startswith('!'):
+                    content = '^' + content[1:]
+
+                regex.append('[' + content.replace('\\', '\\\\') + ']')
+                i = end + 1
+        elif char == '\\' and i + 1 < n:
+            regex.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            regex.append(re.escape(char))
+            i += 1
+
+    return ''.join(regex)
+
+
+class _GitIgnoreScope(NamedTuple):
+    """The rules of one .gitignore file and the directory it applies to"""
+
+    directory: str  # absolute, ending with "/"
+    rules: list[GitIgnoreRule]
+
+
+def _isIgnored(
+        absPath: str,
+        scopes: list[_GitIgnoreScope],
+        *,
+        isDir: bool,
+) -> bool:
+    # The last matching rule wins, and the rules of deeper .gitignore files
+    # take precedence over those of the shallower ones
+    for scope in reversed(scopes):
+        relativePath: str = absPath[len(scope.directory) :]
+        for rule in reversed(scope.rules):
+            if rule.matches(relativePath, isDir):
+                return not rule.negated
+
+    return False
+
+
+def _readGitIgnoreScope(
+        directory: str,
+        filename: str,
+        baseDir: str,
+) -> _GitIgnoreScope | None:
+    try:
+        text: str = Path(directory, filename).read_text(
+            encoding='utf-8',
+            errors='replace',
+        )
+    except OSError:
+        return None
+
+    rules: list[GitIgnoreRule] = parseGitIgnore(text)
+    return _GitIgnoreScope(directory=baseDir, rules=rules) if rules else None
+
+
+def _collectAncestorScopes(realDir: str) -> list[_GitIgnoreScope]:
+    # The .gitignore files in the ancestors of `realDir` (up to the root of
+    # the git repository, plus its .git/info/exclude), from the outermost
+    ancestors: list[str] = []
+    current: str = realDir
+    while True:
+        ancestors.append(current)
+        gitPath: str = os.path.join(current, '.git')  # noqa: PTH118
+        if os.path.exists(gitPath):  # noqa: PTH110
+            break
+
+        parent: str = os.path.dirname(current)  # noqa: PTH120
+        if parent == current:  # not in a git repository
+            return []
+
+        current = parent
+
+    repoRoot: str = ancestors[-1]
+    scopes: list[_GitIgnoreScope | None] = [
+        _readGitIgnoreScope(
+            os.path.join(repoRoot, '.git', 'info'),  # noqa: PTH118
+            'exclude',
+            baseDir=_withSlash(repoRoot),
+        )
+    ]
+    scopes.extend(
+        _readGitIgnoreScope(_, '.gitignore', baseDir=_withSlash(_))
+        for _ in reversed(ancestors[1:])  # `realDir` itself is walked later
+    )
+    return [_ for _ in scopes if _ is not None]
+
+
+def _withSlash(path: str) -> str:
+    return path if path.endswith('/') else path + '/'
+
+
+def iterPythonFiles(
+        paths: Collection[str],
+        *,
+        excludePattern: re.Pattern[str],
+        respectGitignore: bool = False,
+        virtualFiles: Collection[str] = (),
+        cwd: str | None = None,
+) -> Iterator[Path]:
+    """
+    Find the Python files in ``paths`` lazily (so that checking can start
+    before the discovery finishes), in the same order as
+    ``sorted(path.rglob('*.py'))`` for each directory.
+
+    The directories are walked with ``os.scandir()``. A file is excluded if
+    ``excludePattern`` matches its path. A directory is pruned before it is
+    walked into if the pattern matches its path with a trailing "/", but
+    only if the pattern would then match every file inside it too (that is,
+    if it has no end anchors, word boundaries, or lookarounds, such as in
+    ``tests/(?!keep)``). Like ``rglob()``, symlinks to directories are not
+    walked into.
+
+    Each file is yielded only once, even if the paths overlap or if a file
+    is symlinked from several places.
+
+    Parameters
+    ----------
+    paths : Collection[str]
+        The files and directories to look in. Files are always yielded
+        (unless they match ``excludePattern``), even if they don't end with
+        ".py".
+    excludePattern : re.Pattern[str]
+        The pattern of the paths to exclude
+    respectGitignore : bool, default=False
+        Whether to skip the files and the directories ignored by
+        ``.gitignore`` files (in the walked directories and in their
+        ancestors within the git repository) and by ``.git/info/exclude``.
+        The files in ``paths`` are not affected by this.
+    virtualFiles : Collection[str], default=()
+        The paths (with "/" as the separator) that are files, even if they
+        don't exist on the disk (such as unsaved editor buffers)
+    cwd : str | None, default=None
+        The directory that the relative paths are resolved against (the
+        current working directory if None). The yielded paths are still
+        built from ``paths``.
+
+    Yields
+    ------
+    Path
+        The path of each Python file
+    """
+    seen: set[str] = set()
+    pruneExcludedDirs: bool = not _CONTEXT_DEPENDENT_SYNTAX.search(
+        excludePattern.pattern
+    )
+
+    for path_ in paths:
+        path = Path(path_)
+        diskPath: Path = path if cwd is None else Path(cwd, path)
+        posixPath: str = path.as_posix()
+        if posixPath in virtualFiles or diskPath.is_file():
+            key: str = os.path.realpath(diskPath)
+            if key not in seen and not excludePattern.search(posixPath):
+                seen.add(key)
+                yield path
+        elif diskPath.is_dir():
+            yield from _walkDirectory(
+                path,
+                realRoot=_withSlash(os.path.realpath(diskPath)),
+                excludePattern=excludePattern,
+                pruneExcludedDirs=pruneExcludedDirs,
+                respectGitignore=respectGitignore,
+                seen=seen,
+            )
+
+
+def _walkDirectory(
+        root: Path,
+        *,
+        realRoot: str,
+        excludePattern: re.Pattern[str],
+        pruneExcludedDirs: bool,
+        respectGitignore: bool,
+        seen: set[str],
+) -> Iterator[Path]:
+    # The paths of the yielded files are built from `root` in the same way
+    # as those from `root.rglob()`, such as "a/b.py" for root "." ("./a/b.py"
+    # would not match the same exclude patterns)
+    rootPosix: str = root.as_posix()
+    prefix: str = '' if rootPosix == '.' else _withSlash(rootPosix)
+
+    scopes: list[_GitIgnoreScope] = []
+    if respectGitignore:
+        scopes = _collectAncestorScopes(realRoot.rstrip('/') or '/')
+
+    # A depth-first walk with the entries of each directory sorted by name,
+    # which is the order of ``sorted(root.rglob('*.py'))``. Each item is
+    # either a file to yield, or a directory to walk into (with its path
+    # relative to the root, and the number of .gitignore scopes that apply)
+    stack: list[Path | tuple[str, int]] = [('', len(scopes))]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, Path):
+            yield item
+            continue
+
+        relDir, numScopes = item
+        del scopes[numScopes:]  # drop the scopes of the finished directories
+        absDir: str = realRoot + relDir
+
+        if respectGitignore:
+            scope = _readGitIgnoreScope(absDir, '.gitignore', baseDir=absDir)
+            if scope is not None:
+                scopes.append(scope)
+
+        try:
+            with os.scandir(absDir) as iterator:
+                entries = sorted(iterator, key=lambda _: _.name)
+        except OSError:  # such as permission errors
+            continue
+
+        children: list[Path | tuple[str, int]] = []
+        for entry in entries:
+            try:
+                # Like ``rglob()``, symlinks to directories are not followed
+                isDir: bool = entry.is_dir(follow_symlinks=False)
+                isFile: bool = not isDir and entry.name.endswith('.py')
+                isFile = isFile and entry.is_file()
+            except OSError:
+                continue
+
+            relPath: str = relDir + entry.name
+            if isDir:
+                if (
+                    (
+                        pruneExcludedDirs
+                        and excludePattern.search(prefix + relPath + '/')
+                    )
+                    or (respectGitignore and entry.name == '.git')
+                    or _isIgnored(absDir + entry.name, scopes, isDir=True)
+                ):
+                    continue
+
+                children.append((relPath + '/', len(scopes)))
+            elif isFile:
+                if excludePattern.search(prefix + relPath) or _isIgnored(
+                    absDir + entry.name, scopes, isDir=False
+                ):
+                    continue
+
+                key: str = (
+                    os.path.realpath(entry.path)
+                    if entry.is_symlink()
+                    else absDir + entry.name
+                )
+                if key not in seen:
+                    seen.add(key)
+                    children.append(Path(prefix + relPath))
+
+        stack.extend(reversed(children))
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import ast
 import copy
+import functools
 import re
+import sys
 from re import Match
 from typing import TYPE_CHECKING, overload
 
@@ -17,6 +19,11 @@ if TYPE_CHECKING:
     )
     from pydoclint.utils.violation import Violation
 
+# The maximum number of distinct type hints whose normalized forms are kept
+# (in each process). Type hints repeat a lot across a code base, so the hit
+# rate is usually high.
+TYPE_HINT_CACHE_SIZE = 8192
+
 
 def collectFuncArgs(node: FuncOrAsyncFuncDef) -> list[ast.arg]:
     """
@@ -418,10 +425,11 @@ def buildClassAttrToDefaultMapping(
     return attrToDefaultMapping
 
 
+@functools.lru_cache(maxsize=TYPE_HINT_CACHE_SIZE)
 def stripCommentsFromTypeHints(typeHint: str) -> str:
     """
     Strip comments from type hints to enable comparison between docstring type
-    hints and actual type hints.
+    hints and actual type hints. The results are memoized.
     """
     result: str
     try:
@@ -433,6 +441,44 @@ def stripCommentsFromTypeHints(typeHint: str) -> str:
     return result
 
 
+@functools.lru_cache(maxsize=TYPE_HINT_CACHE_SIZE)
+def canonicalizeTypeHint(typeHint: str) -> str:
+    """
+    Normalize a type hint, so that two type hints are considered the same
+    (by ``Arg``) if and only if their normalized forms are equal.
+
+    The quotes and backticks around the type hint are stripped, the type hint
+    is parsed and unparsed (so that formatting and comments do not matter),
+    and then, like in ``specialEqual()``, the trailing comment is dropped and
+    the double quotes are treated as single quotes. The results are memoized
+    and interned, so comparing them is cheap.
+    """
+    result: str = stripCommentsFromTypeHints(stripQuotes(typeHint))
+
+    # Only needed if the type hint cannot be parsed
+    if '#' in result:
+        result = result.partition('#')[0].rstrip()
+
+    if '\n' in result:
+        result = result.replace(' ', '').replace('\n', '')
+
+    return sys.intern(result.replace('"', "'"))
+
+
+def getTypeHintCacheInfo() -> functools._CacheInfo:
+    """
+    Get the hits, misses, and size of the type hint normalization cache (in
+    the current process), for tuning ``TYPE_HINT_CACHE_SIZE``.
+    """
+    return canonicalizeTypeHint.cache_info()
+
+
+def clearTypeHintCache() -> None:
+    """Clear the type hint normalization caches (in the current process)"""
+    canonicalizeTypeHint.cache_clear()
+    stripCommentsFromTypeHints.cache_clear()
+
+
 def isPrivateName(name: str) -> bool:
     """
     Return True if ``name`` is considered private.
@@ -6,6 +6,8 @@ import tokenize
 from io import StringIO
 from typing import TYPE_CHECKING
 
+from pydoclint.utils.scope_index import STATEMENT_LIST_FIELDS
+
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
@@ -14,6 +16,10 @@ if TYPE_CHECKING:
 ALLOWED_NOQA_LOCATIONS = {'definition', 'docstring'}
 DOC_CODE_PATTERN = re.compile(r'DOC\d{1,3}', flags=re.IGNORECASE)
 
+# A cheap line-based pre-filter: a line can only carry a noqa comment if it
+# has "noqa" somewhere after a "#" (``.`` does not match across lines)
+_NOQA_LINE_PATTERN = re.compile(r'#.*\bnoqa\b', flags=re.IGNORECASE)
+
 
 def parseNoqaComment(comment: str) -> set[str]:
     """
@@ -64,6 +70,10 @@ def collectNoqaCodesByLine(src: str) -> dict[int, set[str]]:
         Mapping from line numbers to the DOC codes declared on that line.
     """
     codesByLine: dict[int, set[str]] = {}
+    if _NOQA_LINE_PATTERN.search(src) is None:
+        # Most files have no noqa comments at all, so we skip tokenization
+        return codesByLine
+
     reader = StringIO(src).readline
 
     for token in tokenize.generate_tokens(reader):
@@ -84,6 +94,7 @@ def collectNativeNoqaSuppression(
         tree: ast.AST,
         codesByLine: dict[int, set[str]],
         location: str,
+        definitionLines: set[int] | None = None,
 ) -> dict[int, set[str]]:
     """
     Determine which DOC codes are suppressed for each definition line.
@@ -97,6 +108,9 @@ def collectNativeNoqaSuppression(
     location : str
         Where the NOQA comments are expected. Either ``definition`` or
         ``docstring``.
+    definitionLines : set[int] | None, default=None
+        If not None, only the definitions starting at these lines (such as
+        the lines of the violations found) are considered.
 
     Returns
     -------
@@ -115,8 +129,13 @@ def collectNativeNoqaSuppression(
         )
 
     definitionLineToCodes: dict[int, set[str]] = {}
+    if not codesByLine:
+        return definitionLineToCodes
 
     for node in _iterDocstringOwners(tree):
+        if definitionLines is not None and node.lineno not in definitionLines:
+            continue
+
         suppressionLine = (
             node.lineno
             if location == 'definition'
@@ -142,13 +161,23 @@ def codeIsSuppressed(code: str, suppressedCodes: set[str]) -> bool:
 
 
 def _iterDocstringOwners(tree: ast.AST) -> Iterable[ClassOrFunctionDef]:
-    """Yield all AST nodes that can own docstrings."""
-    for node in ast.walk(tree):
+    """
+    Yield all AST nodes that can own docstrings. Only the statement lists are
+    traversed, because definitions cannot appear inside expressions.
+    """
+    todo: list[ast.AST] = [tree]
+    while todo:
+        node = todo.pop()
         if isinstance(
             node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
         ):
             yield node
 
+        for fieldName in STATEMENT_LIST_FIELDS:
+            field = getattr(node, fieldName, None)
+            if isinstance(field, list):
+                todo.extend(field)
+
 
 def _getDocstringEndLine(node: ast.AST) -> int | None:
     """Return the line number where the docstring ends, if present."""
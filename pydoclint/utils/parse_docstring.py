@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import functools
 import re
-
-from docstring_parser import ParseError
-from docstring_parser.numpydoc import DEFAULT_SECTIONS
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from pydoclint.utils.doc import Doc
+from pydoclint.utils.profiling import timePhase
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from docstring_parser import ParseError
 
 _SPHINX_KEYWORDS = (
     ':param ',
@@ -26,9 +32,32 @@ _GOOGLE_KEYWORDS = (
     'Notes:',
 )
 
-_ALLOWED_NUMPY_SECTION_NAMES = frozenset(
-    section.title for section in DEFAULT_SECTIONS
-)
+# Section headers (case-insensitive) that indicate the numpy style when they
+# are followed by a line of dashes
+_NUMPY_HEADERS = frozenset({
+    'arg',
+    'args',
+    'argument',
+    'arguments',
+    'param',
+    'parameter',
+    'parameters',
+    'return',
+    'returns',
+    'yield',
+    'yields',
+    'raise',
+    'raises',
+    'example',
+    'examples',
+    'note',
+    'notes',
+    'see also',
+    'reference',
+    'references',
+})
+
+MIN_NUMPY_UNDERLINE_LENGTH = 3
 
 # Match numpydoc section blocks: any non-empty title line followed by 3+
 # dashes. Colon-suffixed Google-style headings are intentionally ignored.
@@ -37,108 +66,227 @@ _NUMPY_SECTION_HEADER_PATTERN = re.compile(
     re.MULTILINE,
 )
 
+# The maximum number of distinct (docstring, style, checkStyleMismatch,
+# parser) combinations whose parsing results are kept in memory
+DOCSTRING_PARSE_CACHE_SIZE = 4096
 
-def _containsNumpyStylePattern(docstring: str) -> bool:
-    # Check if docstring contains numpy-style section headers with dashes.
-    #
-    # Looks for patterns like:
-    # Returns
-    # -------
-    #
-    # Args:
-    # -----
-    #
-    # Examples
-    # --------
-
-    # Pattern to match section headers followed by dashes on the next line
-    # Matches common numpy docstring sections followed by 3+ dashes
-    sections = (
-        r'Args?|Arguments?|Parameters?|Param|Returns?|Return|Yields?|Yield|'
-        r'Raises?|Raise|Examples?|Example|Notes?|Note|See Also|References?|'
-        r'Reference'
-    )
-    pattern = rf'^\s*({sections})\s*:?\s*\n\s*-{{3,}}\s*$'
-    return bool(re.search(pattern, docstring, re.MULTILINE | re.IGNORECASE))
 
+@dataclass(frozen=True, slots=True)
+class StyleEvidence:
+    """Whether a docstring contains the patterns of each docstring style"""
 
-def _containsSphinxStylePattern(docstring: str) -> bool:
-    """
-    Check if docstring contains Sphinx-style field lists at base indentation.
+    numpy: bool
+    google: bool
+    sphinx: bool
 
-    Only lines that have the same leading indentation as the docstring
-    definition (i.e., the opening triple quotes) count as valid Sphinx
-    directives. Lines with more or fewer leading spaces are ignored.
+
+def classifyDocstringStyle(docstring: str) -> StyleEvidence:
+    """
+    Look for the patterns of all 3 docstring styles in a single pass over the
+    lines of the docstring.
+
+    - Numpy: a section header (such as "Returns" or "Parameters:") followed
+      by a line of 3+ dashes, optionally with blank lines in between
+    - Google: a line starting with a section header such as "Args:", at the
+      base indentation of the docstring
+    - Sphinx: a line starting with a field such as ":param ", at the base
+      indentation of the docstring
+
+    The base indentation (which approximates the column of the opening
+    triple quotes) is the smallest indentation across non-empty lines, so
+    the Google and Sphinx evidence can only be decided after the last line.
+
+    Parameters
+    ----------
+    docstring : str
+        The docstring
+
+    Returns
+    -------
+    StyleEvidence
+        Whether the docstring contains the patterns of each style
     """
-    leadingIndent = _detectDocstringIndent(docstring)
+    hasNumpyPattern: bool = False
+    afterNumpyHeader: bool = False  # only blank lines since a section header
+    colonAllowed: bool = False  # "Returns" can be followed by a lone ":"
+    baseIndent: int | None = None
+    googleIndent: int | None = None  # the smallest one of such lines
+    sphinxIndent: int | None = None  # the smallest one of such lines
+
     for line in docstring.splitlines():
-        stripped = line.lstrip()
-        if stripped == '':
+        lstripped = line.lstrip()
+        if lstripped == '':
             continue
 
-        currentIndent = len(line) - len(stripped)
-        if currentIndent != leadingIndent:
+        indent = len(line) - len(lstripped)
+        if baseIndent is None or indent < baseIndent:
+            baseIndent = indent
+
+        if lstripped.startswith(_GOOGLE_KEYWORDS) and (
+            googleIndent is None or indent < googleIndent
+        ):
+            googleIndent = indent
+
+        if lstripped.startswith(_SPHINX_KEYWORDS) and (
+            sphinxIndent is None or indent < sphinxIndent
+        ):
+            sphinxIndent = indent
+
+        if hasNumpyPattern:
             continue
 
-        for keyword in _SPHINX_KEYWORDS:
-            if stripped.startswith(keyword):
-                return True
+        stripped = lstripped.rstrip()
+        if (
+            afterNumpyHeader
+            and len(stripped) >= MIN_NUMPY_UNDERLINE_LENGTH
+            and not stripped.strip('-')
+        ):
+            hasNumpyPattern = True
+        elif afterNumpyHeader and colonAllowed and stripped == ':':
+            colonAllowed = False
+        else:
+            afterNumpyHeader, colonAllowed = _matchNumpySectionHeader(stripped)
+
+    return StyleEvidence(
+        numpy=hasNumpyPattern,
+        google=googleIndent is not None and googleIndent == baseIndent,
+        sphinx=sphinxIndent is not None and sphinxIndent == baseIndent,
+    )
+
 
-    return False
+def _matchNumpySectionHeader(stripped: str) -> tuple[bool, bool]:
+    # Returns whether the (stripped) line is a numpy section header, and
+    # whether a colon can still follow it
+    if stripped.endswith(':'):
+        return stripped[:-1].rstrip().casefold() in _NUMPY_HEADERS, False
 
+    isHeader: bool = stripped.casefold() in _NUMPY_HEADERS
+    return isHeader, isHeader
 
-def _containsGoogleStylePattern(docstring: str) -> bool:
+
+def parseDocstring(
+        docstring: str,
+        userSpecifiedStyle: str,
+        parser: str = 'compat',
+) -> tuple[Doc, ParseError | None, bool]:
     """
-    Check if docstring contains Google-style section headers at base indent.
+    Parse docstring in all 3 docstring styles and return the one that is parsed
+    with the most likely style.
+
+    The results are memoized (see ``_parseDocstringCached()``), so the
+    returned ``Doc`` object may be shared and must not be mutated.
     """
-    leadingIndent = _detectDocstringIndent(docstring)
-    for line in docstring.splitlines():
-        stripped = line.lstrip()
-        if stripped == '':
-            continue
+    return _parseDocstringCached(
+        docstring,
+        userSpecifiedStyle,
+        checkStyleMismatch=True,
+        parser=parser,
+    )
 
-        currentIndent = len(line) - len(stripped)
-        if currentIndent != leadingIndent:
-            continue
 
-        for keyword in _GOOGLE_KEYWORDS:
-            if stripped.startswith(keyword):
-                return True
+def parseDocstringInGivenStyle(
+        docstring: str,
+        style: str,
+        parser: str = 'compat',
+) -> tuple[Doc, ParseError | None]:
+    """
+    Parse the docstring and return the content of the doc.
+
+    The results are memoized (see ``_parseDocstringCached()``), so the
+    returned ``Doc`` object may be shared and must not be mutated.
+    """
+    with timePhase('docstring parsing'):
+        doc, exception, _ = _parseDocstringCached(
+            docstring,
+            style,
+            checkStyleMismatch=False,
+            parser=parser,
+        )
 
-    return False
+    return doc, exception
 
 
-def _detectDocstringIndent(docstring: str) -> int:
+def getDocstringParseCacheInfo() -> functools._CacheInfo:
     """
-    Detect the leading indentation level of a docstring.
-
-    This approximates the column where the opening triple quotes are placed by
-    measuring the smallest indentation across non-empty lines.
+    Get the hits, misses, and size of the docstring parsing cache (in the
+    current process), for tuning ``DOCSTRING_PARSE_CACHE_SIZE``.
     """
-    indent: int | None = None
-    for line in docstring.splitlines():
-        stripped = line.lstrip()
-        if stripped == '':
-            continue
+    return _parseDocstringCached.cache_info()
 
-        currentIndent = len(line) - len(stripped)
-        if indent is None or currentIndent < indent:
-            indent = currentIndent
 
-    return 0 if indent is None else indent
+def clearDocstringParseCache() -> None:
+    """Clear the docstring parsing cache (in the current process)"""
+    _parseDocstringCached.cache_clear()
 
 
-def parseDocstring(
+@functools.lru_cache(maxsize=DOCSTRING_PARSE_CACHE_SIZE)
+def _parseDocstringCached(
+        docstring: str,
+        style: str,
+        *,
+        checkStyleMismatch: bool,
+        parser: str,
+) -> tuple[Doc, ParseError | None, bool]:
+    # Generated code, overloads, and mixins often repeat the same docstring
+    # many times, so the parsing results are keyed by the docstring content.
+    # The cache lives for the whole run, so it is shared across files.
+    if checkStyleMismatch:
+        return _parseDocstringUncached(docstring, style, parser)
+
+    doc, exception = _parseDocstringInGivenStyleUncached(
+        docstring,
+        style,
+        parser,
+    )
+    return doc, exception, False
+
+
+def _parseDocstringUncached(
+        docstring: str,
+        userSpecifiedStyle: str,
+        parser: str,
+) -> tuple[Doc, ParseError | None, bool]:
+    return parseDocstringInDetectedStyle(
+        docstring,
+        userSpecifiedStyle,
+        parseInGivenStyle=lambda style: parseDocstringInGivenStyle(
+            docstring,
+            style,
+            parser,
+        ),
+    )
+
+
+def parseDocstringInDetectedStyle(
         docstring: str,
         userSpecifiedStyle: str,
+        parseInGivenStyle: Callable[[str], tuple[Doc, ParseError | None]],
 ) -> tuple[Doc, ParseError | None, bool]:
     """
-    Parse docstring in all 3 docstring styles and return the one that is parsed
-    with the most likely style.
+    Detect the most likely style of the docstring, parse it in that style
+    (with ``parseInGivenStyle``), and tell whether the style mismatches the
+    user-specified one.
+
+    Parameters
+    ----------
+    docstring : str
+        The docstring
+    userSpecifiedStyle : str
+        The docstring style specified by the user
+    parseInGivenStyle : Callable[[str], tuple[Doc, ParseError | None]]
+        A function that parses the docstring in the given style, so that the
+        callers can decide how the parsing results are stored
+
+    Returns
+    -------
+    tuple[Doc, ParseError | None, bool]
+        The parsed docstring, the parsing error (if any), and whether there
+        is a style mismatch
     """
-    isLikelyNumpy: bool = _containsNumpyStylePattern(docstring)
-    isLikelyGoogle: bool = _containsGoogleStylePattern(docstring)
-    isLikelySphinx: bool = _containsSphinxStylePattern(docstring)
+    evidence: StyleEvidence = classifyDocstringStyle(docstring)
+    isLikelyNumpy: bool = evidence.numpy
+    isLikelyGoogle: bool = evidence.google
+    isLikelySphinx: bool = evidence.sphinx
 
     if isLikelyNumpy:
         # Numpy-style headers with dashes are strong indicators; ignore other
@@ -160,7 +308,7 @@ def parseDocstring(
     if len(matchedStyles) == 1:
         detectedStyle = matchedStyles[0]
         if detectedStyle == userSpecifiedStyle:
-            doc, exc = parseDocstringInGivenStyle(docstring, detectedStyle)
+            doc, exc = parseInGivenStyle(detectedStyle)
             # The Google parser raises hard errors when sections are malformed,
             # which is a strong signal the docstring is effectively written in
             # a different style. Numpy/Sphinx parsers are more permissive, so
@@ -169,34 +317,36 @@ def parseDocstring(
             styleMismatch = exc is not None and detectedStyle == 'google'
             return doc, exc, styleMismatch
 
-        doc, exc = parseDocstringInGivenStyle(docstring, detectedStyle)
+        doc, exc = parseInGivenStyle(detectedStyle)
         styleMismatch = True
         return doc, exc, styleMismatch
 
     if len(matchedStyles) == 0:
-        doc, exc = parseDocstringInGivenStyle(docstring, userSpecifiedStyle)
+        doc, exc = parseInGivenStyle(userSpecifiedStyle)
         styleMismatch = False
         return doc, exc, styleMismatch
 
-    doc, exc = parseDocstringInGivenStyle(docstring, userSpecifiedStyle)
+    doc, exc = parseInGivenStyle(userSpecifiedStyle)
     styleMismatch = True
     return doc, exc, styleMismatch
 
 
-def parseDocstringInGivenStyle(
+def _parseDocstringInGivenStyleUncached(
         docstring: str,
         style: str,
+        parser: str,
 ) -> tuple[Doc, ParseError | None]:
-    """Parse the docstring and return the content of the doc."""
+    from docstring_parser import ParseError  # noqa: PLC0415
+
     exception: ParseError | None = None
     try:
         if style == 'numpy':
             _validateNumpySectionHeaders(docstring)
 
-        doc: Doc = Doc(docstring=docstring, style=style)
+        doc: Doc = Doc(docstring=docstring, style=style, parser=parser)
         _validateParsedDoc(doc)
     except ParseError as exc:
-        doc = Doc(docstring='', style=style)
+        doc = Doc(docstring='', style=style, parser=parser)
         exception = exc
 
     return doc, exception
@@ -206,6 +356,8 @@ def _validateParsedDoc(doc: Doc) -> None:
     """
     Validate parser output before pydoclint converts it into internal args.
     """
+    from docstring_parser import ParseError  # noqa: PLC0415
+
     for param in doc.parsed.params:
         if not param.arg_name:
             raise ParseError('Parsed docstring parameter has an empty name')
@@ -219,11 +371,14 @@ def _validateNumpySectionHeaders(docstring: str) -> None:
     """
     Reject unsupported numpy-style section headers before parser fallback.
     """
+    from docstring_parser import ParseError  # noqa: PLC0415
+
+    allowedSectionNames: frozenset[str] = _getAllowedNumpySectionNames()
     unsupportedSectionNames: list[str] = []
     for match in _NUMPY_SECTION_HEADER_PATTERN.finditer(docstring):
         sectionName = match.group(1)
         if (
-            sectionName not in _ALLOWED_NUMPY_SECTION_NAMES
+            sectionName not in allowedSectionNames
             and sectionName not in unsupportedSectionNames
         ):
             unsupportedSectionNames.append(sectionName)
@@ -241,3 +396,10 @@ def _validateNumpySectionHeaders(docstring: str) -> None:
         raise ParseError(
             f'Unsupported numpy docstring sections: {sectionNames}'
         )
+
+
+@functools.cache
+def _getAllowedNumpySectionNames() -> frozenset[str]:
+    from docstring_parser.numpydoc import DEFAULT_SECTIONS  # noqa: PLC0415
+
+    return frozenset(section.title for section in DEFAULT_SECTIONS)
@@ -0,0 +1,374 @@
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+T = TypeVar('T')
+
+# The phase of the time spent in a file but outside all the other phases
+OTHER_PHASE = 'other'
+
+# How many of the slowest files and definitions are reported
+DEFAULT_TOP_N = 10
+
+# The profiler of the current process, if profiling is on. The hot paths
+# (such as the docstring parsing) only check whether it's None, so that
+# profiling costs almost nothing when it's off.
+activeProfiler: Profiler | None = None
+
+_NO_OP: contextlib.nullcontext[None] = contextlib.nullcontext()
+
+_MICROSECONDS_PER_SECOND = 1_000_000
+
+
+class Profiler:
+    """
+    Collect the wall and CPU time of the phases of checking each file (such
+    as reading, parsing, visiting, and docstring parsing), and of checking
+    each class or function definition.
+
+    The phases can be nested (for example, docstring parsing happens while
+    visiting), and the time of each phase excludes that of the phases nested
+    in it, so the times of all phases of a file add up to the file's time.
+
+    Parameters
+    ----------
+    recordTrace : bool, default=False
+        Whether to also record each file, phase, and definition as a span
+        (a Chrome trace event; see ``writeChromeTrace()``)
+    """
+
+    def __init__(self, recordTrace: bool = False) -> None:  # noqa: FBT001, FBT002
+        self.recordTrace: bool = recordTrace
+        self.pid: int = os.getpid()
+
+        # The spans, in the Chrome trace event format
+        self.traceEvents: list[dict[str, Any]] = []
+
+        # [wall, cpu] seconds of each (file, phase); the phases outside of
+        # all files (such as the file discovery) have the file ''
+        self.phaseTimes: dict[tuple[str, str], list[float]] = {}
+
+        # (wall, cpu) seconds of each file
+        self.fileTimes: dict[str, tuple[float, float]] = {}
+
+        # (wall seconds, file, name, line number) of each definition
+        self.definitionTimes: list[tuple[float, str, str, int]] = []
+
+        self.currentFile: str = ''
+
+        # The open phases: [phase, wall start, cpu start, nested wall,
+        # nested cpu]
+        self._stack: list[list[Any]] = []
+
+    @contextlib.contextmanager
+    def profileFile(self, filename: str) -> Iterator[None]:
+        """Time checking a file; the phases within it are attributed to it"""
+        self.currentFile = filename
+        wallStart: float = time.perf_counter()
+        cpuStart: float = time.process_time()
+        try:
+            with self.profilePhase(OTHER_PHASE):
+                yield
+        finally:
+            self.fileTimes[filename] = (
+                time.perf_counter() - wallStart,
+                time.process_time() - cpuStart,
+            )
+            self.currentFile = ''
+            if self.recordTrace:
+                self._addSpan(filename, 'file', wallStart, {})
+
+    @contextlib.contextmanager
+    def profilePhase(
+            self,
+            phase: str,
+            filename: str | None = None,
+    ) -> Iterator[None]:
+        """
+        Time a phase of checking the current file (or of ``filename``, such
+        as for the phases outside of checking the file itself)
+        """
+        file: str = self.currentFile if filename is None else filename
+        frame: list[Any] = [
+            phase,
+            time.perf_counter(),
+            time.process_time(),
+            0.0,
+            0.0,
+        ]
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            wall: float = time.perf_counter() - frame[1]
+            cpu: float = time.process_time() - frame[2]
+            times = self.phaseTimes.setdefault((file, phase), [0.0, 0.0])
+            times[0] += wall - frame[3]
+            times[1] += cpu - frame[4]
+            if self._stack:  # exclude this phase from the enclosing one
+                self._stack[-1][3] += wall
+                self._stack[-1][4] += cpu
+
+            # (The "other" span would be the same as the file's span)
+            if self.recordTrace and phase != OTHER_PHASE:
+                self._addSpan(phase, 'phase', frame[1], {'file': file})
+
+    def recordDefinition(self, name: str, lineNum: int, start: float) -> None:
+        """
+        Record how long checking a class or function definition took, from
+        ``start`` (a ``time.perf_counter()`` value) until now
+        """
+        wall: float = time.perf_counter() - start
+        self.definitionTimes.append((wall, self.currentFile, name, lineNum))
+        if self.recordTrace:
+            self._addSpan(
+                name,
+                'definition',
+                start,
+                {'file': self.currentFile, 'line': lineNum},
+            )
+
+    def _addSpan(
+            self,
+            name: str,
+            category: str,
+            start: float,
+            args: dict[str, Any],
+    ) -> None:
+        # A "complete" event. The perf_counter() clock is system-wide (on
+        # Linux, macOS, and Windows), so the spans from the worker processes
+        # line up with those of the main process.
+        self.traceEvents.append({
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': start * _MICROSECONDS_PER_SECOND,
+            'dur': (time.perf_counter() - start) * _MICROSECONDS_PER_SECOND,
+            'pid': self.pid,
+            'tid': self.pid,
+            'args': args,
+        })
+
+    def drain(self) -> dict[str, Any]:
+        """
+        Take the collected data out (such as to send it from a worker process
+        to the main process, which ``merge()``s it)
+        """
+        data: dict[str, Any] = self.toJson()
+        self.phaseTimes = {}
+        self.fileTimes = {}
+        self.definitionTimes = []
+        self.traceEvents = []
+        return data
+
+    def merge(self, data: dict[str, Any]) -> None:
+        """Merge the data from ``drain()`` or ``toJson()`` into this one"""
+        phaseTimesOfFiles: list[tuple[str, dict[str, list[float]]]] = [
+            ('', data['phases'])
+        ]
+        for file, phases in data['files'].items():
+            self.fileTimes[file] = (phases['wall'], phases['cpu'])
+            phaseTimesOfFiles.append((file, phases['phases']))
+
+        for file, phaseTimes in phaseTimesOfFiles:
+            for phase, (wall, cpu) in phaseTimes.items():
+                times = self.phaseTimes.setdefault((file, phase), [0.0, 0.0])
+                times[0] += wall
+                times[1] += cpu
+
+        self.definitionTimes.extend(
+            (_['wall'], _['file'], _['name'], _['line'])
+            for _ in data['definitions']
+        )
+        self.traceEvents.extend(data['traceEvents'])
+
+    def toJson(self) -> dict[str, Any]:
+        """Return the raw data, in a JSON-serializable form"""
+        files: dict[str, dict[str, Any]] = {
+            file: {'wall': wall, 'cpu': cpu, 'phases': {}}
+            for file, (wall, cpu) in self.fileTimes.items()
+        }
+        phasesOutsideFiles: dict[str, list[float]] = {}
+        for (file, phase), (wall, cpu) in self.phaseTimes.items():
+            if file == '':
+                phasesOutsideFiles[phase] = [wall, cpu]
+                continue
+
+            files.setdefault(file, {'wall': 0.0, 'cpu': 0.0, 'phases': {}})
+            files[file]['phases'][phase] = [wall, cpu]
+
+        return {
+            'files': files,
+            'phases': phasesOutsideFiles,
+            'definitions': [
+                {'wall': wall, 'file': file, 'name': name, 'line': line}
+                for wall, file, name, line in self.definitionTimes
+            ],
+            'traceEvents': self.traceEvents,
+        }
+
+    def formatReport(self, topN: int = DEFAULT_TOP_N) -> str:
+        """
+        Format the aggregate time of each phase, and the slowest files and
+        definitions, as a table.
+
+        Parameters
+        ----------
+        topN : int, default=DEFAULT_TOP_N
+            How many of the slowest files and definitions to list
+
+        Returns
+        -------
+        str
+            The report
+        """
+        totals: dict[str, list[float]] = {}
+        for (_, phase), (wall, cpu) in self.phaseTimes.items():
+            total = totals.setdefault(phase, [0.0, 0.0])
+            total[0] += wall
+            total[1] += cpu
+
+        totalWall: float = sum(_[0] for _ in totals.values())
+        totalCpu: float = sum(_[1] for _ in totals.values())
+
+        lines: list[str] = [
+            f'{"phase":<20} {"wall (s)":>10} {"cpu (s)":>10} {"wall %":>7}'
+        ]
+        for phase, (wall, cpu) in sorted(
+            totals.items(), key=lambda _: _[1][0], reverse=True
+        ):
+            share: float = 100 * wall / totalWall if totalWall else 0.0
+            lines.append(
+                f'{phase:<20} {wall:>10.3f} {cpu:>10.3f} {share:>6.1f}%'
+            )
+
+        lines.append(
+            f'{"total":<20} {totalWall:>10.3f} {totalCpu:>10.3f}'
+            f' ({len(self.fileTimes)} files)'
+        )
+
+        slowestFiles = sorted(
+            self.fileTimes.items(), key=lambda _: _[1][0], reverse=True
+        )[:topN]
+        lines.extend(['', f'The {len(slowestFiles)} slowest files (wall s):'])
+        lines.extend(
+            f'{wall:>10.4f}  {file}' for file, (wall, _) in slowestFiles
+        )
+
+        slowestDefinitions = sorted(self.definitionTimes, reverse=True)[:topN]
+        lines.extend([
+            '',
+            f'The {len(slowestDefinitions)} slowest definitions (wall s):',
+        ])
+        lines.extend(
+            f'{wall:>10.4f}  {file}:{line} {name}'
+            for wall, file, name, line in slowestDefinitions
+        )
+        return '\n'.join(lines)
+
+
+def timePhase(
+        phase: str,
+        filename: str | None = None,
+) -> contextlib.AbstractContextManager[None]:
+    """
+    Time a phase (of the current file, or of ``filename``) with the active
+    profiler, if profiling is on; otherwise, this is a shared no-op context
+    manager, which is cheap enough for the hot paths.
+    """
+    if activeProfiler is None:
+        return _NO_OP
+
+    return activeProfiler.profilePhase(phase, filename)
+
+
+def timeFile(filename: str) -> contextlib.AbstractContextManager[None]:
+    """Time checking a file with the active profiler, like ``timePhase()``"""
+    if activeProfiler is None:
+        return _NO_OP
+
+    return activeProfiler.profileFile(filename)
+
+
+def timeIteration(items: Iterable[T], phase: str) -> Iterator[T]:
+    """
+    Time each step of the iteration over ``items`` (such as the lazy file
+    discovery) as a phase with the active profiler, if profiling is on
+    """
+    iterator: Iterator[T] = iter(items)
+    done = object()
+    while True:
+        with timePhase(phase):
+            item = next(iterator, done)
+
+        if item is done:
+            return
+
+        yield item  # type: ignore[misc]
+
+
+def writeChromeTrace(
+        traceEvents: Iterable[dict[str, Any]],
+        path: Path | str,
+) -> None:
+    """
+    Write the spans to a JSON file in the Chrome trace event format, which
+    can be opened in ``chrome://tracing`` or in Perfetto
+    (https://ui.perfetto.dev). The spans of each process (the main process
+    and each worker) are shown in a separate row.
+
+    Parameters
+    ----------
+    traceEvents : Iterable[dict[str, Any]]
+        The spans (such as ``Profiler.traceEvents``)
+    path : Path | str
+        The JSON file to write (atomically, so that it can be opened while a
+        daemon keeps updating it)
+
+
+    Returns
+    -------
+    None
+    """
+    events: list[dict[str, Any]] = list(traceEvents)
+    mainPid: int = os.getpid()
+    processNames: list[dict[str, Any]] = [
+        {
+            'name': 'process_name',
+            'ph': 'M',
+            'pid': pid,
+            'args': {
+                'name': (
+                    'pydoclint'
+                    if pid == mainPid
+                    else f'pydoclint worker (pid {pid})'
+                ),
+            },
+        }
+        for pid in sorted({_['pid'] for _ in events})
+    ]
+
+    path = Path(path)
+    with tempfile.NamedTemporaryFile(
+        'w',
+        encoding='utf-8',
+        dir=path.parent,
+        suffix='.tmp',
+        delete=False,
+    ) as fp:
+        json.dump(
+            {'traceEvents': processNames + events, 'displayTimeUnit': 'ms'},
+            fp,
+        )
+
+    Path(fp.name).replace(path)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import ast
+import functools
 import json
 
 from pydoclint.utils.edge_case_error import EdgeCaseError
@@ -9,12 +10,35 @@ from pydoclint.utils.unparser_custom import unparseName
 
 MIN_TUPLE_ANNOTATION_LENGTH = len('tuple[]')  # shortest valid tuple annotation
 
+# The maximum number of distinct annotation strings whose syntax trees are
+# kept (in each process)
+ANNOTATION_PARSE_CACHE_SIZE = 4096
 
-class ReturnAnnotation:
-    """A class to hold the return annotation in a function's signature"""
 
-    def __init__(self, annotation: str | None) -> None:
+class ReturnAnnotation:
+    """
+    A class to hold the return annotation in a function's signature.
+
+    Besides the annotation string (used in the violation messages), it keeps
+    the annotation's syntax tree (see ``node``), so that the tuple and the
+    Generator/Iterator arguments can be extracted without parsing the string.
+
+    Parameters
+    ----------
+    annotation : str | None
+        The annotation string
+    node : ast.expr | None, default=None
+        The syntax tree of the annotation, if it comes from a function
+        signature. If None, the annotation string is parsed when needed.
+    """
+
+    def __init__(
+            self,
+            annotation: str | None,
+            node: ast.expr | None = None,
+    ) -> None:
         self.annotation: str | None = stripQuotes(annotation)
+        self._node: ast.expr | None = node
 
     def __str__(self) -> str:
         return f'ReturnAnnotation(annotation={json.dumps(self.annotation)})'
@@ -22,6 +46,31 @@ class ReturnAnnotation:
     def __repr__(self) -> str:
         return self.__str__()
 
+    @classmethod
+    def fromAstNode(cls, node: ast.expr | None) -> ReturnAnnotation:
+        """Construct a ReturnAnnotation from the return annotation node"""
+        return ReturnAnnotation(annotation=unparseName(node), node=node)
+
+    @functools.cached_property
+    def node(self) -> ast.expr | None:
+        """
+        The syntax tree of the annotation (after stripping the quotes), or
+        None if there is no annotation or it is not a valid expression.
+        """
+        # The quotes in the annotation (such as in ``-> "MyClass"``) are
+        # stripped from ``self.annotation``, so the original syntax tree can
+        # only be used directly if it does not contain any strings
+        if self._node is not None and not _containsStrings(self._node):
+            return self._node
+
+        if self.annotation is None:
+            return None
+
+        try:
+            return parseAnnotation(self.annotation)
+        except (SyntaxError, TypeError):
+            return None
+
     def decompose(self) -> list[str]:
         """
         Numpy style allows decomposing the returning tuple into individual
@@ -45,6 +94,7 @@ class ReturnAnnotation:
             assert (
                 self.annotation is not None
             )  # narrow type for static checkers
+            assert isinstance(self.node, ast.Subscript)  # narrow type
 
             if not self.annotation.endswith(']'):
                 raise EdgeCaseError('Return annotation not ending with `]`')
@@ -52,55 +102,76 @@ class ReturnAnnotation:
             if len(self.annotation) < MIN_TUPLE_ANNOTATION_LENGTH:
                 raise EdgeCaseError(f'Impossible annotation {self.annotation}')
 
-            if self.annotation.lower() == 'tuple[]':
-                return []
-
-            insideTuple: str = self.annotation[6:-1]
-            if insideTuple.endswith('...'):  # like this: Tuple[int, ...]
+            insideTuple: ast.expr = self.node.slice
+            if _endsWithEllipsis(insideTuple):  # like this: Tuple[int, ...]
                 # because we don't know the tuple's length
                 return [self.annotation]
 
-            parsedBody0 = ast.parse(insideTuple).body[0]
-            assert isinstance(parsedBody0, ast.Expr), "Shouldn't have happened"
-
             if isinstance(
-                parsedBody0.value, (ast.Attribute, ast.Name)
+                insideTuple, (ast.Attribute, ast.Name)
             ):  # such as Tuple[int]
-                return [insideTuple]
+                return [unparseName(insideTuple)]
 
-            if isinstance(
-                parsedBody0.value, ast.Tuple
-            ):  # like Tuple[int, str]
-                elts: list[ast.expr] = parsedBody0.value.elts
-                return [unparseName(_) for _ in elts]
+            if isinstance(insideTuple, ast.Tuple):  # like Tuple[int, str]
+                return [unparseName(_) for _ in insideTuple.elts]
 
             raise EdgeCaseError('decompose(): This should not have happened')
 
         return self.putAnnotationInList()
 
     def _isTuple(self) -> bool:
-        try:
-            assert (
-                self.annotation is not None
-            )  # narrow type for static checkers
-            parsedBody0 = ast.parse(self.annotation).body[0]
-            if not isinstance(parsedBody0, ast.Expr):
-                return False
+        node: ast.expr | None = self.node
+        return (
+            isinstance(node, ast.Subscript)
+            and isinstance(node.value, ast.Name)
+            and node.value.id in {'tuple', 'Tuple'}
+        )
 
-            parsedValue = parsedBody0.value
-            if not isinstance(parsedValue, ast.Subscript):
-                return False
+    def putAnnotationInList(self) -> list[str]:
+        """Put annotation string in a list"""
+        return [] if self.annotation is None else [self.annotation]
+
+
+@functools.lru_cache(maxsize=ANNOTATION_PARSE_CACHE_SIZE)
+def parseAnnotation(annotation: str) -> ast.expr:
+    """
+    Parse an annotation string into its syntax tree. The results are
+    memoized, so the returned tree is shared and must not be mutated.
+
+    Parameters
+    ----------
+    annotation : str
+        The annotation string
+
+    Returns
+    -------
+    ast.expr
+        The syntax tree of the annotation
+
+    Raises
+    ------
+    TypeError
+        If the annotation is not a single expression
+    """
+    body: list[ast.stmt] = ast.parse(annotation).body
+    if len(body) == 0 or not isinstance(body[0], ast.Expr):
+        raise TypeError('Return annotation must parse to an expression')
 
-            parsedValueName = parsedValue.value
-            if not isinstance(parsedValueName, ast.Name):
-                return False
+    return body[0].value
 
-            annoHead = parsedValueName.id
-        except (TypeError, IndexError, AssertionError):
+
+def _containsStrings(node: ast.expr) -> bool:
+    return any(
+        isinstance(_, ast.Constant) and isinstance(_.value, (str, bytes))
+        for _ in ast.walk(node)
+    )
+
+
+def _endsWithEllipsis(node: ast.expr) -> bool:
+    if isinstance(node, ast.Tuple):
+        if len(node.elts) == 0:
             return False
-        else:
-            return annoHead in {'tuple', 'Tuple'}
 
-    def putAnnotationInList(self) -> list[str]:
-        """Put annotation string in a list"""
-        return [] if self.annotation is None else [self.annotation]
+        node = node.elts[-1]
+
+    return isinstance(node, ast.Constant) and node.value is Ellipsis
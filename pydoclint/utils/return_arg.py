@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ReturnArg:
     """A class to hold one return argument in the docstring's return section"""
 
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
 import ast
+from dataclasses import dataclass
 from enum import Enum, auto
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Generator
+    from collections.abc import Generator
+
+    from pydoclint.utils.ast_types import FuncOrAsyncFuncDef
 
 from pydoclint.utils import walk
-from pydoclint.utils.ast_types import BlockType, FuncOrAsyncFuncDef
 from pydoclint.utils.generic import stringStartsWith
+from pydoclint.utils.scope_index import ScopeIndex
 from pydoclint.utils.unparser_custom import unparseName
 
 ReturnType = type[ast.Return]
@@ -18,6 +21,10 @@ YieldAndYieldFromTypes = tuple[type[ast.Yield], type[ast.YieldFrom]]
 FuncOrAsyncFuncTypes = tuple[type[ast.FunctionDef], type[ast.AsyncFunctionDef]]
 FuncOrAsyncFunc = (ast.FunctionDef, ast.AsyncFunctionDef)
 
+ASSERTION_ERROR_FROM_ASSERT = (
+    'AssertionError (implicitly from the `assert` statement)'
+)
+
 
 class GeneratorAnnotationKind(Enum):
     """Supported generator-like return annotation kinds."""
@@ -94,24 +101,100 @@ def hasIteratorOrIterableAsReturnAnnotation(node: FuncOrAsyncFuncDef) -> bool:
     )
 
 
-def hasYieldStatements(node: FuncOrAsyncFuncDef) -> bool:
-    """Check whether the function node has any yield statements"""
+@dataclass(frozen=True)
+class FunctionBodySummary:
+    """
+    The return/yield/raise/assert information of a function body, excluding
+    the bodies of the nested functions (which have their own summaries)
+    """
 
-    def isThisNodeAYieldStmt(node_: ast.AST) -> bool:
-        return isinstance(node_, ast.Expr) and isinstance(
-            node_.value, (ast.Yield, ast.YieldFrom)
-        )
+    hasYield: bool
+    hasReturn: bool
+    hasBareReturn: bool
+    hasRaise: bool
+    hasAssert: bool
+    raisedExceptions: frozenset[str]  # not including those from ``assert``
+
+    def getRaisedExceptions(
+            self,
+            shouldDeclareAssertError: bool = False,  # noqa: FBT001, FBT002
+    ) -> list[str]:
+        """Get the raised exceptions as a sorted list"""
+        if shouldDeclareAssertError and self.hasAssert:
+            return sorted(
+                self.raisedExceptions | {ASSERTION_ERROR_FROM_ASSERT}
+            )
 
-    return _hasExpectedStatements(node, isThisNodeAYieldStmt)
+        return sorted(self.raisedExceptions)
 
 
-def hasReturnStatements(node: FuncOrAsyncFuncDef) -> bool:
-    """Check whether the function node has any return statements"""
+def summarizeFunctionBody(
+        node: FuncOrAsyncFuncDef,
+        summaries: dict[FuncOrAsyncFuncDef, FunctionBodySummary] | None = None,
+        scopeIndex: ScopeIndex | None = None,
+) -> FunctionBodySummary:
+    """
+    Summarize the body of a function node, by going through the statements
+    that the function directly owns (according to ``scopeIndex``).
+
+    If ``scopeIndex`` is not provided (or does not cover this function), a
+    new one is built for this function. The summary is stored into (and
+    looked up from) ``summaries`` if it is provided.
+    """
+    if summaries is not None and node in summaries:
+        return summaries[node]
+
+    if scopeIndex is None or node not in scopeIndex:
+        scopeIndex = ScopeIndex(node)
+
+    hasYield: bool = False
+    hasReturn: bool = False
+    hasBareReturn: bool = False
+    hasRaise: bool = False
+    hasAssert: bool = False
+    raisedExceptions: set[str] = set()
+
+    for stmt in scopeIndex.getOwnStatements(node):
+        if isinstance(stmt, ast.Expr):
+            if isinstance(stmt.value, (ast.Yield, ast.YieldFrom)):
+                hasYield = True
+        elif isinstance(stmt, ast.Return):
+            hasReturn = True
+            if stmt.value is None:
+                hasBareReturn = True
+        elif isinstance(stmt, ast.Raise):
+            hasRaise = True
+            raisedExceptions.update(
+                _getExceptionsFromRaise(
+                    stmt,
+                    scopeIndex.getEnclosingExceptHandler(stmt),
+                )
+            )
+        elif isinstance(stmt, ast.Assert):
+            hasAssert = True
+
+    summary = FunctionBodySummary(
+        hasYield=hasYield,
+        hasReturn=hasReturn,
+        hasBareReturn=hasBareReturn,
+        hasRaise=hasRaise,
+        hasAssert=hasAssert,
+        raisedExceptions=frozenset(raisedExceptions),
+    )
+    if summaries is not None:
+        summaries[node] = summary
+
+    return summary
+
+
+def hasYieldStatements(node: FuncOrAsyncFuncDef) -> bool:
+    """Check whether the function node has any yield statements"""
+    return summarizeFunctionBody(node).hasYield
 
-    def isThisNodeAReturnStmt(node_: ast.AST) -> bool:
-        return isinstance(node_, ast.Return)
 
-    return _hasExpectedStatements(node, isThisNodeAReturnStmt)
+def hasReturnStatements(node: FuncOrAsyncFuncDef) -> bool:
+    """Check whether the function node has any return statements"""
+    return summarizeFunctionBody(node).hasReturn
 
 
 def hasBareReturnStatements(node: FuncOrAsyncFuncDef) -> bool:
@@ -119,29 +202,17 @@ def hasBareReturnStatements(node: FuncOrAsyncFuncDef) -> bool:
     Check whether the function node has bare return statements (i.e., just a
     "return" without anything behind it)
     """
-
-    def isThisNodeABareReturnStmt(node_: ast.AST) -> bool:
-        return isinstance(node_, ast.Return) and node_.value is None
-
-    return _hasExpectedStatements(node, isThisNodeABareReturnStmt)
+    return summarizeFunctionBody(node).hasBareReturn
 
 
 def hasRaiseStatements(node: FuncOrAsyncFuncDef) -> bool:
     """Check whether the function node has any raise statements"""
-
-    def isThisNodeARaiseStmt(node_: ast.AST) -> bool:
-        return isinstance(node_, ast.Raise)
-
-    return _hasExpectedStatements(node, isThisNodeARaiseStmt)
+    return summarizeFunctionBody(node).hasRaise
 
 
 def hasAssertStatements(node: FuncOrAsyncFuncDef) -> bool:
     """Check whether the function node has any assert statements"""
-
-    def isThisNodeAnAssertStmt(node_: ast.AST) -> bool:
-        return isinstance(node_, ast.Assert)
-
-    return _hasExpectedStatements(node, isThisNodeAnAssertStmt)
+    return summarizeFunctionBody(node).hasAssert
 
 
 def getRaisedExceptions(
@@ -149,87 +220,48 @@ def getRaisedExceptions(
         shouldDeclareAssertError: bool = False,  # noqa: FBT001, FBT002
 ) -> list[str]:
     """Get the raised exceptions in a function node as a sorted list"""
-    return sorted(set(_getRaisedExceptions(node, shouldDeclareAssertError)))
+    return summarizeFunctionBody(node).getRaisedExceptions(
+        shouldDeclareAssertError
+    )
 
 
-def _getRaisedExceptions(
-        node: FuncOrAsyncFuncDef,
-        shouldDeclareAssertError: bool = False,  # noqa: FBT001, FBT002
+def _getExceptionsFromRaise(
+        node: ast.Raise,
+        enclosingExceptHandler: ast.ExceptHandler | None,
 ) -> Generator[str, None, None]:
-    """Yield the raised exceptions or asserts in a function node"""
-    childLineNum: int = -999
-
-    # key: child lineno, value: (parent lineno, is parent a function?)
-    familyTree: dict[int, tuple[int, bool]] = {}
-
-    currentParentExceptHandler: ast.ExceptHandler | None = None
-
+    """Yield the exceptions raised by a "raise" statement"""
     exceptionName: str | None
 
-    # Depth-first guarantees the last-seen exception handler
-    # is a parent of child.
-    for child, parent in walk.walk_dfs(node):
-        childLineNum = _updateFamilyTree(child, parent, familyTree)
-
-        if isinstance(child, ast.Assert) and shouldDeclareAssertError:
-            yield 'AssertionError (implicitly from the `assert` statement)'
+    for subnode, _ in walk.walk_dfs(node):
+        if isinstance(subnode, ast.Name):
+            if isinstance(node.exc, ast.Attribute):
+                # case: looks like m.n.exception
+                exceptionName = unparseName(node.exc)
+                assert isinstance(exceptionName, str)
+                yield exceptionName
+            elif isinstance(node.exc, ast.Call) and isinstance(
+                node.exc.func, ast.Attribute
+            ):
+                # case: looks like m.n.exception()
+                exceptionName = unparseName(node.exc.func)
+                assert isinstance(exceptionName, str)
+                yield exceptionName
+            elif (
+                enclosingExceptHandler
+                and enclosingExceptHandler.name
+                and subnode.id == enclosingExceptHandler.name
+            ):
+                # case: "except <> as e; raise e" -> we must yield the
+                # stuff in <>
+                yield from _extractExceptionsFromExcept(enclosingExceptHandler)
+            else:
+                yield subnode.id
 
-        if isinstance(parent, ast.ExceptHandler):
-            currentParentExceptHandler = parent
+            return
 
-        if (
-            isinstance(child, ast.Raise)
-            and isinstance(
-                parent,
-                (ast.AsyncFunctionDef, ast.FunctionDef, BlockType),
-            )
-            and _confirmThisStmtIsNotWithinNestedFunc(
-                foundStatementTemp=True,
-                familyTree=familyTree,
-                lineNumOfStatement=childLineNum,
-                lineNumOfThisNode=node.lineno,
-            )
-        ):
-            for subnode, _ in walk.walk_dfs(child):
-                if isinstance(subnode, ast.Name):
-                    if isinstance(child.exc, ast.Attribute):
-                        # case: looks like m.n.exception
-                        exceptionName = unparseName(child.exc)
-                        assert isinstance(exceptionName, str)
-                        yield exceptionName
-                    elif isinstance(child.exc, ast.Call) and isinstance(
-                        child.exc.func, ast.Attribute
-                    ):
-                        # case: looks like m.n.exception()
-                        exceptionName = unparseName(child.exc.func)
-                        assert isinstance(exceptionName, str)
-                        yield exceptionName
-                    elif (
-                        currentParentExceptHandler
-                        and currentParentExceptHandler.name
-                        and subnode.id == currentParentExceptHandler.name
-                    ):
-                        # case: "except <> as e; raise e" -> we must yield the
-                        # stuff in <>
-                        #
-                        # Note:
-                        # if subnode.id != currentParentExceptHandler.name,
-                        # the user is raising something not bound by
-                        # this exception handler (meaning we should fall
-                        # through to yielding the subnode.id)
-                        yield from _extractExceptionsFromExcept(
-                            currentParentExceptHandler
-                        )
-                    else:
-                        yield subnode.id
-
-                    break
-            else:
-                # if "raise" statement was alone, it must be inside an "except"
-                if currentParentExceptHandler:
-                    yield from _extractExceptionsFromExcept(
-                        currentParentExceptHandler,
-                    )
+    # if "raise" statement was alone, it must be inside an "except"
+    if enclosingExceptHandler:
+        yield from _extractExceptionsFromExcept(enclosingExceptHandler)
 
 
 def _extractExceptionsFromExcept(
@@ -255,113 +287,3 @@ def _extractExceptionsFromExcept(
                 yield exceptionName
             elif isinstance(elt, ast.Name):
                 yield elt.id
-
-
-def _hasExpectedStatements(
-        node: FuncOrAsyncFuncDef,
-        isThisNodeAnExpectedStmt: Callable[[ast.AST], bool],
-) -> bool:
-    """
-    Check whether the node contains an expected statement (return, yield,
-    raise, or assert).
-    """
-    childLineNum: int = -999
-    foundExpectedStmt: bool = False
-
-    # key: child lineno, value: (parent lineno, is parent a function?)
-    familyTree: dict[int, tuple[int, bool]] = {}
-
-    for child, parent in walk.walk(node):
-        childLineNum = _updateFamilyTree(child, parent, familyTree)
-
-        if isThisNodeAnExpectedStmt(child):
-            if isinstance(parent, (ast.AsyncFunctionDef, ast.FunctionDef)):
-                foundExpectedStmt = True
-                break
-
-            if isinstance(parent, BlockType):
-                foundExpectedStmt = True
-                break
-
-    return _confirmThisStmtIsNotWithinNestedFunc(
-        foundStatementTemp=foundExpectedStmt,
-        familyTree=familyTree,
-        lineNumOfStatement=childLineNum,
-        lineNumOfThisNode=node.lineno,
-    )
-
-
-def _updateFamilyTree(
-        child: ast.AST,
-        parent: ast.AST,
-        familyTree: dict[int, tuple[int, bool]],
-) -> int:
-    """
-    Structure of ``familyTree``: Key: line number of child node; Value: (line
-    number of parent node, whether this parent is a function)
-    """
-    childLine = _getLineNum(child)
-    parentLine = _getLineNum(parent)
-    if childLine != -1 and parentLine != -1 and childLine != parentLine:  # noqa: PLR1714
-        isFunction = isinstance(parent, FuncOrAsyncFunc)
-        familyTree[childLine] = (parentLine, isFunction)
-
-    return childLine
-
-
-def _getLineNum(node: ast.AST) -> int:
-    lineNum = getattr(node, 'lineno', None)
-    if isinstance(lineNum, int):
-        return lineNum
-
-    # A ``match`` case stores its source location on the pattern.
-    pattern = getattr(node, 'pattern', None)
-    patternLineNum = getattr(pattern, 'lineno', None)
-    if isinstance(patternLineNum, int):
-        return patternLineNum
-
-    return -1
-
-
-def _confirmThisStmtIsNotWithinNestedFunc(
-        foundStatementTemp: bool,  # noqa: FBT001
-        familyTree: dict[int, tuple[int, bool]],
-        lineNumOfStatement: int,
-        lineNumOfThisNode: int,
-) -> bool:
-    """
-    Check whether we REALLY found the expected statement (return, yield, raise,
-    or assert).
-
-    Returns True if this statement is not within a nested function of ``node``.
-    Returns False if otherwise.
-
-    We do this by checking whether the line number of the parent function of
-    the statement is the same as the line number of the node.
-    """
-    if not foundStatementTemp:
-        return False
-
-    parentFuncLineNum = _lookupParentFunc(familyTree, lineNumOfStatement)
-    return parentFuncLineNum == lineNumOfThisNode
-
-
-def _lookupParentFunc(
-        familyLine: dict[int, tuple[int, bool]],
-        lineNumOfChildNode: int,
-) -> int:
-    """
-    Look up the parent function of the given child node.
-
-    Recursion is used in this function, because the key-val pairs in
-    ``familyLine`` only records immediate child-parent mapping.
-    """
-    if lineNumOfChildNode not in familyLine:
-        return -999
-
-    parentLineNum, isParentAFunction = familyLine[lineNumOfChildNode]
-
-    if isParentAFunction:
-        return parentLineNum
-
-    return _lookupParentFunc(familyLine, parentLineNum)
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import functools
+import re
+from typing import TYPE_CHECKING
+
+from pydoclint.utils.violation import VIOLATION_CODES
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+CODE_PREFIX_PATTERN = re.compile(r'DOC\d{0,3}')
+
+
+def _codesInFamily(hundreds: int) -> frozenset[int]:
+    return frozenset(_ for _ in VIOLATION_CODES if _ // 100 == hundreds)
+
+
+# The codes of each family of checks, which the ``Visitor`` skips entirely
+# if none of their codes can be reported
+ARG_CODES: frozenset[int] = _codesInFamily(1)
+RETURN_CODES: frozenset[int] = _codesInFamily(2)
+CLASS_CONSTRUCTOR_CODES: frozenset[int] = _codesInFamily(3)
+YIELD_CODES: frozenset[int] = _codesInFamily(4)
+RAISE_CODES: frozenset[int] = _codesInFamily(5)
+CLASS_ATTRIBUTE_CODES: frozenset[int] = _codesInFamily(6)
+PARSING_ERROR_CODE = 1
+STYLE_MISMATCH_CODE = 3
+
+
+def parseCodePrefixes(value: str) -> tuple[str, ...]:
+    """
+    Parse a comma-separated list of violation code prefixes, such as
+    "DOC1, DOC501" (case-insensitive; "DOC" alone means all codes).
+
+    Parameters
+    ----------
+    value : str
+        The comma-separated list
+
+    Returns
+    -------
+    tuple[str, ...]
+        The upper-case prefixes
+
+    Raises
+    ------
+    ValueError
+        If any of the prefixes is not "DOC" followed by up to 3 digits
+    """
+    prefixes: list[str] = []
+    for item in value.split(','):
+        prefix: str = item.strip().upper()
+        if prefix == '':
+            continue
+
+        if CODE_PREFIX_PATTERN.fullmatch(prefix) is None:
+            msg = (
+                f'Invalid violation code prefix: "{item.strip()}" (expected'
+                ' "DOC" followed by up to 3 digits, such as "DOC1" or'
+                ' "DOC501")'
+            )
+            raise ValueError(msg)
+
+        prefixes.append(prefix)
+
+    return tuple(prefixes)
+
+
+class RuleSelection:
+    """
+    The violation codes that can be reported, given the code prefixes of
+    ``--select`` and ``--ignore``. The prefixes match in the same way as
+    those in the noqa comments (for example, "DOC1" matches "DOC101" to
+    "DOC111").
+
+    A code is reported if a ``select`` prefix matches it (or if ``select`` is
+    empty) and no ``ignore`` prefix matches it, unless the matching
+    ``select`` prefix is longer (more specific) than all the matching
+    ``ignore`` prefixes. For example, ``select='DOC501', ignore='DOC5'``
+    reports DOC501 but not the other DOC5xx codes.
+
+    Parameters
+    ----------
+    select : str, default=''
+        The comma-separated code prefixes to report ('' for all codes)
+    ignore : str, default=''
+        The comma-separated code prefixes not to report
+    """
+
+    __slots__ = ('enabledCodes', 'ignore', 'select')
+
+    def __init__(self, select: str = '', ignore: str = '') -> None:
+        self.select: tuple[str, ...] = parseCodePrefixes(select)
+        self.ignore: tuple[str, ...] = parseCodePrefixes(ignore)
+        self.enabledCodes: frozenset[int] = frozenset(
+            code
+            for code in VIOLATION_CODES
+            if self._isSelected('DOC' + f'{code}'.zfill(3))
+        )
+
+    @property
+    def selectsAll(self) -> bool:
+        """Whether every code can be reported (i.e., nothing is filtered)"""
+        return len(self.enabledCodes) == len(VIOLATION_CODES)
+
+    def isEnabled(self, code: int) -> bool:
+        """Whether the violation code can be reported"""
+        return code in self.enabledCodes
+
+    def anyEnabled(self, codes: Iterable[int]) -> bool:
+        """Whether any of the violation codes can be reported"""
+        return not self.enabledCodes.isdisjoint(codes)
+
+    def _isSelected(self, fullCode: str) -> bool:
+        selectLength: int = _longestMatchingPrefix(fullCode, self.select)
+        if not self.select:
+            selectLength = 0
+        elif selectLength < 0:
+            return False
+
+        return selectLength > _longestMatchingPrefix(fullCode, self.ignore)
+
+
+def _longestMatchingPrefix(fullCode: str, prefixes: tuple[str, ...]) -> int:
+    # The length of the longest prefix that matches (-1 if none does)
+    return max(
+        (len(_) for _ in prefixes if fullCode.startswith(_)),
+        default=-1,
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def compileRuleSelection(select: str = '', ignore: str = '') -> RuleSelection:
+    """
+    Build (or reuse) the ``RuleSelection`` of the ``select`` and ``ignore``
+    options, which stay the same for every file of a run.
+    """
+    return RuleSelection(select=select, ignore=ignore)
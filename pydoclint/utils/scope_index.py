@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import ast
+import functools
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pydoclint.utils.ast_types import FuncOrAsyncFuncDef
+
+# The fields of statement nodes that hold lists of statements (or of
+# except handlers and match cases, which in turn hold statements)
+STATEMENT_LIST_FIELDS = ('body', 'orelse', 'finalbody', 'handlers', 'cases')
+
+
+@functools.cache
+def getStatementListFields(nodeType: type[ast.AST]) -> tuple[str, ...]:
+    """
+    Get the fields of the node type that hold lists of statements (or of
+    except handlers and match cases), in the order of ``_fields`` (which is
+    the order that ``ast.NodeVisitor`` visits them in)
+    """
+    return tuple(_ for _ in nodeType._fields if _ in STATEMENT_LIST_FIELDS)
+
+
+class ScopeIndex:
+    """
+    An index that maps every statement to its innermost enclosing function
+    (by node identity), built in one iterative pass over the tree.
+
+    Only the statement lists are traversed, because expressions cannot
+    contain any statements. The bodies of classes are transparent: their
+    statements belong to the function that encloses the class (if any),
+    because they are run as part of that function.
+
+    Parameters
+    ----------
+    root : ast.AST
+        The root of the tree to index, such as an ``ast.Module`` or a
+        function node
+    """
+
+    def __init__(self, root: ast.AST) -> None:
+        # Statements outside any function are mapped to None
+        self.enclosingFunction: dict[ast.stmt, FuncOrAsyncFuncDef | None] = {}
+
+        # The statements directly owned by each function (i.e., excluding
+        # those in nested functions)
+        self.ownStatements: dict[FuncOrAsyncFuncDef, list[ast.stmt]] = {}
+
+        # The innermost except handler around each "raise" statement within
+        # the same function; a bare "raise" re-raises what it catches
+        self.enclosingExceptHandler: dict[ast.Raise, ast.ExceptHandler] = {}
+
+        self._build(root)
+
+    def __contains__(self, node: FuncOrAsyncFuncDef) -> bool:
+        """Whether the body of the function node is indexed"""
+        return node in self.ownStatements
+
+    def getOwnStatements(self, node: FuncOrAsyncFuncDef) -> list[ast.stmt]:
+        """Get the statements directly owned by the function node"""
+        return self.ownStatements[node]
+
+    def getEnclosingFunction(
+            self,
+            node: ast.stmt,
+    ) -> FuncOrAsyncFuncDef | None:
+        """Get the innermost function that encloses the statement"""
+        return self.enclosingFunction.get(node)
+
+    def getEnclosingExceptHandler(
+            self,
+            node: ast.Raise,
+    ) -> ast.ExceptHandler | None:
+        """Get the innermost except handler around the "raise" statement"""
+        return self.enclosingExceptHandler.get(node)
+
+    def _build(self, root: ast.AST) -> None:
+        # An explicit stack (instead of recursion), so that deeply nested
+        # generated code cannot hit Python's recursion limit
+        todo: list[
+            tuple[ast.AST, FuncOrAsyncFuncDef | None, ast.ExceptHandler | None]
+        ] = [(root, None, None)]
+
+        while todo:
+            node, function, exceptHandler = todo.pop()
+
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                function = node
+                exceptHandler = None  # handlers do not cross functions
+                self.ownStatements[node] = []
+            elif isinstance(node, ast.ExceptHandler):
+                exceptHandler = node
+
+            children: list[ast.AST] = []
+            for fieldName in STATEMENT_LIST_FIELDS:
+                field = getattr(node, fieldName, None)
+                if isinstance(field, list):
+                    children.extend(field)
+
+            for child in children:
+                if isinstance(child, ast.stmt):
+                    self.enclosingFunction[child] = function
+                    if function is not None:
+                        self.ownStatements[function].append(child)
+
+                    if isinstance(child, ast.Raise) and exceptHandler:
+                        self.enclosingExceptHandler[child] = exceptHandler
+
+            todo.extend((child, function, exceptHandler) for child in children)
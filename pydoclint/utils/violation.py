@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import types
-from copy import deepcopy
 
 from pydoclint.utils.edge_case_error import EdgeCaseError
 
@@ -159,7 +158,15 @@ VIOLATION_CODES = types.MappingProxyType({
 
 
 class Violation:
-    """A class to hold information of a style violation"""
+    """
+    A class to hold information of a style violation.
+
+    Violations are immutable value types with ``__slots__`` (because a large
+    code base can have very many of them), and the message is only rendered
+    when it is first needed.
+    """
+
+    __slots__ = ('_msg', 'code', 'line', 'moreMsg', 'msgPostfix', 'msgPrefix')
 
     def __init__(
             self,
@@ -167,16 +174,38 @@ class Violation:
             code: int,
             msgPrefix: str = '',
             msgPostfix: str = '',
+            moreMsg: str | None = None,
     ) -> None:
         if code not in VIOLATION_CODES:
             raise EdgeCaseError('Invalid violation code')
 
-        self.line = line
-        self.code = code
-        self.violationMsg = VIOLATION_CODES[code]
-        self.msgPrefix = msgPrefix
-        self.msgPostfix = msgPostfix
-        self.msg = f'{msgPrefix} {self.violationMsg} {msgPostfix}'.strip()
+        self.line: int = line
+        self.code: int = code
+        self.msgPrefix: str = msgPrefix
+        self.msgPostfix: str = msgPostfix
+        self.moreMsg: str | None = moreMsg  # see ``appendMoreMsg()``
+        self._msg: str | None = None
+
+    @property
+    def violationMsg(self) -> str:
+        """The generic message of this violation code"""
+        return VIOLATION_CODES[self.code]
+
+    @property
+    def msg(self) -> str:
+        """The full violation message (rendered only once)"""
+        if self._msg is None:
+            if self.moreMsg is None:
+                self._msg = (
+                    f'{self.msgPrefix} {self.violationMsg} {self.msgPostfix}'
+                ).strip()
+            else:
+                self._msg = (
+                    f'{self.msgPrefix} {self.violationMsg} {self.moreMsg}'
+                    f' {self.msgPostfix}'
+                ).strip()
+
+        return self._msg
 
     @property
     def fullErrorCode(self) -> str:
@@ -209,6 +238,30 @@ class Violation:
         # Allows usage in sets/dicts while matching __eq__ behavior
         return hash((self.line, self.code, self.msg))
 
+    def __getstate__(self) -> tuple[int, int, str, str, str | None]:
+        # The rendered message is not sent to other processes (such as the
+        # workers of `--jobs`), because it can be rendered again cheaply
+        return (
+            self.line,
+            self.code,
+            self.msgPrefix,
+            self.msgPostfix,
+            self.moreMsg,
+        )
+
+    def __setstate__(
+            self,
+            state: tuple[int, int, str, str, str | None],
+    ) -> None:
+        (
+            self.line,
+            self.code,
+            self.msgPrefix,
+            self.msgPostfix,
+            self.moreMsg,
+        ) = state
+        self._msg = None
+
     def getInfoForFlake8(self) -> tuple[int, int, str]:
         """Get the violation info for flake8"""
         colOffset: int = 0  # we don't need column offset to locate the issue
@@ -217,9 +270,14 @@ class Violation:
         return self.line, colOffset, msg
 
     def appendMoreMsg(self, moreMsg: str) -> Violation:
-        """Append more error message, and return a new Violation object"""
-        new = deepcopy(self)
-        new.msg = (
-            f'{new.msgPrefix} {new.violationMsg} {moreMsg} {new.msgPostfix}'
-        ).strip()
-        return new
+        """
+        Append more error message (between the generic message and
+        ``msgPostfix``), and return a new Violation object
+        """
+        return Violation(
+            line=self.line,
+            code=self.code,
+            msgPrefix=self.msgPrefix,
+            msgPostfix=self.msgPostfix,
+            moreMsg=moreMsg,
+        )
@@ -6,20 +6,21 @@ import ast
 from typing import TYPE_CHECKING, cast
 
 if TYPE_CHECKING:
+    from pydoclint.utils.doc import Doc
     from pydoclint.utils.return_anno import ReturnAnnotation
     from pydoclint.utils.return_arg import ReturnArg
     from pydoclint.utils.yield_arg import YieldArg
 
 from pydoclint.utils.arg import Arg, ArgList
+from pydoclint.utils.doc_store import DocStore
 from pydoclint.utils.edge_case_error import EdgeCaseError
 from pydoclint.utils.generic import (
     appendArgsToCheckToV105,
     buildClassAttrToDefaultMapping,
-    getDocstring,
     specialEqual,
     stripQuotes,
 )
-from pydoclint.utils.parse_docstring import parseDocstringInGivenStyle
+from pydoclint.utils.return_anno import parseAnnotation
 from pydoclint.utils.return_yield_raise import GeneratorAnnotationKind
 from pydoclint.utils.special_methods import checkIsPropertyMethod
 from pydoclint.utils.unparser_custom import unparseName
@@ -39,6 +40,8 @@ def checkClassAttributesAgainstClassDocstring(
         *,
         node: ast.ClassDef,
         style: str,
+        parser: str = 'compat',
+        docStore: DocStore | None = None,
         violations: list[Violation],
         lineNum: int,
         msgPrefix: str,
@@ -61,6 +64,11 @@ def checkClassAttributesAgainstClassDocstring(
         The class definition node.
     style : str
         The docstring style.
+    parser : str, default='compat'
+        The docstring parser ("fast" or "compat").
+    docStore : DocStore | None, default=None
+        The parsed docstrings of the current file, so that the class
+        docstring is parsed only once. If None, a new one is used.
     violations : list[Violation]
         The list of violations.
     lineNum : int
@@ -93,6 +101,8 @@ def checkClassAttributesAgainstClassDocstring(
     docuemntedAndClassArgs = getDocumentedAndActualClassArgLists(
         node=node,
         style=style,
+        parser=parser,
+        docStore=docStore,
         shouldDocumentPrivateClassAttributes=shouldDocumentPrivateClassAttributes,
         treatPropertyMethodsAsClassAttributes=treatPropertyMethodsAsClassAttributes,
         onlyAttrsWithClassVarAreTreatedAsClassAttrs=(
@@ -158,6 +168,8 @@ def getDocumentedAndActualClassArgLists(
         *,
         node: ast.ClassDef,
         style: str,
+        parser: str = 'compat',
+        docStore: DocStore | None = None,
         shouldDocumentPrivateClassAttributes: bool,
         treatPropertyMethodsAsClassAttributes: bool,
         onlyAttrsWithClassVarAreTreatedAsClassAttrs: bool,
@@ -176,6 +188,11 @@ def getDocumentedAndActualClassArgLists(
         The class definition node.
     style : str
         The docstring style.
+    parser : str, default='compat'
+        The docstring parser ("fast" or "compat").
+    docStore : DocStore | None, default=None
+        The parsed docstrings of the current file, so that the class
+        docstring is parsed only once. If None, a new one is used.
     shouldDocumentPrivateClassAttributes : bool
         Whether to document private class attributes.
     treatPropertyMethodsAsClassAttributes : bool
@@ -211,29 +228,16 @@ def getDocumentedAndActualClassArgLists(
         checkArgDefaults=checkArgDefaults,
     )
 
-    classDocstring: str = getDocstring(node)
+    if docStore is None:
+        docStore = DocStore(parser=parser)
 
-    if classDocstring == '':
-        # We don't check classes without any docstrings.
-        # We defer to
-        # flake8-docstrings (https://github.com/PyCQA/flake8-docstrings)
-        # or pydocstyle (https://www.pydocstyle.org/en/stable/)
-        # to determine whether a class needs a docstring.
-        return None
-
-    doc, potentialParsingError = parseDocstringInGivenStyle(
-        docstring=classDocstring,
+    doc: Doc | None = checkClassDocstringParsing(
+        node=node,
         style=style,
+        docStore=docStore,
+        violations=violations,
     )
-    if potentialParsingError is not None:
-        violations.append(
-            Violation(
-                code=1,
-                line=node.lineno,
-                msgPrefix=f'Class `{node.name}`:',
-                msgPostfix=str(potentialParsingError).replace('\n', ' '),
-            )
-        )
+    if doc is None:
         return None
 
     if skipCheckingShortDocstrings and doc.isShortDocstring:
@@ -265,6 +269,57 @@ def getDocumentedAndActualClassArgLists(
     return docArgs, actualArgs
 
 
+def checkClassDocstringParsing(
+        *,
+        node: ast.ClassDef,
+        style: str,
+        docStore: DocStore,
+        violations: list[Violation],
+) -> Doc | None:
+    """
+    Parse the class docstring, and report a DOC001 violation if it cannot be
+    parsed.
+
+    Parameters
+    ----------
+    node : ast.ClassDef
+        The class definition node.
+    style : str
+        The docstring style.
+    docStore : DocStore
+        The parsed docstrings of the current file.
+    violations : list[Violation]
+        The list of violations.
+
+    Returns
+    -------
+    Doc | None
+        The parsed class docstring, or None if the class has no docstring or
+        if the docstring cannot be parsed.
+    """
+    if docStore.getDocstring(node) == '':
+        # We don't check classes without any docstrings.
+        # We defer to
+        # flake8-docstrings (https://github.com/PyCQA/flake8-docstrings)
+        # or pydocstyle (https://www.pydocstyle.org/en/stable/)
+        # to determine whether a class needs a docstring.
+        return None
+
+    doc, potentialParsingError = docStore.parseInGivenStyle(node, style)
+    if potentialParsingError is not None:
+        violations.append(
+            Violation(
+                code=1,
+                line=node.lineno,
+                msgPrefix=f'Class `{node.name}`:',
+                msgPostfix=str(potentialParsingError).replace('\n', ' '),
+            )
+        )
+        return None
+
+    return doc
+
+
 def updateDocumentedArgListWithInlineDocstrings(
         *,
         node: ast.ClassDef,
@@ -355,17 +410,19 @@ def updateDocumentedArgListWithInlineDocstrings(
                     )
                 else:
                     # pull the type from the doc comment
-                    arg.typeHint = ''
+                    typeHint: str = ''
                     if argTypeHintsInDocstring:
                         docComment = cast('str', element.value.value)
                         if ':' in docComment:
                             # type hint is before the first colon
                             # on the first line
-                            arg.typeHint = (
+                            typeHint = (
                                 docComment.split('\n')[0].split(':')[0].strip()
                             )
 
-                    docArgs.insertAt(idx, arg)
+                    docArgs.insertAt(
+                        idx, Arg(name=arg.name, typeHint=typeHint)
+                    )
 
         prev = element
 
@@ -826,6 +883,7 @@ def checkYieldTypesForViolations(
         hasIteratorOrIterableAsReturnAnnotation=(
             hasIteratorOrIterableAsReturnAnnotation
         ),
+        returnAnnoNode=originalReturnAnnotation.node,
     )
 
     if len(yieldSection) > 0:
@@ -864,13 +922,16 @@ def extractYieldTypeFromGeneratorOrIteratorAnnotation(
         returnAnnoText: str | None,
         generatorAnnotationKind: GeneratorAnnotationKind | None,
         hasIteratorOrIterableAsReturnAnnotation: bool,  # noqa: FBT001
+        *,
+        returnAnnoNode: ast.expr | None = None,
 ) -> str | None:
     """
     Extract yield type from generator or iterator annotations.
 
     The caller supplies the generator kind so this helper only chooses arity
     rules; supported annotation spellings stay owned by the AST annotation
-    detectors.
+    detectors. If the caller also supplies the syntax tree of the annotation
+    (``ReturnAnnotation.node``), the annotation text is not parsed again.
     """
     #
     # "Yield type" is the 0th element in a Generator
@@ -885,10 +946,14 @@ def extractYieldTypeFromGeneratorOrIteratorAnnotation(
             annotationArgs = _extractGeneratorOrAsyncGeneratorAnnotationArgs(
                 returnAnnoText,
                 generatorAnnotationKind=generatorAnnotationKind,
+                returnAnnoNode=returnAnnoNode,
             )
             yieldType = unparseName(annotationArgs[0])
         elif hasIteratorOrIterableAsReturnAnnotation:
-            annotationSlice = _extractAnnotationSubscriptSlice(returnAnnoText)
+            annotationSlice = _extractAnnotationSubscriptSlice(
+                returnAnnoText,
+                returnAnnoNode=returnAnnoNode,
+            )
             yieldType = unparseName(annotationSlice)
         else:
             yieldType = returnAnnoText
@@ -916,6 +981,7 @@ def getReturnTypeToDocument(
     return extractReturnTypeFromGeneratorAnnotation(
         returnAnnoText=returnAnnotation.annotation,
         generatorAnnotationKind=generatorAnnotationKind,
+        returnAnnoNode=returnAnnotation.node,
     )
 
 
@@ -923,13 +989,15 @@ def extractReturnTypeFromGeneratorAnnotation(
         returnAnnoText: str | None,
         *,
         generatorAnnotationKind: GeneratorAnnotationKind,
+        returnAnnoNode: ast.expr | None = None,
 ) -> str | None:
     """
     Extract return type from Generator and AsyncGenerator annotations.
 
     The caller supplies the generator kind so this helper does not re-detect
     annotation kind from raw text. That keeps spelling support centralized in
-    the AST annotation detectors.
+    the AST annotation detectors. If the caller also supplies the syntax tree
+    of the annotation, the annotation text is not parsed again.
     """
     #
     # "Return type" is the 2nd element in a Generator type annotation
@@ -941,12 +1009,16 @@ def extractReturnTypeFromGeneratorAnnotation(
     returnType: str | None
     try:
         if generatorAnnotationKind is GeneratorAnnotationKind.ASYNC_GENERATOR:
-            _extractAsyncGeneratorAnnotationSubscriptArgs(returnAnnoText)
+            _extractAsyncGeneratorAnnotationSubscriptArgs(
+                returnAnnoText,
+                returnAnnoNode=returnAnnoNode,
+            )
             returnType = 'None'
             return stripQuotes(returnType)
 
         generatorArgs = _extractGeneratorAnnotationSubscriptArgs(
-            returnAnnoText
+            returnAnnoText,
+            returnAnnoNode=returnAnnoNode,
         )
         if len(generatorArgs) <= GENERATOR_RETURN_TYPE_ARG_INDEX:
             returnType = 'None'
@@ -963,6 +1035,7 @@ def _extractGeneratorOrAsyncGeneratorAnnotationArgs(
         returnAnnoText: str | None,
         *,
         generatorAnnotationKind: GeneratorAnnotationKind,
+        returnAnnoNode: ast.expr | None = None,
 ) -> list[ast.expr]:
     """
     Extract generator-like annotation args according to their detected kind.
@@ -973,19 +1046,30 @@ def _extractGeneratorOrAsyncGeneratorAnnotationArgs(
     does not decide which annotation spellings are recognized.
     """
     if generatorAnnotationKind is GeneratorAnnotationKind.ASYNC_GENERATOR:
-        return _extractAsyncGeneratorAnnotationSubscriptArgs(returnAnnoText)
+        return _extractAsyncGeneratorAnnotationSubscriptArgs(
+            returnAnnoText,
+            returnAnnoNode=returnAnnoNode,
+        )
 
-    return _extractGeneratorAnnotationSubscriptArgs(returnAnnoText)
+    return _extractGeneratorAnnotationSubscriptArgs(
+        returnAnnoText,
+        returnAnnoNode=returnAnnoNode,
+    )
 
 
 def _extractGeneratorAnnotationSubscriptArgs(
         returnAnnoText: str | None,
+        *,
+        returnAnnoNode: ast.expr | None = None,
 ) -> list[ast.expr]:
     """
     Extract Generator args only when its arity can be interpreted (i.e., 1-3
     args).
     """
-    annotationArgs = _extractAnnotationSubscriptArgs(returnAnnoText)
+    annotationArgs = _extractAnnotationSubscriptArgs(
+        returnAnnoText,
+        returnAnnoNode=returnAnnoNode,
+    )
     if 1 <= len(annotationArgs) <= GENERATOR_MAX_ARG_COUNT:
         return annotationArgs
 
@@ -994,12 +1078,17 @@ def _extractGeneratorAnnotationSubscriptArgs(
 
 def _extractAsyncGeneratorAnnotationSubscriptArgs(
         returnAnnoText: str | None,
+        *,
+        returnAnnoNode: ast.expr | None = None,
 ) -> list[ast.expr]:
     """
     Extract AsyncGenerator args only when its arity can be interpreted (i.e.,
     1-2 args).
     """
-    annotationArgs = _extractAnnotationSubscriptArgs(returnAnnoText)
+    annotationArgs = _extractAnnotationSubscriptArgs(
+        returnAnnoText,
+        returnAnnoNode=returnAnnoNode,
+    )
     if 1 <= len(annotationArgs) <= ASYNC_GENERATOR_MAX_ARG_COUNT:
         return annotationArgs
 
@@ -1008,25 +1097,37 @@ def _extractAsyncGeneratorAnnotationSubscriptArgs(
 
 def _extractAnnotationSubscriptArgs(
         returnAnnoText: str | None,
+        *,
+        returnAnnoNode: ast.expr | None = None,
 ) -> list[ast.expr]:
     """Return the arguments supplied inside a subscript annotation."""
-    annotationSlice = _extractAnnotationSubscriptSlice(returnAnnoText)
+    annotationSlice = _extractAnnotationSubscriptSlice(
+        returnAnnoText,
+        returnAnnoNode=returnAnnoNode,
+    )
     if isinstance(annotationSlice, ast.Tuple):
         return list(annotationSlice.elts)
 
     return [annotationSlice]
 
 
-def _extractAnnotationSubscriptSlice(returnAnnoText: str | None) -> ast.expr:
-    """Return the slice inside a subscript annotation."""
-    if returnAnnoText is None:
+def _extractAnnotationSubscriptSlice(
+        returnAnnoText: str | None,
+        *,
+        returnAnnoNode: ast.expr | None = None,
+) -> ast.expr:
+    """
+    Return the slice inside a subscript annotation. The annotation text is
+    only parsed if its syntax tree (``returnAnnoNode``) is not supplied.
+    """
+    parsedValue: ast.expr
+    if returnAnnoNode is not None:
+        parsedValue = returnAnnoNode
+    elif returnAnnoText is None:
         raise TypeError('Return annotation cannot be None')
+    else:
+        parsedValue = parseAnnotation(returnAnnoText)
 
-    parsedBody0 = ast.parse(returnAnnoText).body[0]
-    if not isinstance(parsedBody0, ast.Expr):
-        raise TypeError('Return annotation must parse to an expression')
-
-    parsedValue = parsedBody0.value
     if not isinstance(parsedValue, ast.Subscript):
         raise TypeError('Return annotation must be subscripted')
 
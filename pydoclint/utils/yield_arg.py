@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class YieldArg:
     """A class to hold one yield argument in the docstring's yields section"""
 
@@ -1,18 +1,24 @@
 from __future__ import annotations
 
 import ast
+import time
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from docstring_parser import ParseError
 
-    from pydoclint.utils.ast_types import FuncOrAsyncFuncDef
+    from pydoclint.utils.ast_types import (
+        ClassOrFunctionDef,
+        FuncOrAsyncFuncDef,
+    )
     from pydoclint.utils.doc import Doc
     from pydoclint.utils.return_arg import ReturnArg
     from pydoclint.utils.yield_arg import YieldArg
 
 
+from pydoclint.utils import profiling
 from pydoclint.utils.arg import Arg, ArgList
+from pydoclint.utils.doc_store import DocStore
 from pydoclint.utils.edge_case_error import EdgeCaseError
 from pydoclint.utils.generic import (
     buildFuncArgToDefaultMapping,
@@ -21,40 +27,44 @@ from pydoclint.utils.generic import (
     doList1ItemsStartWithList2Items,
     generateClassMsgPrefix,
     generateFuncMsgPrefix,
-    getDocstring,
     isLastConstructor,
     isPrivateName,
 )
 from pydoclint.utils.method_type import MethodType
-from pydoclint.utils.parse_docstring import (
-    parseDocstring,
-    parseDocstringInGivenStyle,
-)
 from pydoclint.utils.return_anno import ReturnAnnotation
 from pydoclint.utils.return_yield_raise import (
+    FunctionBodySummary,
     getGeneratorAnnotationKind,
-    getRaisedExceptions,
-    hasAssertStatements,
-    hasBareReturnStatements,
     hasGeneratorAsReturnAnnotation,
     hasIteratorOrIterableAsReturnAnnotation,
-    hasRaiseStatements,
     hasReturnAnnotation,
-    hasReturnStatements,
-    hasYieldStatements,
     isReturnAnnotationNone,
     isReturnAnnotationNoReturn,
+    summarizeFunctionBody,
+)
+from pydoclint.utils.rule_selection import (
+    ARG_CODES,
+    CLASS_ATTRIBUTE_CODES,
+    CLASS_CONSTRUCTOR_CODES,
+    PARSING_ERROR_CODE,
+    RAISE_CODES,
+    RETURN_CODES,
+    STYLE_MISMATCH_CODE,
+    YIELD_CODES,
+    RuleSelection,
+    compileRuleSelection,
 )
+from pydoclint.utils.scope_index import ScopeIndex, getStatementListFields
 from pydoclint.utils.special_methods import (
     checkIsAbstractMethod,
     checkIsPropertyMethod,
 )
-from pydoclint.utils.unparser_custom import unparseName
 from pydoclint.utils.violation import Violation
 from pydoclint.utils.visitor_helper import (
     addMismatchedRaisesExceptionViolation,
     addStarsToDocstringArgsWhenApplicable,
     checkClassAttributesAgainstClassDocstring,
+    checkClassDocstringParsing,
     checkDocArgsLengthAgainstActualArgs,
     checkNameOrderAndTypeHintsOfDocArgsAgainstActualArgs,
     checkReturnTypesForViolations,
@@ -64,14 +74,27 @@ from pydoclint.utils.visitor_helper import (
     getReturnTypeToDocument,
 )
 
+# The nodes with a visit_...() method; the other nodes are only walked
+# through (see ``Visitor.visit()``)
+VISITED_NODE_TYPES = (
+    ast.Module,
+    ast.ClassDef,
+    ast.FunctionDef,
+    ast.AsyncFunctionDef,
+)
+
 
 class Visitor(ast.NodeVisitor):
-    """A class to recursively visit all the nodes in a parsed module"""
+    """
+    A class to visit all the class and function definitions in a parsed
+    module (see ``visit()``)
+    """
 
     def __init__(
             self,
             *,
             style: str = 'numpy',
+            parser: str = 'compat',
             argTypeHintsInSignature: bool = True,
             argTypeHintsInDocstring: bool = True,
             checkArgOrder: bool = True,
@@ -95,8 +118,12 @@ class Visitor(ast.NodeVisitor):
             shouldDeclareAssertErrorIfAssertStatementExists: bool = False,
             checkStyleMismatch: bool = False,
             checkArgDefaults: bool = False,
+            select: str = '',
+            ignore: str = '',
+            changedLines: set[int] | None = None,
     ) -> None:
         self.style: str = style
+        self.parser: str = parser
         self.argTypeHintsInSignature: bool = argTypeHintsInSignature
         self.argTypeHintsInDocstring: bool = argTypeHintsInDocstring
         self.checkArgOrder: bool = checkArgOrder
@@ -135,6 +162,46 @@ class Visitor(ast.NodeVisitor):
         self.checkStyleMismatch: bool = checkStyleMismatch
         self.checkArgDefaults: bool = checkArgDefaults
 
+        # If not None, only the definitions that contain at least one of
+        # these line numbers are checked (such as in the --diff-only mode)
+        self.changedLines: set[int] | None = changedLines
+
+        # The families of checks none of whose violation codes can be
+        # reported (because of --select and --ignore) are skipped entirely,
+        # and the other violations that are not selected are dropped at the
+        # end of ``visit()``
+        self.ruleSelection: RuleSelection = compileRuleSelection(
+            select,
+            ignore,
+        )
+        rules: RuleSelection = self.ruleSelection
+        self.shouldCheckArgs: bool = rules.anyEnabled(ARG_CODES)
+        self.shouldCheckReturns: bool = rules.anyEnabled(RETURN_CODES)
+        self.shouldCheckYields: bool = rules.anyEnabled(YIELD_CODES)
+        self.shouldCheckRaises: bool = (
+            not skipCheckingRaises and rules.anyEnabled(RAISE_CODES)
+        )
+        self.shouldCheckClassAttributes: bool = (
+            checkClassAttributes and rules.anyEnabled(CLASS_ATTRIBUTE_CODES)
+        )
+
+        # The style detection (for DOC003) also decides whether the other
+        # function checks run, and which parsing error (DOC001) is reported,
+        # so the function docstrings are parsed (and the styles detected)
+        # unless none of these codes can be reported
+        self.shouldCheckFunctionDocstrings: bool = (
+            self.shouldCheckArgs
+            or self.shouldCheckReturns
+            or self.shouldCheckYields
+            or self.shouldCheckRaises
+            or rules.isEnabled(PARSING_ERROR_CODE)
+            or (checkStyleMismatch and rules.isEnabled(STYLE_MISMATCH_CODE))
+        )
+        self.shouldCheckClassConstructors: bool = (
+            self.shouldCheckFunctionDocstrings
+            or rules.anyEnabled(CLASS_CONSTRUCTOR_CODES)
+        )
+
         # Validate incompatible option combination
         if self.style == 'sphinx' and self.checkArgDefaults:
             raise ValueError(
@@ -145,16 +212,111 @@ class Visitor(ast.NodeVisitor):
             )
 
         self.parent: ast.AST = ast.Pass()  # keep track of parent node
+
+        # The nodes (and their parents) yet to be visited in ``visit()``
+        self.pendingNodes: list[tuple[ast.AST, ast.AST]] = []
         self.violations: list[Violation] = []
 
+        # Built once per module (in ``visit_Module()``), to tell which
+        # function each statement belongs to
+        self.scopeIndex: ScopeIndex | None = None
+
+        # Memoized per function node
+        self.bodySummaries: dict[FuncOrAsyncFuncDef, FunctionBodySummary] = {}
+        self.returnAnnotations: dict[FuncOrAsyncFuncDef, ReturnAnnotation] = {}
+
+        # Every docstring (such as a class docstring, which several checks
+        # use) is parsed at most once per style
+        self.docStore: DocStore = DocStore(parser=parser)
+
+    def visit(self, node: ast.AST) -> None:
+        """
+        Visit the class and function definitions in the tree, in the same
+        (depth-first) order as ``ast.NodeVisitor.visit()``.
+
+        Only the statement lists (such as the bodies of the "if" statements)
+        are walked, because expressions, argument defaults, and decorators
+        cannot contain any definitions. An explicit stack is used instead of
+        recursion, so deeply nested code cannot hit the recursion limit.
+
+        Parameters
+        ----------
+        node : ast.AST
+            The root of the tree, usually an ``ast.Module``
+
+        Returns
+        -------
+        None
+        """
+        originalParent: ast.AST = self.parent
+        self.pendingNodes.append((node, self.parent))
+        while self.pendingNodes:
+            current, self.parent = self.pendingNodes.pop()
+            if isinstance(current, VISITED_NODE_TYPES):
+                if profiling.activeProfiler is not None and not isinstance(
+                    current, ast.Module
+                ):
+                    self._visitDefinitionAndProfile(current)
+                else:
+                    super().visit(current)  # calls visit_Module(), etc.
+            else:  # such as "if" and "try" statements
+                self._visitChildren(current)
+
+        self.parent = originalParent  # restore
+
+        if not self.ruleSelection.selectsAll:
+            self.violations = [
+                _
+                for _ in self.violations
+                if self.ruleSelection.isEnabled(_.code)
+            ]
+
+    def _visitDefinitionAndProfile(self, node: ClassOrFunctionDef) -> None:
+        # The nested definitions are only scheduled (not visited) here, so
+        # this is the time of checking this definition alone
+        start: float = time.perf_counter()
+        super().visit(node)
+        if profiling.activeProfiler is not None:
+            profiling.activeProfiler.recordDefinition(
+                node.name,
+                node.lineno,
+                start,
+            )
+
+    def _visitChildren(self, node: ast.AST) -> None:
+        # Schedule the statements in the statement lists of ``node`` that
+        # are (or can contain) definitions, with ``self.parent`` as their
+        # parent. They are pushed in reverse, so that they are popped (and
+        # visited) in the original order.
+        children: list[ast.AST] = []
+        for field in getStatementListFields(type(node)):
+            children.extend(getattr(node, field))
+
+        for child in reversed(children):
+            if isinstance(child, VISITED_NODE_TYPES) or getStatementListFields(
+                type(child)
+            ):
+                self.pendingNodes.append((child, self.parent))
+
+    def visit_Module(self, node: ast.Module) -> None:  # noqa: D102
+        self.scopeIndex = ScopeIndex(node)
+        self._visitChildren(node)
+
     def visit_ClassDef(self, node: ast.ClassDef) -> None:  # noqa: D102
+        if not self._isChanged(node):
+            # Nested definitions are within the line range of this class,
+            # so none of them can have changed either
+            return
+
         currentParent = self.parent  # keep aside
         self.parent = node
 
-        if self.checkClassAttributes:
+        if self.shouldCheckClassAttributes:
             checkClassAttributesAgainstClassDocstring(
                 node=node,
                 style=self.style,
+                parser=self.parser,
+                docStore=self.docStore,
                 violations=self.violations,
                 lineNum=node.lineno,
                 msgPrefix=generateClassMsgPrefix(node=node, appendColon=True),
@@ -174,8 +336,19 @@ class Visitor(ast.NodeVisitor):
                 requireInlineClassVarDocs=self.requireInlineClassVarDocs,
                 checkArgDefaults=self.checkArgDefaults,
             )
+        elif self.checkClassAttributes and self.ruleSelection.isEnabled(
+            PARSING_ERROR_CODE
+        ):
+            # Only the parsing error of the class docstring can be reported,
+            # so the class attributes are not extracted
+            checkClassDocstringParsing(
+                node=node,
+                style=self.style,
+                docStore=self.docStore,
+                violations=self.violations,
+            )
 
-        self.generic_visit(node)
+        self._visitChildren(node)
 
         self.parent = currentParent  # restore
 
@@ -205,17 +378,38 @@ class Visitor(ast.NodeVisitor):
             self.parent = parent_
             return
 
-        docstring: str = getDocstring(node)
+        if not self._isChanged(node) and not (
+            # The class docstring is checked against __init__()
+            isClassConstructor
+            and parentClass is not None
+            and self._isDocstringChanged(parentClass)
+        ):
+            self.parent = parent_  # restore
+            return
+
+        if not (
+            self.shouldCheckFunctionDocstrings
+            or (isClassConstructor and self.shouldCheckClassConstructors)
+        ):
+            # None of the violations of this function can be reported
+            self._visitChildren(node)
+            self.parent = parent_  # restore
+            return
+
+        # The node whose docstring is checked: the class docstring can be
+        # checked in place of the docstring of __init__()
+        docstringOwner: ClassOrFunctionDef = node
 
         self.isAbstractMethod = checkIsAbstractMethod(node)
 
         if isClassConstructor and parentClass is not None:
-            docstring = self._checkClassDocstringAndConstructorDocstrings(
+            docstringOwner = self._checkClassDocstringAndConstructorDocstrings(
                 node=node,
                 parent_=parentClass,
-                initDocstring=docstring,
             )
 
+        docstring: str = self.docStore.getDocstring(docstringOwner)
+
         argViolations: list[Violation]
         returnViolations: list[Violation]
         yieldViolations: list[Violation]
@@ -237,13 +431,15 @@ class Visitor(ast.NodeVisitor):
             styleMismatch: bool
 
             if self.checkStyleMismatch:
-                doc, potentialParsingError, styleMismatch = parseDocstring(
-                    docstring,
-                    userSpecifiedStyle=self.style,
+                doc, potentialParsingError, styleMismatch = (
+                    self.docStore.parseInDetectedStyle(
+                        docstringOwner,
+                        userSpecifiedStyle=self.style,
+                    )
                 )
             else:
-                doc, potentialParsingError = parseDocstringInGivenStyle(
-                    docstring,
+                doc, potentialParsingError = self.docStore.parseInGivenStyle(
+                    docstringOwner,
                     style=self.style,
                 )
                 styleMismatch = False  # always silence DOC003
@@ -291,43 +487,26 @@ class Visitor(ast.NodeVisitor):
                     yieldViolations = []
                     raiseViolations = []
                 else:
-                    argViolations = self.checkArguments(
-                        node,
-                        parent_,
-                        doc,
-                        styleMismatch=styleMismatch,
+                    argViolations = (
+                        self.checkArguments(
+                            node,
+                            parent_,
+                            doc,
+                            styleMismatch=styleMismatch,
+                        )
+                        if self.shouldCheckArgs
+                        else []
                     )
                     if docstring == '' or styleMismatch:
                         returnViolations = []
                         yieldViolations = []
                         raiseViolations = []
-                    elif hasYieldStatements(node) and hasReturnStatements(
-                        node
-                    ):
-                        returnViolations = self.checkReturnAndYield(
-                            node, parent_, doc
-                        )
-                        # It doesn't matter what violations fall into which
-                        # list, so we put everything in `returnViolations`
-                        # and then keep `yieldViolations` empty.
-                        yieldViolations = []
-                        if not self.skipCheckingRaises:
-                            raiseViolations = self.checkRaises(
-                                node, parent_, doc
-                            )
-                        else:
-                            raiseViolations = []
                     else:
-                        returnViolations = self.checkReturns(
-                            node, parent_, doc
-                        )
-                        yieldViolations = self.checkYields(node, parent_, doc)
-                        if not self.skipCheckingRaises:
-                            raiseViolations = self.checkRaises(
+                        returnViolations, yieldViolations, raiseViolations = (
+                            self._checkReturnsYieldsAndRaises(
                                 node, parent_, doc
                             )
-                        else:
-                            raiseViolations = []
+                        )
 
                 if isClassConstructor and parentClass is not None:
                     # Re-check return violations because the rules are
@@ -344,7 +523,7 @@ class Visitor(ast.NodeVisitor):
         self.violations.extend(yieldViolations)
         self.violations.extend(raiseViolations)
 
-        self.generic_visit(node)
+        self._visitChildren(node)
 
         self.parent = parent_  # restore
 
@@ -352,22 +531,105 @@ class Visitor(ast.NodeVisitor):
         # Treat async functions similarly to regular ones
         self.visit_FunctionDef(node)
 
-    def visit_Raise(self, node: ast.Raise) -> None:  # noqa: D102
-        self.generic_visit(node)
+    def _checkReturnsYieldsAndRaises(
+            self,
+            node: FuncOrAsyncFuncDef,
+            parent_: ast.AST,
+            doc: Doc,
+    ) -> tuple[list[Violation], list[Violation], list[Violation]]:
+        # The return, yield, and raise violations of the function (only of
+        # the families that can be reported)
+        returnViolations: list[Violation] = []
+        yieldViolations: list[Violation] = []
+        raiseViolations: list[Violation] = []
+        if not (
+            self.shouldCheckReturns
+            or self.shouldCheckYields
+            or self.shouldCheckRaises
+        ):
+            # The function body does not even need to be summarized
+            return returnViolations, yieldViolations, raiseViolations
+
+        bodySummary: FunctionBodySummary = self._getBodySummary(node)
+        if bodySummary.hasYield and bodySummary.hasReturn:
+            if self.shouldCheckReturns or self.shouldCheckYields:
+                # It doesn't matter what violations fall into which list, so
+                # we put everything in `returnViolations` and then keep
+                # `yieldViolations` empty.
+                returnViolations = self.checkReturnAndYield(node, parent_, doc)
+        else:
+            if self.shouldCheckReturns:
+                returnViolations = self.checkReturns(node, parent_, doc)
+
+            if self.shouldCheckYields:
+                yieldViolations = self.checkYields(node, parent_, doc)
+
+        if self.shouldCheckRaises:
+            raiseViolations = self.checkRaises(node, parent_, doc)
+
+        return returnViolations, yieldViolations, raiseViolations
+
+    def _getBodySummary(self, node: FuncOrAsyncFuncDef) -> FunctionBodySummary:
+        return summarizeFunctionBody(
+            node,
+            summaries=self.bodySummaries,
+            scopeIndex=self.scopeIndex,
+        )
+
+    def _getReturnAnnotation(
+            self,
+            node: FuncOrAsyncFuncDef,
+    ) -> ReturnAnnotation:
+        # Built once per function (from the annotation's syntax tree), and
+        # shared by the return and yield checks
+        if node not in self.returnAnnotations:
+            self.returnAnnotations[node] = ReturnAnnotation.fromAstNode(
+                node.returns
+            )
+
+        return self.returnAnnotations[node]
+
+    def _isChanged(self, node: ClassOrFunctionDef) -> bool:
+        """
+        Whether any line of the definition (including its decorators) is
+        among ``self.changedLines``. Always True if we check all definitions.
+        """
+        if self.changedLines is None:
+            return True
+
+        startLine: int = min(
+            [node.lineno] + [_.lineno for _ in node.decorator_list]
+        )
+        endLine: int = node.end_lineno or node.lineno
+        return not self.changedLines.isdisjoint(range(startLine, endLine + 1))
+
+    def _isDocstringChanged(self, node: ClassOrFunctionDef) -> bool:
+        """Whether any line of the docstring of ``node`` has changed"""
+        if self.changedLines is None:
+            return True
+
+        if not node.body or self.docStore.getDocstring(node) == '':
+            return False
+
+        docstringNode: ast.stmt = node.body[0]
+        endLine: int = docstringNode.end_lineno or docstringNode.lineno
+        return not self.changedLines.isdisjoint(
+            range(docstringNode.lineno, endLine + 1)
+        )
 
     def _checkClassDocstringAndConstructorDocstrings(
             self,
             node: FuncOrAsyncFuncDef,
             parent_: ast.ClassDef,
-            initDocstring: str,
-    ) -> str:
+    ) -> ClassOrFunctionDef:
         """
         Check class docstring and __init__() docstring.
 
         If only class docstring exists, or if __init__() is not allowed to have
-        its own docstring, return the class docstring for further checking.
+        its own docstring, return the class (whose docstring is used for
+        further checking).
 
-        Otherwise, return the __init__() docstring for further checking.
+        Otherwise, return the __init__() node for further checking.
         """
         if not isinstance(parent_, ast.ClassDef):
             msg = (
@@ -379,12 +641,10 @@ class Visitor(ast.NodeVisitor):
         className: str = parent_.name
         classLineNum: int = parent_.lineno
 
-        classDocstring: str = getDocstring(parent_)
-
-        if len(initDocstring) == 0:  # __init__() doesn't have own docstring
+        if self.docStore.getDocstring(node) == '':  # no own docstring
             # Check class docstring instead, because that's what we care
             # about when checking the class constructor.
-            return classDocstring
+            return parent_
 
         # Below: __init__() has its own docstring
         if not self.allowInitDocstring:
@@ -395,11 +655,11 @@ class Visitor(ast.NodeVisitor):
                     msgPrefix=f'Class `{className}`:',
                 )
             )
-            return classDocstring
+            return parent_
 
         # Below: __init__() is allowed to have a separate docstring
-        classDoc, classDocParsingError = parseDocstringInGivenStyle(
-            classDocstring,
+        classDoc, classDocParsingError = self.docStore.parseInGivenStyle(
+            parent_,
             self.style,
         )
         if classDocParsingError is not None:
@@ -412,10 +672,7 @@ class Visitor(ast.NodeVisitor):
                 )
             )
 
-        initDoc, _ = parseDocstringInGivenStyle(
-            initDocstring,
-            self.style,
-        )
+        initDoc, _ = self.docStore.parseInGivenStyle(node, self.style)
 
         if classDoc.hasReturnsSection:
             self.violations.append(
@@ -471,7 +728,7 @@ class Visitor(ast.NodeVisitor):
                 )
             )
 
-        return initDocstring
+        return node
 
     def checkArguments(  # noqa: C901, PLR0915
             self,
@@ -674,8 +931,9 @@ class Visitor(ast.NodeVisitor):
         v202 = Violation(code=202, line=lineNum, msgPrefix=msgPrefix)
         v203 = Violation(code=203, line=lineNum, msgPrefix=msgPrefix)
 
-        hasReturnStmt: bool = hasReturnStatements(node)
-        hasYieldStmt: bool = hasYieldStatements(node)
+        bodySummary: FunctionBodySummary = self._getBodySummary(node)
+        hasReturnStmt: bool = bodySummary.hasReturn
+        hasYieldStmt: bool = bodySummary.hasYield
         hasReturnAnno: bool = hasReturnAnnotation(node)
         hasGenAsRetAnno: bool = hasGeneratorAsReturnAnnotation(node)
         onlyHasYieldStmt: bool = hasYieldStmt and not hasReturnStmt
@@ -709,10 +967,7 @@ class Visitor(ast.NodeVisitor):
             violations.append(v202)
 
         if self.checkReturnTypes:
-            if hasReturnAnno:
-                returnAnno = ReturnAnnotation(unparseName(node.returns))
-            else:
-                returnAnno = ReturnAnnotation(annotation=None)
+            returnAnno = self._getReturnAnnotation(node)
 
             if docstringHasReturnSection:
                 returnSec: list[ReturnArg] = doc.returnSection
@@ -797,14 +1052,14 @@ class Visitor(ast.NodeVisitor):
 
         docstringHasYieldsSection: bool = doc.hasYieldsSection
 
-        hasYieldStmt: bool = hasYieldStatements(node)
+        hasYieldStmt: bool = self._getBodySummary(node).hasYield
         generatorAnnotationKind = getGeneratorAnnotationKind(node)
         hasGenAsRetAnno: bool = generatorAnnotationKind is not None
         hasIterAsRetAnno: bool = hasIteratorOrIterableAsReturnAnnotation(node)
         noGenNorIterAsRetAnno = not hasGenAsRetAnno and not hasIterAsRetAnno
 
         if hasGenAsRetAnno or hasIterAsRetAnno:
-            returnAnno = ReturnAnnotation(unparseName(node.returns))
+            returnAnno = self._getReturnAnnotation(node)
         else:
             # We don't check other return annotations here, because they
             # are checked above, in `checkReturns()`.
@@ -816,6 +1071,7 @@ class Visitor(ast.NodeVisitor):
                 returnAnnoText=returnAnno.annotation,
                 generatorAnnotationKind=generatorAnnotationKind,
                 hasIteratorOrIterableAsReturnAnnotation=hasIterAsRetAnno,
+                returnAnnoNode=returnAnno.node,
             )
             if hasYieldStmt:
                 if (
@@ -888,7 +1144,8 @@ class Visitor(ast.NodeVisitor):
         """
 
         # Just a sanity check:
-        assert (hasYieldStatements(node) and hasReturnStatements(node)) is True
+        bodySummary: FunctionBodySummary = self._getBodySummary(node)
+        assert (bodySummary.hasYield and bodySummary.hasReturn) is True
 
         violations: list[Violation] = []
 
@@ -908,17 +1165,18 @@ class Visitor(ast.NodeVisitor):
         hasGenAsRetAnno: bool = generatorAnnotationKind is not None
         hasIterAsRetAnno: bool = hasIteratorOrIterableAsReturnAnnotation(node)
 
-        hasReturnStmt: bool = hasReturnStatements(node)
-        hasYieldStmt: bool = hasYieldStatements(node)
+        bodySummary: FunctionBodySummary = self._getBodySummary(node)
+        hasReturnStmt: bool = bodySummary.hasReturn
+        hasYieldStmt: bool = bodySummary.hasYield
         onlyHasYieldStmt: bool = hasYieldStmt and not hasReturnStmt
         hasReturnAnno: bool = hasReturnAnnotation(node)
 
         if hasReturnStmt:
-            hasBareReturnStmt: bool = hasBareReturnStatements(node)
+            hasBareReturnStmt: bool = bodySummary.hasBareReturn
         else:
             hasBareReturnStmt = False  # to save some time
 
-        returnAnno = ReturnAnnotation(unparseName(node.returns))
+        returnAnno = self._getReturnAnnotation(node)
         returnSec: list[ReturnArg] = doc.returnSection
 
         # Check the return section in the docstring
@@ -952,6 +1210,7 @@ class Visitor(ast.NodeVisitor):
                 retTypeInGenerator = extractReturnTypeFromGeneratorAnnotation(
                     returnAnnoText=returnAnno.annotation,
                     generatorAnnotationKind=generatorAnnotationKind,
+                    returnAnnoNode=returnAnno.node,
                 )
                 checkReturnTypesForViolations(
                     style=self.style,
@@ -970,7 +1229,7 @@ class Visitor(ast.NodeVisitor):
             if not self.skipCheckingShortDocstrings:
                 violations.append(v402)
         elif self.checkYieldTypes:
-            returnAnno = ReturnAnnotation(unparseName(node.returns))
+            returnAnno = self._getReturnAnnotation(node)
             yieldSec: list[YieldArg] = doc.yieldSection
 
             if hasGenAsRetAnno or hasIterAsRetAnno:
@@ -1012,8 +1271,9 @@ class Visitor(ast.NodeVisitor):
         v504 = Violation(code=504, line=lineNum, msgPrefix=msgPrefix)
 
         docstringHasRaisesSection: bool = doc.hasRaisesSection
-        hasRaiseStmt: bool = hasRaiseStatements(node)
-        hasAssertStmt: bool = hasAssertStatements(node)
+        bodySummary: FunctionBodySummary = self._getBodySummary(node)
+        hasRaiseStmt: bool = bodySummary.hasRaise
+        hasAssertStmt: bool = bodySummary.hasAssert
 
         if hasRaiseStmt and not docstringHasRaisesSection:
             violations.append(v501)
@@ -1052,8 +1312,7 @@ class Visitor(ast.NodeVisitor):
                         docRaises.append(exc)
 
             docRaises.sort()
-            actualRaises: list[str] = getRaisedExceptions(
-                node,
+            actualRaises: list[str] = bodySummary.getRaisedExceptions(
                 self.shouldDeclareAssertErrorIfAssertStatementExists,
             )
 
@@ -1,20 +1,27 @@
+import json
 import shutil
+import stat
+import sys
 from pathlib import Path
 from textwrap import dedent
+from typing import Any
 
 import pytest
 from click.testing import CliRunner
 
+from pydoclint import main as main_module
 from pydoclint.baseline import (
     INDENT,
     SEPARATOR,
+    BaselineEvaluator,
+    StructuredBaseline,
     calcUnfixedBaselineViolationsAndRemainingViolations,
     generateBaseline,
     parseBaseline,
     reEvaluateBaseline,
     updateBaselineWithUnfixedViolations,
 )
-from pydoclint.main import _checkPaths, main
+from pydoclint.main import _checkPaths, _iterCheckPaths, main
 from pydoclint.utils.violation import Violation
 from tests.test_main import DATA_DIR, pythonVersionBelow310
 
@@ -92,6 +99,18 @@ def func2(arg1: str, arg2: list[int]) -> int:
     return True
 '''
 
+functionWithUndocumentedRaise = '''
+def func3(arg1: str) -> None:
+    """Something
+
+    Parameters
+    ----------
+    arg1 : str
+        Arg 1
+    """
+    raise ValueError(arg1)
+'''
+
 
 onlyOneFunctionWithBadDocstring = '''
 def bad_docstring_func(arg1: str, arg2: list[int]) -> bool:
@@ -582,6 +601,24 @@ def testBaselineIndent(
                 Violation(line=0, code=502, msgPrefix='', msgPostfix=''),
             ],
         ),
+        (  # A duplicated message matches as many times as it's in baseline
+            [
+                'DOC201: does not have a return section in docstring',
+                'DOC201: does not have a return section in docstring',
+            ],
+            [
+                Violation(line=1, code=201, msgPrefix='', msgPostfix=''),
+                Violation(line=2, code=201, msgPrefix='', msgPostfix=''),
+                Violation(line=3, code=201, msgPrefix='', msgPostfix=''),
+            ],
+            [
+                'DOC201: does not have a return section in docstring',
+                'DOC201: does not have a return section in docstring',
+            ],
+            [
+                Violation(line=3, code=201, msgPrefix='', msgPostfix=''),
+            ],
+        ),
     ],
 )
 def testCalcUnfixedBaselineViolationsAndRemainingViolations(
@@ -596,3 +633,348 @@ def testCalcUnfixedBaselineViolationsAndRemainingViolations(
     )
     assert unfixed == expectedUnfixed
     assert remaining == expectedRemaining
+
+
+def testBaselineFromStreamedViolations(baselineFile: Path) -> None:
+    violationsInAllFiles = _checkPaths(
+        paths=(DATA_DIR / 'numpy',),
+        style='numpy',
+        exclude=EXCLUDE_PATTERN,
+    )
+    generateBaseline(iter(violationsInAllFiles.items()), baselineFile)
+    streamedBaseline = baselineFile.read_text(encoding='utf-8')
+    generateBaseline(violationsInAllFiles, baselineFile)
+    assert baselineFile.read_text(encoding='utf-8') == streamedBaseline
+
+    parsedBaseline = parseBaseline(baselineFile)
+    evaluator = BaselineEvaluator(parsedBaseline)
+    remainingViolationsInAllFiles = dict(
+        evaluator.evaluate(iter(violationsInAllFiles.items()))
+    )
+    assert evaluator.regenerationNeeded is False
+    assert all(len(_) == 0 for _ in remainingViolationsInAllFiles.values())
+    assert (
+        evaluator.regenerationNeeded,
+        evaluator.unfixedBaselineViolationsInAllFiles,
+        remainingViolationsInAllFiles,
+    ) == reEvaluateBaseline(parsedBaseline, violationsInAllFiles)
+
+
+def testBaselineWithDuplicatedViolations(baselineFile: Path) -> None:
+    msg201 = 'DOC201: does not have a return section in docstring'
+    baselineFile.write_text(
+        f'a.py\n{INDENT}{msg201}\n{INDENT}{msg201}\n{SEPARATOR}'
+        f'b.py\n{SEPARATOR}'
+        f'c.py\n{INDENT}{msg201}\n{SEPARATOR}',
+        encoding='utf-8',
+    )
+    parsedBaseline = parseBaseline(baselineFile)
+    assert parsedBaseline == {
+        'a.py': [msg201, msg201],
+        'b.py': [],
+        'c.py': [msg201],
+    }
+
+    def violation201(line: int) -> Violation:
+        return Violation(line=line, code=201, msgPrefix='', msgPostfix='')
+
+    evaluator = BaselineEvaluator(parsedBaseline)
+    remaining = dict(
+        evaluator.evaluate([
+            ('a.py', [violation201(1)]),
+            ('c.py', [violation201(1), violation201(2)]),
+        ])
+    )
+    assert remaining == {'a.py': [], 'c.py': [violation201(2)]}
+    assert evaluator.regenerationNeeded is True  # one in a.py was fixed
+    assert evaluator.unfixedBaselineViolationsInAllFiles == {
+        'a.py': [msg201],
+        'c.py': [msg201],
+    }
+
+
+@pytest.mark.parametrize('suffix', ['.txt', '.jsonl'])
+def testDiffOnlyModeKeepsBaseline(
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        suffix: str,
+) -> None:
+    def function(name: str, docArg: str) -> str:
+        return (
+            f'def {name}(arg1: int) -> None:\n'
+            '    """\n'
+            '    Something\n'
+            '\n'
+            '    Parameters\n'
+            '    ----------\n'
+            f'    {docArg} : int\n'
+            '        Arg 1\n'
+            '\n'
+            '    Returns\n'
+            '    -------\n'
+            '    None\n'
+            '    """\n'
+        )
+
+    monkeypatch.chdir(tmp_path)
+    pyFile = Path('my_module.py')
+    baselinePath = Path(f'baseline{suffix}')
+    pyFile.write_text(
+        function('f', 'arg2') + '\n\n' + function('g', 'arg2'),
+        encoding='utf-8',
+    )
+    options = ['--baseline', str(baselinePath)]
+    result = CliRunner().invoke(
+        main, [*options, '--generate-baseline=True', str(pyFile)]
+    )
+    assert result.exit_code == 0, result.output
+    baselineBefore = baselinePath.read_text(encoding='utf-8')
+    assert 'Function `f`' in baselineBefore
+    assert 'Function `g`' in baselineBefore
+
+    # Fix g(); f() is outside of the diff, so it is not checked
+    pyFile.write_text(
+        function('f', 'arg2') + '\n\n' + function('g', 'arg1'),
+        encoding='utf-8',
+    )
+    diffFile = Path('changes.diff')
+    diffFile.write_text(
+        f'--- a/{pyFile}\n'
+        f'+++ b/{pyFile}\n'
+        '@@ -22 +22 @@\n'
+        '-    arg2 : int\n'
+        '+    arg1 : int\n',
+        encoding='utf-8',
+    )
+    result = CliRunner().invoke(
+        main,
+        [
+            *options,
+            '--auto-regenerate-baseline=True',
+            '--diff-only',
+            str(diffFile),
+            str(pyFile),
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    assert 'old violations were fixed' not in result.output
+    assert baselinePath.read_text(encoding='utf-8') == baselineBefore
+
+    result = CliRunner().invoke(
+        main,
+        [
+            *options,
+            '--generate-baseline=True',
+            '--diff-only',
+            str(diffFile),
+            str(pyFile),
+        ],
+    )
+    assert result.exit_code == 1
+    assert 'cannot be generated in the --diff-only mode' in result.output
+    assert baselinePath.read_text(encoding='utf-8') == baselineBefore
+
+
+@pytest.fixture
+def structuredProject(tmp_path: Path) -> tuple[Path, dict[str, Path]]:
+    fileMap = {
+        'a.py': tmp_path / 'a.py',
+        'b.py': tmp_path / 'sub' / 'b.py',
+    }
+    for path in fileMap.values():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(twoFunctionsWithBadDocstrings, encoding='utf-8')
+
+    baselinePath = tmp_path / 'baseline.jsonl'
+    result = CliRunner().invoke(
+        main,
+        [
+            '--baseline',
+            baselinePath.as_posix(),
+            '--generate-baseline=True',
+            tmp_path.as_posix(),
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    return baselinePath, fileMap
+
+
+def testStructuredBaselineGeneration(
+        structuredProject: tuple[Path, dict[str, Path]],
+        baselineFile: Path,
+) -> None:
+    baselinePath, fileMap = structuredProject
+    lines = baselinePath.read_text(encoding='utf-8').splitlines()
+    assert json.loads(lines[0]) == {
+        'format': 'pydoclint-baseline',
+        'version': 1,
+    }
+    records = [json.loads(_) for _ in lines[1:]]
+    assert [_['file'] for _ in records] == [
+        fileMap['a.py'].as_posix(),
+        fileMap['b.py'].as_posix(),
+    ]
+    assert all(_['hash'] is not None for _ in records)
+
+    # The same violation messages as in the text format
+    generateBaseline(
+        _checkPaths(
+            (baselinePath.parent.as_posix(),),
+            quiet=True,
+            exclude=EXCLUDE_PATTERN,
+        ),
+        baselineFile,
+    )
+    assert parseBaseline(baselinePath) == parseBaseline(baselineFile)
+
+
+def testStructuredBaselineSkipsUnchangedFiles(
+        structuredProject: tuple[Path, dict[str, Path]],
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    baselinePath, fileMap = structuredProject
+
+    # Regenerate it with the same options as the checks below
+    emptyBaseline = StructuredBaseline()
+    emptyBaseline.write(
+        _iterCheckPaths(
+            (baselinePath.parent.as_posix(),),
+            quiet=True,
+            exclude=EXCLUDE_PATTERN,
+            structuredBaseline=emptyBaseline,
+        ),
+        baselinePath,
+    )
+
+    parsedSources: list[bytes] = []
+    originalParse = main_module._parseRawSourceCode
+
+    def parseRawSourceCode(rawSrc: bytes) -> Any:
+        parsedSources.append(bytes(rawSrc))
+        return originalParse(rawSrc)
+
+    monkeypatch.setattr(main_module, '_parseRawSourceCode', parseRawSourceCode)
+
+    def check() -> dict[str, list[Violation]]:
+        return _checkPaths(
+            (baselinePath.parent.as_posix(),),
+            quiet=True,
+            exclude=EXCLUDE_PATTERN,
+            structuredBaseline=StructuredBaseline.load(baselinePath),
+        )
+
+    expected = _checkPaths(
+        (baselinePath.parent.as_posix(),),
+        quiet=True,
+        exclude=EXCLUDE_PATTERN,
+    )
+    parsedSources.clear()
+    assert check() == expected
+    assert parsedSources == []  # no file is parsed
+
+    fileMap['b.py'].write_text(badDocstringFunction, encoding='utf-8')
+    assert (
+        check()[fileMap['b.py'].as_posix()]
+        == expected[fileMap['b.py'].as_posix()][:2]
+    )
+    assert parsedSources == [badDocstringFunction.encode('utf-8')]
+
+    # Different options (that affect the results) mean different hashes
+    parsedSources.clear()
+    _checkPaths(
+        (fileMap['a.py'].as_posix(),),
+        quiet=True,
+        exclude=EXCLUDE_PATTERN,
+        skipCheckingRaises=True,
+        structuredBaseline=StructuredBaseline.load(baselinePath),
+    )
+    assert len(parsedSources) == 1
+
+
+def testStructuredBaselineAutoRegenerationRewritesAffectedRecords(
+        structuredProject: tuple[Path, dict[str, Path]],
+) -> None:
+    baselinePath, fileMap = structuredProject
+    linesBefore = baselinePath.read_text(encoding='utf-8').splitlines()
+
+    # Fix one of the two functions in b.py
+    fileMap['b.py'].write_text(badDocstringFunction, encoding='utf-8')
+    result = CliRunner().invoke(
+        main,
+        [
+            '--baseline',
+            baselinePath.as_posix(),
+            '--auto-regenerate-baseline=True',
+            baselinePath.parent.as_posix(),
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    assert 'successfully re-generated' in result.output
+
+    linesAfter = baselinePath.read_text(encoding='utf-8').splitlines()
+    assert linesAfter[:2] == linesBefore[:2]  # header and a.py, verbatim
+    recordB = json.loads(linesAfter[2])
+    assert recordB['file'] == fileMap['b.py'].as_posix()
+    assert len(recordB['violations']) == 2
+    assert recordB['hash'] is not None
+
+    # Fix one function in a.py, but add a new violation to it
+    fileMap['a.py'].write_text(
+        badDocstringFunction + functionWithUndocumentedRaise,
+        encoding='utf-8',
+    )
+    result = CliRunner().invoke(
+        main,
+        [
+            '--baseline',
+            baselinePath.as_posix(),
+            '--auto-regenerate-baseline=True',
+            baselinePath.parent.as_posix(),
+        ],
+    )
+    assert result.exit_code == 1
+    assert 'DOC501' in result.output
+
+    linesAfterAgain = baselinePath.read_text(encoding='utf-8').splitlines()
+    assert linesAfterAgain[2] == linesAfter[2]  # b.py, verbatim
+    recordA = json.loads(linesAfterAgain[1])
+    assert recordA['file'] == fileMap['a.py'].as_posix()
+    assert len(recordA['violations']) == 2
+    assert recordA['hash'] is None  # the record doesn't cover DOC501
+
+
+@pytest.mark.skipif(
+    sys.platform == 'win32', reason='No POSIX file permissions on Windows'
+)
+def testStructuredBaselineRewriteKeepsFilePermissions(
+        structuredProject: tuple[Path, dict[str, Path]],
+) -> None:
+    baselinePath, fileMap = structuredProject
+    # Not the private permissions of a temporary file
+    assert stat.S_IMODE(baselinePath.stat().st_mode) != 0o600
+
+    baselinePath.chmod(0o640)
+    fileMap['b.py'].write_text(badDocstringFunction, encoding='utf-8')
+    result = CliRunner().invoke(
+        main,
+        [
+            '--baseline',
+            baselinePath.as_posix(),
+            '--auto-regenerate-baseline=True',
+            baselinePath.parent.as_posix(),
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    assert 'successfully re-generated' in result.output
+    assert stat.S_IMODE(baselinePath.stat().st_mode) == 0o640
+
+
+def testStructuredBaselineWithInvalidFile(tmp_path: Path) -> None:
+    baselinePath = tmp_path / 'baseline.jsonl'
+    baselinePath.write_text('not json\n', encoding='utf-8')
+    result = CliRunner().invoke(
+        main,
+        ['--baseline', baselinePath.as_posix(), tmp_path.as_posix()],
+    )
+    assert result.exit_code == 1
+    assert 'Cannot read the baseline file' in result.output
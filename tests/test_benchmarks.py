@@ -0,0 +1,91 @@
+import ast
+from pathlib import Path
+
+import pytest
+
+from benchmarks.bench_suite import compareResults, runBenchmarks
+from benchmarks.corpus import CorpusSpec, generateCorpus, generateModule
+from pydoclint.main import _checkPaths
+from tests.test_main import EXCLUDE_PATTERN
+
+
+@pytest.mark.parametrize('style', ['numpy', 'google', 'sphinx'])
+def testGenerateCorpusIsDeterministic(tmp_path: Path, style: str) -> None:
+    spec = CorpusSpec(
+        numFiles=3,
+        functionsPerFile=10,
+        nestingDepth=2,
+        style=style,
+        typeHintComplexity=3,
+    )
+    paths1 = generateCorpus(spec, tmp_path / 'run1')
+    paths2 = generateCorpus(spec, tmp_path / 'run2')
+    assert [_.name for _ in paths1] == [_.name for _ in paths2]
+    assert all(
+        path1.read_bytes() == path2.read_bytes()
+        for path1, path2 in zip(paths1, paths2, strict=True)
+    )
+
+    # A file does not depend on the number of files, but on the seed
+    assert generateModule(spec, 1) == paths1[1].read_text(encoding='utf-8')
+    assert generateModule(spec, 1) != generateModule(
+        CorpusSpec(functionsPerFile=10, nestingDepth=2, seed=1), 1
+    )
+
+    for path in paths1:
+        tree = ast.parse(path.read_text(encoding='utf-8'))
+        functions = [
+            _ for _ in ast.walk(tree) if isinstance(_, ast.FunctionDef)
+        ]
+        assert all(ast.get_docstring(_) for _ in functions)
+
+    # Only the missing args are violations; the respelled type hints are not
+    violations = _checkPaths(
+        (str(tmp_path / 'run1'),),
+        style=style,
+        quiet=True,
+        exclude=EXCLUDE_PATTERN,
+    )
+    codes = {_.fullErrorCode for vs in violations.values() for _ in vs}
+    assert codes <= {'DOC101', 'DOC103'}
+
+
+def testCorpusSpecRejectsUnknownStyle() -> None:
+    with pytest.raises(ValueError, match='Unknown docstring style'):
+        CorpusSpec(style='epydoc')
+
+
+def testCompareResults() -> None:
+    baseline = {
+        'results': {
+            'a': {'min': 1.0},
+            'b': {'min': 1.0},
+            'c': {'min': 1.0},
+        }
+    }
+    current = {
+        'results': {
+            'a': {'min': 1.2},
+            'b': {'min': 1.05},
+            'd': {'min': 1.0},
+        }
+    }
+    assert compareResults(baseline, current, threshold=0.1) == [
+        ('a', 1.0, 1.2, 'regression'),
+        ('b', 1.0, 1.05, 'ok'),
+        ('c', 1.0, None, 'missing'),
+        ('d', None, 1.0, 'new'),
+    ]
+    assert compareResults(current, baseline, threshold=0.1)[0][-1] == (
+        'improvement'
+    )
+
+
+def testRunBenchmarks() -> None:
+    results = runBenchmarks(repeat=1, quick=True, select='^Visitor/')
+    assert set(results['results']) == {
+        'Visitor/synthetic-numpy',
+        'Visitor/py3_test_grammar',
+    }
+    assert all(_['min'] > 0 for _ in results['results'].values())
+    assert results['corpus']['numFiles'] > 0
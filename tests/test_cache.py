@@ -0,0 +1,207 @@
+import os
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+import pydoclint.cache
+import pydoclint.main
+from pydoclint.cache import (
+    MemoryResultCache,
+    ResultCache,
+    computeOptionsFingerprint,
+)
+from pydoclint.main import _checkFile, _checkPaths, main
+from pydoclint.utils.violation import Violation
+from tests.test_main import DATA_DIR, EXCLUDE_PATTERN
+
+SRC = '''
+def func(arg1: int) -> int:
+    """
+    Something
+
+    Parameters
+    ----------
+    arg2 : int
+        Arg 2
+    """
+    return arg1
+'''
+
+
+@pytest.fixture
+def cacheDir(tmp_path: Path) -> Path:
+    return tmp_path / 'cache'
+
+
+@pytest.fixture
+def pyFile(tmp_path: Path) -> Path:
+    file = tmp_path / 'my_module.py'
+    file.write_text(SRC, encoding='utf-8')
+    return file
+
+
+def _failIfCalled(*_args: object, **_kwargs: object) -> None:
+    raise AssertionError('The file should have been served from the cache')
+
+
+def testCacheHitSkipsChecking(
+        cacheDir: Path,
+        pyFile: Path,
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cache = ResultCache(cacheDir=cacheDir, options={'style': 'numpy'})
+    violations = _checkFile(pyFile, cache=cache)
+    assert len(violations) > 0
+    assert (cacheDir / '.gitignore').exists()
+
+    monkeypatch.setattr(pydoclint.main, '_parseSourceCode', _failIfCalled)
+    cachedViolations = _checkFile(pyFile, cache=cache)
+    assert cachedViolations == violations
+    assert [str(_) for _ in cachedViolations] == [str(_) for _ in violations]
+
+
+def testCacheMissWhenSourceChanges(cacheDir: Path, pyFile: Path) -> None:
+    cache = ResultCache(cacheDir=cacheDir, options={'style': 'numpy'})
+    violations = _checkFile(pyFile, cache=cache)
+    assert len(violations) > 0
+
+    pyFile.write_text(SRC.replace('arg2', 'arg1'), encoding='utf-8')
+    newViolations = _checkFile(pyFile, cache=cache)
+    assert newViolations != violations
+    assert newViolations == _checkFile(pyFile)
+
+
+def testCacheMissWhenOptionsChange(cacheDir: Path, pyFile: Path) -> None:
+    cache1 = ResultCache(cacheDir=cacheDir, options={'style': 'numpy'})
+    cache2 = ResultCache(cacheDir=cacheDir, options={'style': 'google'})
+    rawSrc = pyFile.read_bytes()
+    assert cache1.computeKey(rawSrc) != cache2.computeKey(rawSrc)
+
+    _checkFile(pyFile, cache=cache1)
+    assert cache2.get(cache2.computeKey(rawSrc)) is None
+
+
+def testOptionsFingerprintIsStable() -> None:
+    assert computeOptionsFingerprint({
+        'a': 1,
+        'b': True,
+    }) == computeOptionsFingerprint({'b': True, 'a': 1})
+
+
+def testOptionsFingerprintChangesWithSourceCode(
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fingerprint = computeOptionsFingerprint({'style': 'numpy'})
+    monkeypatch.setattr(
+        pydoclint.cache, 'computeSourceFingerprint', lambda: 'changed'
+    )
+    assert computeOptionsFingerprint({'style': 'numpy'}) != fingerprint
+
+
+def testCorruptedCacheEntryIsAMiss(cacheDir: Path) -> None:
+    cache = ResultCache(cacheDir=cacheDir, options={})
+    key = cache.computeKey(b'')
+    cache.put(key, [Violation(line=1, code=101)])
+    (cacheDir / key[:2] / f'{key}.json').write_text('{', encoding='utf-8')
+    assert cache.get(key) is None
+
+
+def testCacheRoundTripKeepsAppendedMessages(cacheDir: Path) -> None:
+    cache = ResultCache(cacheDir=cacheDir, options={})
+    violation = Violation(
+        line=3, code=105, msgPrefix='Function `f`:'
+    ).appendMoreMsg('arg1')
+    cache.put('abcd', [violation])
+    assert cache.get('abcd') == [violation]
+
+
+def testCachePruneEvictsLeastRecentlyUsed(cacheDir: Path) -> None:
+    cache = ResultCache(cacheDir=cacheDir, options={}, maxSizeMb=1)
+    longMsg = 'x' * 300_000  # ~300 KB per entry
+    keys = [cache.computeKey(bytes([i])) for i in range(5)]
+    for i, key in enumerate(keys):
+        cache.put(key, [Violation(line=1, code=1, msgPostfix=longMsg)])
+        entry = cacheDir / key[:2] / f'{key}.json'
+        os.utime(entry, (1_000_000 + i, 1_000_000 + i))
+
+    cache.prune()
+
+    remaining = [key for key in keys if cache.get(key) is not None]
+    assert remaining == keys[2:]
+
+
+def testCachePruneOnlyAfterWrites(
+        cacheDir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cache = ResultCache(cacheDir=cacheDir, options={})
+    cache.prune()  # no cache folder yet
+    cache.put('abcd', [Violation(line=1, code=101)])
+    cache.prune()
+
+    # A warm run, which writes nothing, does not look at the entries
+    warmCache = ResultCache(cacheDir=cacheDir, options={})
+    assert warmCache.get('abcd') is not None
+    with monkeypatch.context() as m:
+        m.setattr(Path, 'glob', _failIfCalled)
+        warmCache.prune()
+
+    globbed: list[str] = []
+    originalGlob = Path.glob
+
+    def glob(path: Path, pattern: str) -> object:
+        globbed.append(pattern)
+        return originalGlob(path, pattern)
+
+    monkeypatch.setattr(Path, 'glob', glob)
+    warmCache.put('efgh', [Violation(line=1, code=101)])
+    warmCache.prune()
+    assert globbed == ['*/*.json']
+
+
+def testCheckPathsWithCache(cacheDir: Path) -> None:
+    paths = (str(DATA_DIR / 'numpy' / 'args'),)
+    options = {'quiet': True, 'exclude': EXCLUDE_PATTERN}
+    uncached = _checkPaths(paths, **options)
+    cold = _checkPaths(paths, cacheDir=str(cacheDir), **options)
+    warm = _checkPaths(paths, cacheDir=str(cacheDir), jobs=2, **options)
+    assert len(uncached) > 0
+    assert uncached == cold == warm
+
+
+def testMemoryResultCacheEvictsLeastRecentlyUsed() -> None:
+    cache = MemoryResultCache(options={}, maxEntries=2)
+    keys = [cache.computeKey(bytes([i])) for i in range(3)]
+    cache.put(keys[0], [Violation(line=1, code=101)])
+    cache.put(keys[1], [])
+    assert cache.get(keys[0]) == [Violation(line=1, code=101)]  # now recent
+    cache.put(keys[2], [])
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[2]) == []
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def testCacheIsOptIn(
+        cacheDir: Path,
+        pyFile: Path,
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.chdir(pyFile.parent)
+    result = CliRunner().invoke(main, [str(pyFile)])
+    assert result.exit_code == 1
+    assert list(pyFile.parent.iterdir()) == [pyFile]  # nothing is cached
+
+    result = CliRunner().invoke(
+        main, ['--cache-dir', str(cacheDir), '--no-cache', str(pyFile)]
+    )
+    assert result.exit_code == 1
+    assert not cacheDir.exists()
+
+    result = CliRunner().invoke(
+        main, ['--cache-dir', str(cacheDir), str(pyFile)]
+    )
+    assert result.exit_code == 1
+    assert list(cacheDir.glob('*/*.json')) != []
@@ -0,0 +1,257 @@
+import base64
+import socket
+import stat
+import threading
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from pydoclint.baseline import StructuredBaseline, generateBaseline
+from pydoclint.daemon import DaemonState, serveDaemon
+from pydoclint.daemon_client import DaemonError, main, sendDaemonRequest
+from pydoclint.main import _checkPaths, _iterCheckPaths
+from pydoclint.main import main as pydoclintMain
+from tests.test_main import EXCLUDE_PATTERN
+
+SRC = '''
+def func(arg1: int) -> None:
+    """
+    Something
+
+    Parameters
+    ----------
+    arg2 : int
+        Arg 2
+    """
+'''
+
+OPTIONS = {'style': 'numpy', 'exclude': EXCLUDE_PATTERN}
+
+
+@pytest.fixture
+def pyFile(tmp_path: Path) -> Path:
+    file = tmp_path / 'my_module.py'
+    file.write_text(SRC, encoding='utf-8')
+    return file
+
+
+def testDaemonStateCheckFilesAndBuffers(
+        pyFile: Path,
+        tmp_path: Path,
+) -> None:
+    state = DaemonState(OPTIONS)
+    request = {
+        'command': 'check',
+        'cwd': str(tmp_path),
+        'paths': ['my_module.py', 'unsaved.py'],
+        'buffers': {'unsaved.py': _encode(SRC.replace('arg2', 'arg1'))},
+    }
+    response = state.handleRequest(request)
+    assert response['ok']
+
+    expected = _checkPaths((str(pyFile),), quiet=True, **OPTIONS)
+    assert response['violations'] == {
+        'my_module.py': [
+            [_.line, _.fullErrorCode, _.msg] for _ in expected[str(pyFile)]
+        ],
+        'unsaved.py': [],
+    }
+
+    # The results of unchanged files are served from the in-memory cache
+    assert state.handleRequest(request) == response
+    assert state.resultCache.hits == 2
+    assert Path.cwd() != tmp_path  # the paths are resolved without chdir
+
+
+def testDaemonStateDecodesBuffersLikeFiles(tmp_path: Path) -> None:
+    # The buffer is decoded with its PEP 263 encoding cookie, not as UTF-8
+    source: str = '# -*- coding: latin-1 -*-\n' + SRC.replace('arg2', 'argé')
+    state = DaemonState(OPTIONS)
+    response = state.handleRequest({
+        'command': 'check',
+        'cwd': str(tmp_path),
+        'paths': ['unsaved.py'],
+        'buffers': {
+            'unsaved.py': base64.b64encode(source.encode('latin-1')).decode()
+        },
+    })
+    assert response['ok']
+    [[_, code, msg]] = response['violations']['unsaved.py']
+    assert code == 'DOC103'
+    assert '[argé: int]' in msg
+
+
+def testDaemonStateAppliesBaseline(pyFile: Path, tmp_path: Path) -> None:
+    baselineFile: Path = tmp_path / 'baseline.txt'
+    violations = _checkPaths((str(pyFile),), quiet=True, **OPTIONS)
+    generateBaseline({'my_module.py': violations[str(pyFile)]}, baselineFile)
+    request = {
+        'command': 'check',
+        'cwd': str(tmp_path),
+        'paths': ['my_module.py'],
+    }
+
+    state = DaemonState(OPTIONS, baseline=str(baselineFile))
+    assert state.handleRequest(request) == {
+        'ok': True,
+        'violations': {'my_module.py': []},
+        'baseline': None,
+    }
+
+    # Some old violations are fixed: like `pydoclint --baseline`, the
+    # baseline file is regenerated (or reported as outdated)
+    pyFile.write_text(SRC.replace('arg2', 'arg1'), encoding='utf-8')
+    noRegeneration = DaemonState(
+        OPTIONS,
+        baseline=str(baselineFile),
+        autoRegenerateBaseline=False,
+    )
+    assert noRegeneration.handleRequest(request)['baseline'] == 'outdated'
+
+    assert state.handleRequest(request)['baseline'] == 'regenerated'
+    assert baselineFile.read_text(encoding='utf-8') == ''
+
+    # The regenerated baseline is reloaded
+    pyFile.write_text(SRC, encoding='utf-8')
+    response = state.handleRequest(request)
+    assert len(response['violations']['my_module.py']) == 1
+    assert response['baseline'] is None
+
+
+def testDaemonStateErrors(tmp_path: Path) -> None:
+    state = DaemonState(OPTIONS)
+    assert state.handleRequest({'command': 'ping'}) == {'ok': True}
+    assert not state.handleRequest({'command': 'unknown'})['ok']
+
+    response = state.handleRequest({
+        'command': 'check',
+        'cwd': str(tmp_path),
+        'paths': ['missing.py'],
+    })
+    assert not response['ok']
+    assert 'missing.py' in response['error']
+
+    assert not state.shouldStop
+    assert state.handleRequest({'command': 'shutdown'}) == {'ok': True}
+    assert state.shouldStop
+
+
+def testDaemonStateRegeneratesStructuredBaseline(tmp_path: Path) -> None:
+    pyFile: Path = tmp_path / 'my_module.py'
+    pyFile.write_text(SRC + SRC.replace('func', 'func2'), encoding='utf-8')
+    baselineFile: Path = tmp_path / 'baseline.jsonl'
+    emptyBaseline = StructuredBaseline()
+    emptyBaseline.write(
+        _iterCheckPaths(
+            ('my_module.py',), quiet=True, cwd=str(tmp_path), **OPTIONS
+        ),
+        baselineFile,
+    )
+
+    # Fix one of the two functions
+    pyFile.write_text(SRC + SRC.replace('arg2', 'arg1'), encoding='utf-8')
+    state = DaemonState(OPTIONS, baseline=str(baselineFile))
+    response = state.handleRequest({
+        'command': 'check',
+        'cwd': str(tmp_path),
+        'paths': ['my_module.py'],
+    })
+    assert response['baseline'] == 'regenerated'
+
+    # The file is hashed in the client's working directory
+    [record] = StructuredBaseline.load(baselineFile).records.values()
+    assert record['file'] == 'my_module.py'
+    assert len(record['violations']) == 1
+    assert record['hash'] is not None
+
+
+def testDaemonRefusesToGenerateBaseline(tmp_path: Path) -> None:
+    result = CliRunner().invoke(
+        pydoclintMain,
+        [
+            '--daemon',
+            '--daemon-socket',
+            str(tmp_path / 'daemon.sock'),
+            '--baseline',
+            str(tmp_path / 'baseline.txt'),
+            '--generate-baseline=True',
+        ],
+    )
+    assert result.exit_code == 1
+    assert 'cannot be generated in the --daemon mode' in result.output
+    assert not (tmp_path / 'daemon.sock').exists()
+
+
+@pytest.mark.skipif(
+    not hasattr(socket, 'AF_UNIX'),
+    reason='Unix domain sockets are not supported',
+)
+@pytest.mark.usefixtures('pyFile')
+def testDaemonEndToEnd(
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+) -> None:
+    socketPath = str(tmp_path / 'daemon.sock')
+    server = threading.Thread(target=serveDaemon, args=(socketPath, OPTIONS))
+    server.start()
+    try:
+        for _ in range(100):  # wait for the daemon to start listening
+            try:
+                sendDaemonRequest(socketPath, {'command': 'ping'})
+                break
+            except DaemonError:
+                threading.Event().wait(0.05)
+
+        monkeypatch.chdir(tmp_path)
+        assert main(['--daemon-socket', socketPath, 'my_module.py']) == 1
+        stderr = capsys.readouterr().err
+        assert stderr.startswith('my_module.py\n    2: DOC103: ')
+        assert stat.S_IMODE(Path(socketPath).stat().st_mode) == 0o600
+
+        with pytest.raises(DaemonError, match='already listening'):
+            serveDaemon(socketPath, OPTIONS)
+    finally:
+        assert main(['--daemon-socket', socketPath, '--shutdown']) == 0
+        server.join(timeout=10)
+
+    assert not server.is_alive()
+    assert not Path(socketPath).exists()
+
+
+@pytest.mark.skipif(
+    not hasattr(socket, 'AF_UNIX'),
+    reason='Unix domain sockets are not supported',
+)
+def testDaemonSocketPathIsAbsolute(
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # The relative socket path is resolved when the daemon starts, so that
+    # it does not depend on the working directory later on
+    monkeypatch.chdir(tmp_path)
+    server = threading.Thread(
+        target=serveDaemon, args=('daemon.sock', OPTIONS)
+    )
+    server.start()
+    socketPath = str(tmp_path / 'daemon.sock')
+    try:
+        for _ in range(100):  # wait for the daemon to start listening
+            try:
+                sendDaemonRequest(socketPath, {'command': 'ping'})
+                break
+            except DaemonError:
+                threading.Event().wait(0.05)
+
+        monkeypatch.chdir(tmp_path.parent)
+    finally:
+        assert main(['--daemon-socket', socketPath, '--shutdown']) == 0
+        server.join(timeout=10)
+
+    assert not server.is_alive()
+    assert not Path(socketPath).exists()
+
+
+def _encode(source: str) -> str:
+    return base64.b64encode(source.encode('utf-8')).decode()
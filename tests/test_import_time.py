@@ -0,0 +1,75 @@
+import importlib.metadata
+import subprocess  # noqa: S404  # only runs this interpreter, with fixed args
+import sys
+
+import pytest
+
+import pydoclint
+
+# Generous, so that slow CI machines do not fail this test; a regression
+# that makes the CLI import the heavy modules eagerly again is caught (more
+# reliably) by ``testHeavyModulesAreNotImportedAtStartup()``
+IMPORT_TIME_BUDGET_MS = 500
+
+# Modules that are only needed once a file is actually checked (or when an
+# optional feature is used), so the start-up should not pay for them
+LAZILY_IMPORTED_MODULES = (
+    'pydoclint.visitor',
+    'pydoclint.baseline',
+    'pydoclint.daemon',
+    'pydoclint.utils.doc',
+    'pydoclint.utils.parse_docstring',
+    'docstring_parser',
+    'concurrent.futures.process',
+    'multiprocessing',
+    'importlib.metadata',
+    'tomllib',
+    'tomli',
+)
+
+
+def _importPydoclintMain() -> dict[str, int]:
+    """
+    Import ``pydoclint.main`` in a fresh interpreter with ``-X importtime``,
+    and return the cumulative import time (in microseconds) of each module.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import pydoclint.main'],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    cumulativeTimes: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+
+        _, cumulative, module = line.split('|')
+        cumulativeTimes[module.strip()] = int(cumulative)
+
+    return cumulativeTimes
+
+
+def testHeavyModulesAreNotImportedAtStartup() -> None:
+    importedModules = set(_importPydoclintMain())
+    for module in LAZILY_IMPORTED_MODULES:
+        assert module not in importedModules
+
+
+@pytest.mark.skipif(
+    sys.platform == 'win32',
+    reason='Process start-up is too noisy on Windows CI runners',
+)
+def testColdStartImportTime() -> None:
+    # The fastest of a few runs, to filter out noise from the machine
+    importTimeMs = min(
+        _importPydoclintMain()['pydoclint.main'] / 1000 for _ in range(3)
+    )
+    assert importTimeMs < IMPORT_TIME_BUDGET_MS
+
+
+def testVersionIsResolvedLazily() -> None:
+    assert pydoclint.__version__ == importlib.metadata.version('pydoclint')
+    with pytest.raises(AttributeError):
+        pydoclint.nonExistentAttribute  # noqa: B018
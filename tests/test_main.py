@@ -1,14 +1,29 @@
 import copy
 import itertools
+import os
 import sys
 from pathlib import Path
+from typing import Any
 
+import click
 import pytest
-
-from pydoclint.main import _checkFile
+from click.testing import CliRunner
+
+import pydoclint.main
+from pydoclint import visitor
+from pydoclint.main import (
+    _checkFile,
+    _checkPaths,
+    _iterCheckPaths,
+    main,
+    validateJobsValue,
+)
+from pydoclint.utils.rule_selection import RuleSelection
+from pydoclint.utils.violation import Violation
 
 THIS_DIR = Path(__file__).parent
 DATA_DIR = THIS_DIR / 'test_data'
+EXCLUDE_PATTERN = r'\.git|\.tox'
 
 
 def pythonVersionBelow310() -> bool:
@@ -1846,3 +1861,277 @@ def testInlineClassAttributeDocs(
             requireInlineClassVarDocs, argTypeHintsInDocstring
         ]
     )
+
+
+@pytest.mark.parametrize('style', ['google', 'numpy', 'sphinx'])
+def testCheckPathsInParallel(style: str) -> None:
+    serialViolations = _checkPaths(
+        (str(DATA_DIR / style),),
+        style=style,
+        quiet=True,
+        exclude=EXCLUDE_PATTERN,
+        jobs=1,
+    )
+    parallelViolations = _checkPaths(
+        (str(DATA_DIR / style),),
+        style=style,
+        quiet=True,
+        exclude=EXCLUDE_PATTERN,
+        jobs=3,
+    )
+    assert len(serialViolations) > 0
+    assert list(parallelViolations) == list(serialViolations)
+    assert parallelViolations == serialViolations
+
+
+def testIterCheckPathsStreamsResults(monkeypatch: pytest.MonkeyPatch) -> None:
+    checkedFiles: list[Path] = []
+
+    def checkFile(filename: Path, **kwargs: Any) -> list[Violation]:
+        checkedFiles.append(filename)
+        return _checkFile(filename, **kwargs)
+
+    monkeypatch.setattr(pydoclint.main, '_checkFile', checkFile)
+
+    results = _iterCheckPaths(
+        (str(DATA_DIR / 'numpy'),),
+        quiet=True,
+        exclude=EXCLUDE_PATTERN,
+    )
+    firstFilename, _ = next(results)
+    assert checkedFiles == [Path(firstFilename)]  # no other file checked yet
+
+    remainingFilenames = [filename for filename, _ in results]
+    assert [Path(_) for _ in [firstFilename, *remainingFilenames]] == (
+        checkedFiles
+    )
+
+
+def testCheckPathsInParallelKeepsOrderWithSmallChunks(
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # With one file per chunk, many chunks are in the reorder buffer at once
+    monkeypatch.setattr(pydoclint.main, 'MAX_PARALLEL_CHUNK_SIZE', 1)
+    options: dict[str, Any] = {
+        'style': 'numpy',
+        'quiet': True,
+        'exclude': EXCLUDE_PATTERN,
+    }
+    serialViolations = _checkPaths((str(DATA_DIR),), jobs=1, **options)
+    parallelViolations = _checkPaths((str(DATA_DIR),), jobs=2, **options)
+    assert list(parallelViolations) == list(serialViolations)
+    assert parallelViolations == serialViolations
+
+
+@pytest.mark.parametrize(
+    ('value', 'expected'),
+    [
+        ('1', 1),
+        ('8', 8),
+        (4, 4),
+        ('auto', os.cpu_count() or 1),
+        ('AUTO', os.cpu_count() or 1),
+    ],
+)
+def testValidateJobsValue(value: str | int, expected: int) -> None:
+    assert validateJobsValue(None, None, value) == expected  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize('value', ['0', '-2', 'many', '1.5'])
+def testValidateJobsValueInvalid(value: str) -> None:
+    with pytest.raises(click.BadParameter):
+        validateJobsValue(None, None, value)  # type: ignore[arg-type]
+
+
+def testCheckPathsDiffOnly(tmp_path: Path) -> None:
+    src = '''
+def unchanged(arg1: int) -> None:
+    """
+    Something
+
+    Parameters
+    ----------
+    arg2 : int
+        Arg 2
+    """
+
+
+def changed(arg1: int) -> None:
+    """
+    Something
+
+    Parameters
+    ----------
+    arg2 : int
+        Arg 2
+    """
+'''
+    file = tmp_path / 'my_module.py'
+    file.write_text(src, encoding='utf-8')
+    untouched = tmp_path / 'untouched.py'
+    untouched.write_text(src, encoding='utf-8')
+
+    allViolations = _checkPaths(
+        (str(tmp_path),),
+        style='numpy',
+        quiet=True,
+        exclude=EXCLUDE_PATTERN,
+    )
+    assert {_.line for _ in allViolations[str(file)]} == {2, 13}
+
+    for jobs in [1, 2]:
+        violations = _checkPaths(
+            (str(tmp_path),),
+            style='numpy',
+            quiet=True,
+            exclude=EXCLUDE_PATTERN,
+            jobs=jobs,
+            changedLinesByFile={file.resolve().as_posix(): {16}},
+        )
+        assert list(violations) == [str(file)]
+        assert violations[str(file)] == [
+            _ for _ in allViolations[str(file)] if _.line == 13
+        ]
+
+
+NON_UTF8_SRC = '''# -*- coding: latin-1 -*-
+def func(größe: int, arg2: int) -> None:
+    """
+    Something (ß)
+
+    Parameters
+    ----------
+    größe : int
+        Size
+    """  # noqa: DOC101
+'''
+
+
+def testCheckFileHonorsEncodingCookie(tmp_path: Path) -> None:
+    file = tmp_path / 'latin1.py'
+    file.write_bytes(NON_UTF8_SRC.encode('latin-1'))
+
+    # Only the DOC103 violation: the non-ASCII argument name is decoded
+    # correctly, and the noqa comment is found in the decoded text
+    violations = _checkFile(file, style='numpy')
+    assert [_.code for _ in violations] == [103]
+    assert 'arg2: int' in str(violations[0])
+
+
+def testCheckFileWithUndecodableBytes(tmp_path: Path) -> None:
+    # Falls back to replacing the undecodable bytes (without a cookie, the
+    # source code is decoded as UTF-8)
+    file = tmp_path / 'undecodable.py'
+    file.write_bytes(
+        NON_UTF8_SRC.replace('größe', 'size').encode('latin-1')[25:]
+    )
+    violations = _checkFile(file, style='numpy')
+    assert [_.code for _ in violations] == [103]
+
+
+@pytest.mark.parametrize('style', ['numpy', 'google', 'sphinx'])
+def testCheckFileWithMmap(
+        monkeypatch: pytest.MonkeyPatch,
+        style: str,
+) -> None:
+    options: dict[str, Any] = {
+        'style': style,
+        'quiet': True,
+        'exclude': EXCLUDE_PATTERN,
+    }
+    violationsRead = _checkPaths((str(DATA_DIR),), **options)
+
+    # Every non-empty file is memory-mapped
+    monkeypatch.setattr(pydoclint.main, 'MMAP_SIZE_THRESHOLD', 1)
+    violationsMapped = _checkPaths((str(DATA_DIR),), **options)
+    assert violationsMapped == violationsRead
+
+
+@pytest.mark.parametrize('style', ['numpy', 'google', 'sphinx'])
+@pytest.mark.parametrize(
+    ('select', 'ignore'),
+    [
+        ('DOC1', ''),
+        ('', 'DOC5,DOC6,DOC003'),
+        ('DOC2,DOC4', ''),
+        ('DOC001,DOC3', 'DOC301'),  # neither function nor attribute checks
+    ],
+)
+def testSelectAndIgnoreSameAsFiltering(
+        style: str,
+        select: str,
+        ignore: str,
+) -> None:
+    options: dict[str, Any] = {
+        'style': style,
+        'checkStyleMismatch': True,
+        'allowInitDocstring': True,
+        'quiet': True,
+        'exclude': EXCLUDE_PATTERN,
+    }
+    rules = RuleSelection(select=select, ignore=ignore)
+    expected = {
+        filename: [_ for _ in violations if rules.isEnabled(_.code)]
+        for filename, violations in _checkPaths(
+            (str(DATA_DIR),), **options
+        ).items()
+    }
+    actual = _checkPaths(
+        (str(DATA_DIR),), select=select, ignore=ignore, **options
+    )
+    assert actual == expected
+
+
+def testSelectAndIgnoreSkipDisabledChecks(
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def _fail(*_args: Any, **_kwargs: Any) -> None:
+        pytest.fail('A disabled check was run')
+
+    # Neither the function bodies nor the class attributes are looked at
+    monkeypatch.setattr(visitor, 'summarizeFunctionBody', _fail)
+    monkeypatch.setattr(
+        visitor, 'checkClassAttributesAgainstClassDocstring', _fail
+    )
+    violations = _checkPaths(
+        (str(DATA_DIR / 'numpy'),),
+        select='DOC1',
+        quiet=True,
+        exclude=EXCLUDE_PATTERN,
+    )
+    codes = {_.code for vs in violations.values() for _ in vs}
+    assert codes
+    assert all(100 <= _ < 200 for _ in codes)
+
+
+def testSelectAndIgnoreOptions(tmp_path: Path) -> None:
+    (tmp_path / 'pyproject.toml').write_text(
+        '[tool.pydoclint]\nselect = ["DOC1", "DOC2"]\nignore = "DOC103"\n',
+        encoding='utf-8',
+    )
+    (tmp_path / 'a.py').write_text(
+        'def f(x: int) -> int:\n'
+        '    """\n    Summary\n\n    Parameters\n    ----------\n'
+        '    y : int\n        Y\n    """\n'
+        '    return x\n',
+        encoding='utf-8',
+    )
+    result = CliRunner().invoke(
+        main,
+        ['--config', str(tmp_path / 'pyproject.toml'), str(tmp_path / 'a.py')],
+    )
+    assert 'DOC201' in result.output
+    assert 'DOC203' in result.output
+    assert 'DOC103' not in result.output  # ignored
+
+    result = CliRunner().invoke(
+        main, ['--select', 'DOC1', str(tmp_path / 'a.py')]
+    )
+    assert 'DOC103' in result.output
+    assert 'DOC201' not in result.output
+
+    result = CliRunner().invoke(
+        main, ['--select', 'DOC1x', str(tmp_path / 'a.py')]
+    )
+    assert result.exit_code == 2
+    assert 'Invalid violation code prefix' in result.output
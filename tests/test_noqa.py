@@ -1,9 +1,12 @@
+import ast
+import tokenize
 from textwrap import dedent
 
 import pytest
 
 from pydoclint.utils.noqa import (
     codeIsSuppressed,
+    collectNativeNoqaSuppression,
     collectNoqaCodesByLine,
     parseNoqaComment,
 )
@@ -93,6 +96,48 @@ def testCollectNoqaCodesByLine(
     assert collectNoqaCodesByLine(src) == expected
 
 
+def testCollectNoqaCodesByLine_skipsTokenizationWithoutNoqa(
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def fail(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError('Should not tokenize')
+
+    monkeypatch.setattr(tokenize, 'generate_tokens', fail)
+    src = 'def func():  # a comment\n    return "noqa: DOC101"\n'
+    assert collectNoqaCodesByLine(src) == {}
+
+
+def testCollectNoqaCodesByLine_ignoresNoqaInStrings() -> None:
+    src = 'x = "# noqa: DOC101"\ny = 1  # noqa: DOC102\n'
+    assert collectNoqaCodesByLine(src) == {2: {'DOC102'}}
+
+
+def testCollectNativeNoqaSuppression_onlyGivenDefinitionLines() -> None:
+    src = dedent(
+        """
+        def funcOne():  # noqa: DOC101
+            pass
+
+        class MyClass:
+            def funcTwo(self):  # noqa: DOC102
+                pass
+        """
+    )
+    tree = ast.parse(src)
+    codesByLine = collectNoqaCodesByLine(src)
+    assert collectNativeNoqaSuppression(
+        tree=tree,
+        codesByLine=codesByLine,
+        location='definition',
+    ) == {2: {'DOC101'}, 6: {'DOC102'}}
+    assert collectNativeNoqaSuppression(
+        tree=tree,
+        codesByLine=codesByLine,
+        location='definition',
+        definitionLines={6},
+    ) == {6: {'DOC102'}}
+
+
 @pytest.mark.parametrize(
     ('suppressedCodes', 'code', 'expected'),
     [
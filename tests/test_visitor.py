@@ -0,0 +1,113 @@
+import ast
+import sys
+from pathlib import Path
+
+import pytest
+
+from pydoclint.visitor import Visitor
+
+DATA_DIR = Path(__file__).parent / 'test_data'
+
+NESTED_SRC = '''
+def f1(arg1: int) -> None:
+    """F1"""
+
+try:
+    class A:
+        """A"""
+
+        def f2(self, arg2: int) -> None:
+            """F2"""
+except ValueError:
+    def f3(arg3: int) -> None:
+        """F3"""
+else:
+    def f4(arg4: int) -> None:
+        """F4"""
+finally:
+    with open('file') as fp:
+        if fp:
+            def f5(arg5: int) -> None:
+                """F5"""
+
+            match fp:
+                case 1:
+                    def f6(arg6: int) -> None:
+                        """F6"""
+        else:
+            def f7(arg7: int) -> None:
+                """F7"""
+
+x = [lambda arg8: arg8 for _ in range(3)]  # not a definition
+'''
+
+
+class _RecursiveVisitor(Visitor):
+    """The ``Visitor`` with a recursive traversal of all nodes"""
+
+    def visit(self, node: ast.AST) -> None:
+        ast.NodeVisitor.visit(self, node)
+
+    def _visitChildren(self, node: ast.AST) -> None:
+        self.generic_visit(node)
+
+
+def _render(visitor: Visitor) -> list[str]:
+    return [f'{_.line}: {_}' for _ in visitor.violations]
+
+
+def testVisitor_visitsDefinitionsInStatementListsInOrder() -> None:
+    visitor = Visitor(style='numpy', skipCheckingShortDocstrings=False)
+    visitor.visit(ast.parse(NESTED_SRC))
+    assert [_.line for _ in visitor.violations if _.code == 101] == [
+        2,
+        9,
+        12,
+        15,
+        20,
+        25,
+        28,
+    ]
+
+
+@pytest.mark.parametrize('style', ['numpy', 'google', 'sphinx'])
+def testVisitor_sameViolationsAsRecursiveTraversal(style: str) -> None:
+    for filename in sorted(DATA_DIR.rglob('*.py')):
+        if not filename.is_file():  # some folder names end with ".py"
+            continue
+
+        try:
+            tree = ast.parse(filename.read_bytes())
+        except (SyntaxError, ValueError):
+            continue
+
+        options = {'style': style, 'checkClassAttributes': True}
+        visitor = Visitor(**options)
+        visitor.visit(tree)
+        recursiveVisitor = _RecursiveVisitor(**options)
+        recursiveVisitor.visit(tree)
+        assert _render(visitor) == _render(recursiveVisitor)
+
+
+def testVisitor_deeplyNestedCode() -> None:
+    # Deeper than the recursion limit (the parser cannot produce such trees
+    # from source code, so the tree is built directly)
+    depth: int = sys.getrecursionlimit() * 2
+    innermost: ast.stmt = ast.parse(
+        'def f(arg1: int) -> None:\n    """F"""'
+    ).body[0]
+    node: ast.stmt = innermost
+    for _ in range(depth):
+        node = ast.If(
+            test=ast.Constant(value=True),
+            body=[node],
+            orelse=[],
+            lineno=1,
+            col_offset=0,
+        )
+
+    tree = ast.Module(body=[node], type_ignores=[])
+
+    visitor = Visitor(style='numpy', skipCheckingShortDocstrings=False)
+    visitor.visit(tree)
+    assert [_.code for _ in visitor.violations] == [101, 103]
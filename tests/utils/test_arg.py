@@ -148,6 +148,22 @@ def testArg_typeHintsEq(str1: str, str2: str, expected: bool) -> None:
     assert Arg._typeHintsEq(str1, str2) == expected
 
 
+def testArg_equalArgsHaveEqualHashes() -> None:
+    arg1 = Arg('abc', 'Literal["abc", "def"]')
+    arg2 = Arg('abc', "Literal[\n  'abc',\n  'def',\n]  # comment")
+    assert arg1 == arg2
+    assert hash(arg1) == hash(arg2)
+    assert {arg1} == {arg2}
+
+
+def testArgList_equalsIgnoresQuotingWhenOrderDoesNotMatter() -> None:
+    # Used to be a DOC105 (with no args listed) with --check-arg-order=False
+    signatureArgs = ArgList([Arg('a', "Literal['foo']"), Arg('b', 'int')])
+    docArgs = ArgList([Arg('b', 'int'), Arg('a', 'Literal["foo"]')])
+    assert signatureArgs.equals(docArgs, orderMatters=False)
+    assert signatureArgs.findArgsWithDifferentTypeHints(docArgs) == []
+
+
 @pytest.mark.parametrize(
     ('input_', 'expected'),
     [
@@ -418,3 +434,12 @@ def testArgList_insertAt_duplicateNameRaisesError() -> None:
 
     with pytest.raises(ValueError, match='Arg with name "a" already exists'):
         argList.insertAt(1, Arg('a', '999'))
+
+
+def testArgAndArgList_haveNoInstanceDict() -> None:
+    arg = Arg(name='a', typeHint='int')
+    argList = ArgList([arg])
+
+    assert not hasattr(arg, '__dict__')
+    assert not hasattr(argList, '__dict__')
+    assert argList.lookup == {'a': 'int'}  # built lazily
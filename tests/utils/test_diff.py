@@ -0,0 +1,69 @@
+from pathlib import Path
+
+import pytest
+
+from pydoclint.utils.diff import parseUnifiedDiff, resolveDiffPaths
+
+DIFF = """diff --git a/pkg/mod.py b/pkg/mod.py
+index 1111111..2222222 100644
+--- a/pkg/mod.py
++++ b/pkg/mod.py
+@@ -3,4 +3,4 @@ def func():
+     a = 1
+-    b = 2
++    b = 3
++    c = 4
+     return a
+-- removed comment line
+@@ -20 +21 @@
+-x = 1
++x = 2
+diff --git a/old.py b/old.py
+deleted file mode 100644
+--- a/old.py
++++ /dev/null
+@@ -1,2 +0,0 @@
+-a = 1
+-b = 2
+diff --git a/new.py b/new.py
+new file mode 100644
+--- /dev/null
++++ b/new.py
+@@ -0,0 +1,2 @@
++a = 1
++b = 2
+\\ No newline at end of file
+"""
+
+
+def testParseUnifiedDiff() -> None:
+    assert parseUnifiedDiff(DIFF) == {
+        'pkg/mod.py': {4, 5, 6, 21},
+        'new.py': {1, 2},
+    }
+
+
+@pytest.mark.parametrize(
+    ('diffText', 'expected'),
+    [
+        ('', {}),
+        ('+++ b/a.py\n', {'a.py': set()}),
+        (
+            '+++ a.py\t2024-01-01 00:00:00\n@@ -1 +1 @@\n-a\n+b\n',
+            {'a.py': {1}},
+        ),
+        ('+++ b/a.py\n@@ -1,2 +1 @@\n-a\n b\n', {'a.py': {1}}),
+    ],
+)
+def testParseUnifiedDiffEdgeCases(
+        diffText: str,
+        expected: dict[str, set[int]],
+) -> None:
+    assert parseUnifiedDiff(diffText) == expected
+
+
+def testResolveDiffPaths(tmp_path: Path) -> None:
+    resolved = resolveDiffPaths({'pkg/mod.py': {1}}, root=tmp_path)
+    assert resolved == {
+        (tmp_path / 'pkg' / 'mod.py').resolve().as_posix(): {1}
+    }
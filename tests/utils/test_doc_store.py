@@ -0,0 +1,157 @@
+import ast
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pydoclint.utils import doc_store
+from pydoclint.utils.doc_store import DocStore
+from pydoclint.utils.generic import getDocstring
+from pydoclint.visitor import Visitor
+
+DATA_DIR = Path(__file__).parent.parent / 'test_data'
+
+CLASS_SRC = '''
+class MyClass:
+    """
+    My class
+
+    Attributes
+    ----------
+    attr1 : int
+        Attribute 1
+
+    Parameters
+    ----------
+    arg1 : int
+        Arg 1
+    """
+
+    attr1: int = 1
+
+    def __init__(self, arg1: int) -> None:
+        pass
+'''
+
+
+@pytest.fixture
+def parseCalls(monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, str]]:
+    """Record the (docstring, style) of each call that parses a docstring"""
+    calls: list[tuple[str, str]] = []
+    originalParse = doc_store.parseDocstringInGivenStyle
+
+    def parseDocstringInGivenStyle(
+            docstring: str, style: str, *args: Any
+    ) -> Any:
+        calls.append((docstring, style))
+        return originalParse(docstring, style, *args)
+
+    monkeypatch.setattr(
+        doc_store, 'parseDocstringInGivenStyle', parseDocstringInGivenStyle
+    )
+    return calls
+
+
+@pytest.mark.parametrize('checkStyleMismatch', [True, False])
+def testVisitor_classDocstringIsParsedOnce(
+        checkStyleMismatch: bool,
+        parseCalls: list[tuple[str, str]],
+) -> None:
+    tree = ast.parse(CLASS_SRC)
+    classNode = tree.body[0]
+    visitor = Visitor(
+        style='numpy',
+        checkClassAttributes=True,
+        checkStyleMismatch=checkStyleMismatch,
+    )
+    visitor.visit(tree)
+
+    # Used by the class attribute checks and in place of the docstring of
+    # __init__(), but only parsed once
+    assert parseCalls == [(getDocstring(classNode), 'numpy')]
+    assert visitor.docStore.numReused == 1
+
+
+def testVisitor_classAndInitDocstringsAreParsedOnce(
+        parseCalls: list[tuple[str, str]],
+) -> None:
+    src = CLASS_SRC.replace('pass', '"""Init"""')
+    tree = ast.parse(src)
+    classNode = tree.body[0]
+    initNode = classNode.body[-1]
+    visitor = Visitor(
+        style='numpy',
+        checkClassAttributes=True,
+        allowInitDocstring=True,
+    )
+    visitor.visit(tree)
+
+    assert sorted(parseCalls) == sorted([
+        (getDocstring(classNode), 'numpy'),
+        (getDocstring(initNode), 'numpy'),
+    ])
+    assert visitor.docStore.numReused == 2  # class docstring & __init__'s
+
+
+def testDocStore_parsesOncePerStyle(
+        parseCalls: list[tuple[str, str]],
+) -> None:
+    tree = ast.parse(CLASS_SRC)
+    classNode = tree.body[0]
+    docStore = DocStore()
+    numpyDoc, _ = docStore.parseInGivenStyle(classNode, 'numpy')
+    googleDoc, _ = docStore.parseInGivenStyle(classNode, 'google')
+    doc, _, styleMismatch = docStore.parseInDetectedStyle(classNode, 'numpy')
+
+    assert doc is numpyDoc
+    assert googleDoc is not numpyDoc
+    assert not styleMismatch
+    assert docStore.parseInGivenStyle(classNode, 'numpy')[0] is numpyDoc
+    assert parseCalls == [
+        (getDocstring(classNode), 'numpy'),
+        (getDocstring(classNode), 'google'),
+    ]
+    assert docStore.numReused == 2  # (the detected style, & the last call)
+
+
+@pytest.mark.parametrize('style', ['numpy', 'google', 'sphinx'])
+def testVisitor_everyDocstringIsParsedAtMostOncePerStyle(
+        style: str,
+        parseCalls: list[tuple[str, str]],
+) -> None:
+    for filename in sorted(DATA_DIR.rglob('*.py')):
+        if not filename.is_file():  # some folder names end with ".py"
+            continue
+
+        try:
+            tree = ast.parse(filename.read_text(encoding='utf-8'))
+        except (SyntaxError, ValueError):
+            continue
+
+        visitor = Visitor(
+            style=style,
+            checkClassAttributes=True,
+            checkStyleMismatch=True,
+            allowInitDocstring=True,
+        )
+        # A docstring shared by several definitions may be parsed once for
+        # each of them, but not more often than that
+        numDefinitions: Counter[str] = Counter(
+            getDocstring(_)
+            for _ in ast.walk(tree)
+            if isinstance(
+                _, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+            )
+        )
+        numCallsBefore: int = len(parseCalls)
+        visitor.visit(tree)
+        numCalls: Counter[tuple[str, str]] = Counter(
+            parseCalls[numCallsBefore:]
+        )
+        assert all(
+            count <= numDefinitions[docstring]
+            for (docstring, _), count in numCalls.items()
+        )
+
+    assert len(parseCalls) > 0
@@ -0,0 +1,177 @@
+import ast
+from pathlib import Path
+from typing import Any
+
+import pytest
+from docstring_parser.common import Docstring
+from docstring_parser.google import GoogleParser
+from docstring_parser.numpydoc import NumpydocParser
+from docstring_parser.rest import parse as parseSphinx
+
+from pydoclint.main import _checkPaths
+from pydoclint.utils.doc import Doc
+from pydoclint.utils.docstring_scanner import scanDocstring
+
+DATA_DIR = Path(__file__).parent.parent / 'test_data'
+EXCLUDE_PATTERN = r'\.git|\.tox'
+
+
+def _collectDocstrings() -> list[str]:
+    docstrings: list[str] = []
+    for filename in sorted(DATA_DIR.rglob('*.py')):
+        if not filename.is_file():  # some folder names end with ".py"
+            continue
+
+        try:
+            tree = ast.parse(filename.read_text(encoding='utf-8'))
+        except (SyntaxError, ValueError):
+            continue
+
+        for node in ast.walk(tree):
+            if isinstance(
+                node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+            ):
+                docstring = ast.get_docstring(node)
+                if docstring:
+                    docstrings.append(docstring)
+
+    return list(dict.fromkeys(docstrings))  # de-duplicate, keep the order
+
+
+ALL_DOCSTRINGS: list[str] = _collectDocstrings()
+
+
+def _parseWithDocstringParser(docstring: str, style: str) -> Docstring:
+    if style == 'numpy':
+        return NumpydocParser().parse(docstring)
+
+    if style == 'google':
+        return GoogleParser().parse(docstring)
+
+    return parseSphinx(docstring)
+
+
+def _summarize(parsed: Docstring, style: str) -> tuple[Any, ...]:
+    # Everything that pydoclint reads from the parsed docstring
+    return (
+        bool(parsed.short_description),
+        bool(parsed.long_description),
+        [(_.args[0], _.arg_name, _.type_name) for _ in parsed.params],
+        [(_.args[0], _.arg_name, _.type_name) for _ in parsed.attrs],
+        [
+            (_.type_name, _.description if style == 'sphinx' else None)
+            for _ in parsed.raises
+        ],
+        [
+            (_.type_name, _.return_name, _.is_generator)
+            for _ in parsed.many_returns
+        ],
+        parsed.yields is not None,
+        [(_.type_name, _.yield_name) for _ in parsed.many_yields],
+        len(parsed.examples),
+        parsed.deprecation is None,
+        parsed.size,
+    )
+
+
+@pytest.mark.parametrize('style', ['numpy', 'google', 'sphinx'])
+def testScanDocstring_sameAsDocstringParserOnTestData(style: str) -> None:
+    # Every docstring in the test data is scanned in every style (so that
+    # the docstrings in the "wrong" style are covered too)
+    numScanned: int = 0
+    for docstring in ALL_DOCSTRINGS:
+        scanned = scanDocstring(docstring, style)
+        if scanned is None:  # falls back to docstring_parser
+            continue
+
+        numScanned += 1
+        expected = _parseWithDocstringParser(docstring, style)
+        assert _summarize(scanned, style) == _summarize(expected, style)
+
+    assert numScanned > 0.9 * len(ALL_DOCSTRINGS)
+
+
+@pytest.mark.parametrize(
+    ('docstring', 'style'),
+    [
+        (
+            'Summary\n\n.. deprecated:: 1.0\n    Use something else\n',
+            'numpy',
+        ),
+        ('Summary\n\nReturns\n--------\nint\n    Result', 'numpy'),
+        (
+            'Summary\n\nParameters\n----------\n\nReturns\n-------\nint',
+            'numpy',
+        ),
+        ('Summary\n\nArgs:\n    arg1 has no colon\n', 'google'),
+        ('Summary\n\n.. attribute :: name\n    :type: int\n', 'sphinx'),
+        ('Summary\n\n:param a b c: too many words\n', 'sphinx'),
+    ],
+)
+def testScanDocstring_fallsBackToDocstringParser(
+        docstring: str,
+        style: str,
+) -> None:
+    assert scanDocstring(docstring, style) is None
+
+
+def testScanDocstring_onlyExtractsWhatPydoclintNeeds() -> None:
+    docstring = """Summary
+
+    Parameters
+    ----------
+    arg1 : int, optional
+        The first argument
+    arg2 : str, default='a'
+        The second argument
+
+    Returns
+    -------
+    result : bool
+        The result
+    """
+    scanned = scanDocstring(docstring, 'numpy')
+    assert scanned is not None
+    assert [(_.arg_name, _.type_name) for _ in scanned.params] == [
+        ('arg1', 'int'),
+        ('arg2', 'str'),
+    ]
+    assert scanned.returns is not None
+    assert scanned.returns.return_name == 'result'
+    assert scanned.returns.type_name == 'bool'
+    assert scanned.returns.description is None  # descriptions are skipped
+
+
+def testScanDocstring_unknownStyle() -> None:
+    with pytest.raises(ValueError, match='Unsupported docstring style'):
+        scanDocstring('Summary', 'epydoc')
+
+
+def testDoc_fallsBackToDocstringParser() -> None:
+    docstring = 'Summary\n\n.. deprecated:: 1.0\n    Use something else\n'
+    doc = Doc(docstring, style='numpy', parser='fast')
+    assert doc.parsed.deprecation is not None
+    assert not doc.isShortDocstring
+
+
+@pytest.mark.parametrize('style', ['numpy', 'google', 'sphinx'])
+def testCheckPaths_sameViolationsWithBothParsers(style: str) -> None:
+    options: dict[str, Any] = {
+        'style': style,
+        'checkStyleMismatch': True,  # parses in the detected styles too
+        'quiet': True,
+        'exclude': EXCLUDE_PATTERN,
+    }
+    violationsFast = _checkPaths((str(DATA_DIR),), parser='fast', **options)
+    violationsCompat = _checkPaths(
+        (str(DATA_DIR),), parser='compat', **options
+    )
+
+    def _render(violations: dict[str, Any]) -> dict[str, list[str]]:
+        return {
+            filename: [f'{_.line}: {_}' for _ in violationsInFile]
+            for filename, violationsInFile in violations.items()
+        }
+
+    assert _render(violationsFast) == _render(violationsCompat)
+    assert sum(len(_) for _ in violationsFast.values()) > 0
@@ -0,0 +1,244 @@
+import os
+import re
+from pathlib import Path
+
+import pytest
+
+from pydoclint.utils import file_discovery
+from pydoclint.utils.file_discovery import (
+    GitIgnoreRule,
+    iterPythonFiles,
+    parseGitIgnore,
+)
+
+DATA_DIR = Path(__file__).parent.parent / 'test_data'
+EXCLUDE_PATTERN = re.compile(r'\.git|\.tox')
+NO_EXCLUSION = re.compile(r'(?!)')  # matches nothing
+
+
+def _makeTree(root: Path, files: list[str]) -> None:
+    for file in files:
+        (root / file).parent.mkdir(parents=True, exist_ok=True)
+        (root / file).write_text('', encoding='utf-8')
+
+
+def _discover(paths: list[str], **kwargs: object) -> list[str]:
+    kwargs.setdefault('excludePattern', NO_EXCLUSION)
+    return [_.as_posix() for _ in iterPythonFiles(paths, **kwargs)]
+
+
+@pytest.mark.parametrize(
+    'root',
+    [
+        DATA_DIR.as_posix(),
+        (DATA_DIR / 'edge_cases').as_posix(),  # with folders ending in .py
+        (DATA_DIR / 'numpy').as_posix() + '/',
+    ],
+)
+def testIterPythonFiles_sameAsSortedRglob(root: str) -> None:
+    expected = [
+        _.as_posix()
+        for _ in sorted(Path(root).rglob('*.py'))
+        if _.is_file() and not EXCLUDE_PATTERN.search(_.as_posix())
+    ]
+    assert _discover([root], excludePattern=EXCLUDE_PATTERN) == expected
+
+
+def testIterPythonFiles_orderAndRelativePaths(
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _makeTree(tmp_path, ['b.py', 'a/c/d.py', 'a/b.py', 'a/e.py', 'a-b/f.py'])
+    monkeypatch.chdir(tmp_path)
+    assert _discover(['.']) == [
+        'a/b.py',
+        'a/c/d.py',
+        'a/e.py',
+        'a-b/f.py',
+        'b.py',
+    ]
+    assert _discover(['./a']) == ['a/b.py', 'a/c/d.py', 'a/e.py']
+
+
+def testIterPythonFiles_prunesExcludedDirectories(
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _makeTree(
+        tmp_path,
+        ['src/a.py', 'node_modules/pkg/b.py', '.tox/py311/c.py', 'd.tox.py'],
+    )
+    scanned: list[str] = []
+    originalScandir = os.scandir
+
+    def scandir(path: str) -> object:
+        scanned.append(Path(path).name)
+        return originalScandir(path)
+
+    monkeypatch.setattr(file_discovery.os, 'scandir', scandir)
+    files = _discover(
+        [tmp_path.as_posix()],
+        excludePattern=re.compile(r'\.tox|node_modules/'),
+    )
+    assert files == [(tmp_path / 'src/a.py').as_posix()]
+    assert sorted(scanned) == sorted([tmp_path.name, 'src'])
+
+
+@pytest.mark.parametrize(
+    'pattern',
+    [
+        r'tests/(?!keep)',  # a lookahead past the folder's "/"
+        r'build/$',  # matches no file path
+        r'tests/\B',  # no word boundary after the folder's "/"
+    ],
+)
+def testIterPythonFiles_keepsPerFileMatchingOfContextDependentPatterns(
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        pattern: str,
+) -> None:
+    # Pruning the folders that match these patterns (with a trailing "/")
+    # would drop files that the patterns do not match
+    _makeTree(tmp_path, ['tests/keep/k.py', 'tests/t.py', 'build/b.py'])
+    monkeypatch.chdir(tmp_path)
+    excludePattern = re.compile(pattern)
+    expected = [
+        _.as_posix()
+        for _ in sorted(Path().rglob('*.py'))
+        if not excludePattern.search(_.as_posix())
+    ]
+    assert _discover(['.'], excludePattern=excludePattern) == expected
+    assert 'tests/keep/k.py' in expected
+
+
+def testIterPythonFiles_isLazy(
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _makeTree(tmp_path, ['a/b.py', 'c/d.py'])
+    scanned: list[str] = []
+    originalScandir = os.scandir
+
+    def scandir(path: str) -> object:
+        scanned.append(Path(path).name)
+        return originalScandir(path)
+
+    monkeypatch.setattr(file_discovery.os, 'scandir', scandir)
+    files = iterPythonFiles([tmp_path.as_posix()], excludePattern=NO_EXCLUSION)
+    assert next(files).name == 'b.py'
+    assert 'c' not in scanned  # not discovered yet
+    assert next(files).name == 'd.py'
+
+
+def testIterPythonFiles_deduplicates(
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _makeTree(tmp_path, ['pkg/a.py', 'pkg/sub/b.py'])
+    (tmp_path / 'pkg' / 'link.py').symlink_to(tmp_path / 'pkg' / 'a.py')
+    (tmp_path / 'pkg' / 'linkedDir').symlink_to(tmp_path / 'pkg' / 'sub')
+    monkeypatch.chdir(tmp_path)
+    assert _discover(['pkg', 'pkg/sub', './pkg/a.py', 'pkg/sub/b.py']) == [
+        'pkg/a.py',
+        'pkg/sub/b.py',
+    ]
+
+
+def testIterPythonFiles_explicitAndVirtualFiles(tmp_path: Path) -> None:
+    _makeTree(tmp_path, ['script'])
+    script = (tmp_path / 'script').as_posix()
+    assert _discover([script, 'unsaved.py'], virtualFiles={'unsaved.py'}) == [
+        script,
+        'unsaved.py',
+    ]
+    assert _discover([script], excludePattern=re.compile(r'script')) == []
+
+
+def testIterPythonFiles_respectGitignore(tmp_path: Path) -> None:
+    _makeTree(
+        tmp_path,
+        [
+            'build/a.py',
+            'src/keep.py',
+            'src/generated_1.py',
+            'src/generated_important.py',
+            'src/local.py',
+            'src/sub/local.py',
+            'src/sub/x.py',
+            'docs/conf.py',
+            'venv/lib/site.py',
+            '.git/hooks/hook.py',
+        ],
+    )
+    (tmp_path / '.gitignore').write_text(
+        '# comment\n/build\nvenv/\ngenerated_*.py\n!generated_important.py\n',
+        encoding='utf-8',
+    )
+    (tmp_path / 'src' / 'sub' / '.gitignore').write_text(
+        'x.py\n', encoding='utf-8'
+    )
+    (tmp_path / '.git' / 'info').mkdir()
+    (tmp_path / '.git' / 'info' / 'exclude').write_text(
+        'docs\n/src/local.py\n', encoding='utf-8'
+    )
+    root = tmp_path.as_posix()
+
+    assert _discover([root], respectGitignore=True) == [
+        f'{root}/src/generated_important.py',
+        f'{root}/src/keep.py',
+        f'{root}/src/sub/local.py',  # "/src/local.py" is anchored
+    ]
+
+    # The .gitignore files and .git/info/exclude in the ancestors apply too
+    assert _discover([f'{root}/src'], respectGitignore=True) == [
+        f'{root}/src/generated_important.py',
+        f'{root}/src/keep.py',
+        f'{root}/src/sub/local.py',
+    ]
+
+    # Explicitly given files are always checked
+    assert _discover([f'{root}/build/a.py'], respectGitignore=True) == [
+        f'{root}/build/a.py'
+    ]
+
+    assert len(_discover([root], excludePattern=EXCLUDE_PATTERN)) == 9
+
+
+@pytest.mark.parametrize(
+    ('pattern', 'path', 'isDir', 'expected'),
+    [
+        ('*.py', 'a.py', False, True),
+        ('*.py', 'dir/a.py', False, True),
+        ('/*.py', 'dir/a.py', False, False),
+        ('dir/*.py', 'dir/a.py', False, True),
+        ('dir/*.py', 'dir/sub/a.py', False, False),
+        ('dir/**/*.py', 'dir/sub/a.py', False, True),
+        ('dir/**/*.py', 'dir/a.py', False, True),
+        ('**/dir', 'a/b/dir', True, True),
+        ('dir/**', 'dir/a/b.py', False, True),
+        ('dir/**', 'dir', True, False),
+        ('build/', 'build', True, True),
+        ('build/', 'build', False, False),
+        ('a?c.py', 'abc.py', False, True),
+        ('a?c.py', 'a/c.py', False, False),
+        ('[ab].py', 'b.py', False, True),
+        ('[!ab].py', 'b.py', False, False),
+        ('\\#name', '#name', False, True),
+        ('\\!name', '!name', False, True),
+        ('a**b', 'axxb', False, True),
+    ],
+)
+def testGitIgnoreRule(
+        pattern: str,
+        path: str,
+        isDir: bool,
+        expected: bool,
+) -> None:
+    assert GitIgnoreRule(pattern).matches(path, isDir) is expected
+
+
+def testParseGitIgnore() -> None:
+    rules = parseGitIgnore('# comment\n\n  \n!keep.py\nspace\\ \ntrailing  \n')
+    assert [_.negated for _ in rules] == [True, False, False]
+    assert rules[1].matches('space ', isDir=False)
+    assert rules[2].matches('trailing', isDir=False)
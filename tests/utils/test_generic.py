@@ -3,7 +3,10 @@ import ast
 import pytest
 
 from pydoclint.utils.generic import (
+    canonicalizeTypeHint,
+    clearTypeHintCache,
     collectFuncArgs,
+    getTypeHintCacheInfo,
     isPrivateName,
     specialEqual,
     stripQuotes,
@@ -119,6 +122,34 @@ def testSpecialEqual(str1: str, str2: str, expected: bool) -> None:
     assert specialEqual(str1, str2) == expected
 
 
+@pytest.mark.parametrize(
+    ('typeHint', 'expected'),
+    [
+        ('int', 'int'),
+        ('"int"', 'int'),
+        ('``dict[str, int]``', 'dict[str, int]'),
+        ('Tuple[int,...]', 'Tuple[int, ...]'),
+        ('Literal["abc", "def"]', "Literal['abc', 'def']"),
+        ("Literal[\n  'abc',\n  'def',\n]", "Literal['abc', 'def']"),
+        ('int  # a comment', 'int'),
+        ('int, default=42  # noqa: E501', 'int, default = 42'),
+        ('list of int', 'list of int'),  # cannot be parsed
+        ('list[\n  int, optional', 'list[int,optional'),  # cannot be parsed
+    ],
+)
+def testCanonicalizeTypeHint(typeHint: str, expected: str) -> None:
+    assert canonicalizeTypeHint(typeHint) == expected
+
+
+def testTypeHintCacheInfo() -> None:
+    clearTypeHintCache()
+    first = canonicalizeTypeHint('dict[str, list[int]]')
+    second = canonicalizeTypeHint('dict[str, list[int]]')
+    assert first is second  # interned
+    cacheInfo = getTypeHintCacheInfo()
+    assert (cacheInfo.hits, cacheInfo.misses) == (1, 1)
+
+
 @pytest.mark.parametrize(
     ('name', 'private'),
     [
@@ -3,8 +3,12 @@ from docstring_parser import ParseError
 
 from pydoclint.utils.parse_docstring import (
     _NUMPY_SECTION_HEADER_PATTERN,
-    _containsNumpyStylePattern,
     _validateNumpySectionHeaders,
+    classifyDocstringStyle,
+    clearDocstringParseCache,
+    getDocstringParseCacheInfo,
+    parseDocstring,
+    parseDocstringInGivenStyle,
 )
 
 
@@ -176,9 +180,38 @@ from pydoclint.utils.parse_docstring import (
         ('', False),
     ],
 )
-def testContainsNumpyStylePattern(docstring: str, expected: bool) -> None:
+def testClassifyDocstringStyle_numpy(docstring: str, expected: bool) -> None:
     """Test detection of numpy-style docstring patterns."""
-    assert _containsNumpyStylePattern(docstring) is expected
+    assert classifyDocstringStyle(docstring).numpy is expected
+
+
+@pytest.mark.parametrize(
+    ('docstring', 'expected'),
+    [
+        ('Summary\n\nReturns\n\n-------\nint', (True, False, False)),
+        ('Summary\n\nReturns\n:\n-------\nint', (True, False, False)),
+        ('Summary\n\nRETURNS :\n  ---\nint', (True, False, False)),
+        ('Summary\n\nReturns:\n:\n---\nint', (False, True, False)),
+        ('Summary\n\nReturns\nint\n---', (False, False, False)),
+        ('Summary\n\nArgs:\n    arg1: Arg 1', (False, True, False)),
+        ('    Summary\n\n    Args:\n        a: A', (False, True, False)),
+        ('Summary\n\n  Args:\n    arg1: Arg 1', (False, False, False)),
+        ('Summary\n\n:param arg1: Arg 1', (False, False, True)),
+        ('Summary\n\n:param   ', (False, False, True)),
+        ('Summary\n\n  :param arg1: Arg 1', (False, False, False)),
+        (
+            'Summary\n\nArgs:\n    a: A\n\n:return: Result',
+            (False, True, True),
+        ),
+        ('', (False, False, False)),
+    ],
+)
+def testClassifyDocstringStyle(
+        docstring: str,
+        expected: tuple[bool, bool, bool],
+) -> None:
+    evidence = classifyDocstringStyle(docstring)
+    assert (evidence.numpy, evidence.google, evidence.sphinx) == expected
 
 
 def testNumpySectionHeaderPattern() -> None:
@@ -341,3 +374,35 @@ def testValidateNumpySectionHeaders_ignoresNonSectionUnderlines() -> None:
     """
 
     _validateNumpySectionHeaders(docstring)
+
+
+def testDocstringParseCache() -> None:
+    """Test that repeated docstrings are parsed only once."""
+    docstring = """
+    Something
+
+    Parameters
+    ----------
+    arg1 : int
+        Arg 1
+    """
+    clearDocstringParseCache()
+
+    doc1, exc1 = parseDocstringInGivenStyle(docstring, 'numpy')
+    doc2, exc2 = parseDocstringInGivenStyle(docstring, 'numpy')
+    assert doc1 is doc2
+    assert exc1 is None
+    assert exc2 is None
+    assert getDocstringParseCacheInfo().hits == 1
+    assert getDocstringParseCacheInfo().misses == 1
+
+    # Different styles or modes are cached separately
+    doc3, _ = parseDocstringInGivenStyle(docstring, 'google')
+    assert doc3 is not doc1
+    assert doc3.style == 'google'
+    doc4, _, styleMismatch = parseDocstring(docstring, 'numpy')
+    assert doc4 is doc1  # reuses the result parsed in the given style
+    assert not styleMismatch
+
+    clearDocstringParseCache()
+    assert getDocstringParseCacheInfo().currsize == 0
@@ -0,0 +1,177 @@
+import json
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from pydoclint.baseline import BaselineEvaluator
+from pydoclint.daemon import DaemonState
+from pydoclint.main import _checkPaths, main
+from pydoclint.utils import profiling
+from pydoclint.utils.profiling import OTHER_PHASE, Profiler, timePhase
+from pydoclint.utils.violation import Violation
+
+DATA_DIR = Path(__file__).parent.parent / 'test_data'
+EXCLUDE_PATTERN = r'\.git|\.tox'
+
+
+def testProfilerExcludesNestedPhases() -> None:
+    profiler = Profiler()
+    with profiler.profileFile('a.py'):
+        with profiler.profilePhase('visit'):
+            time.sleep(0.01)
+            with profiler.profilePhase('docstring parsing'):
+                time.sleep(0.02)
+
+        with profiler.profilePhase('visit'):  # accumulated
+            time.sleep(0.01)
+
+    phases = {
+        phase: wall for (_, phase), (wall, _) in profiler.phaseTimes.items()
+    }
+    assert set(phases) == {'visit', 'docstring parsing', OTHER_PHASE}
+    # (The nested 0.02 seconds are not counted in "visit")
+    assert 0.02 <= phases['visit'] < 0.04
+    assert phases['docstring parsing'] >= 0.02
+    assert sum(phases.values()) == pytest.approx(
+        profiler.fileTimes['a.py'][0], rel=1e-3
+    )
+
+
+def testProfilerDrainAndMerge() -> None:
+    profiler = Profiler()
+    with profiler.profileFile('a.py'):
+        with profiler.profilePhase('parse'):
+            pass
+
+        profiler.recordDefinition('func', 3, time.perf_counter() - 0.5)
+
+    data = json.loads(json.dumps(profiler.drain()))  # as if sent by a worker
+    assert profiler.fileTimes == {}
+    assert profiler.phaseTimes == {}
+    assert profiler.definitionTimes == []
+
+    merged = Profiler()
+    merged.merge(data)
+    assert set(merged.fileTimes) == {'a.py'}
+    assert {_[1] for _ in merged.phaseTimes} == {'parse', OTHER_PHASE}
+    [(wall, *definition)] = merged.definitionTimes
+    assert definition == ['a.py', 'func', 3]
+    assert wall == pytest.approx(0.5, abs=0.1)
+    assert merged.toJson() == data
+
+
+def testTimePhaseWithoutActiveProfiler() -> None:
+    assert profiling.activeProfiler is None
+    with timePhase('parse'):  # a no-op
+        pass
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def testCheckPathsWithProfiler(jobs: int) -> None:
+    profiler = Profiler()
+    violations = _checkPaths(
+        (str(DATA_DIR / 'numpy'),),
+        exclude=EXCLUDE_PATTERN,
+        quiet=True,
+        jobs=jobs,
+        profiler=profiler,
+    )
+    assert profiling.activeProfiler is None  # restored
+    assert set(profiler.fileTimes) == set(violations)
+    phases = {phase for _, phase in profiler.phaseTimes}
+    assert {'read', 'parse', 'visit', 'docstring parsing'} <= phases
+    assert len(profiler.definitionTimes) > 0
+
+    report = profiler.formatReport(topN=3)
+    assert f'({len(violations)} files)' in report
+    assert 'The 3 slowest files' in report
+    assert 'The 3 slowest definitions' in report
+
+
+def testBaselineEvaluationIsTimedPerFile() -> None:
+    def slowStream() -> Iterator[tuple[str, list[Violation]]]:
+        for file in ('a.py', 'b.py'):
+            time.sleep(0.02)  # checking the file
+            yield file, [Violation(line=1, code=201)]
+
+    profiler = Profiler()
+    evaluator = BaselineEvaluator({'a.py': []})
+    results = evaluator.evaluate(slowStream(), profiler=profiler)
+    assert profiler.phaseTimes == {}  # nothing is evaluated yet
+
+    assert [file for file, _ in results] == ['a.py', 'b.py']
+    wall, _ = profiler.phaseTimes['', 'baseline']
+    # (The time of checking the files in the stream is not counted)
+    assert 0 < wall < 0.02
+
+
+def testProfileJsonOption(tmp_path: Path) -> None:
+    profileJson = tmp_path / 'profile.json'
+    result = CliRunner().invoke(
+        main,
+        [
+            '--profile-json',
+            profileJson.as_posix(),
+            '--exclude',
+            EXCLUDE_PATTERN,
+            str(DATA_DIR / 'numpy' / 'args'),
+        ],
+    )
+    assert 'slowest definitions' in result.output
+    data = json.loads(profileJson.read_text(encoding='utf-8'))
+    assert len(data['files']) > 0
+    assert all('visit' in _['phases'] for _ in data['files'].values())
+
+
+def testTraceFileOption(tmp_path: Path) -> None:
+    traceFile = tmp_path / 'trace.json'
+    result = CliRunner().invoke(
+        main,
+        [
+            '--trace-file',
+            traceFile.as_posix(),
+            '--jobs',
+            '2',
+            '--exclude',
+            EXCLUDE_PATTERN,
+            str(DATA_DIR / 'numpy' / 'args'),
+        ],
+    )
+    assert 'slowest definitions' not in result.output  # no report
+    events = json.loads(traceFile.read_text(encoding='utf-8'))['traceEvents']
+
+    spans = [_ for _ in events if _['ph'] == 'X']
+    categories = {_['cat'] for _ in spans}
+    assert categories == {'file', 'phase', 'definition'}
+    assert 'discovery' in {_['name'] for _ in spans}
+    assert all(_['dur'] >= 0 for _ in spans)
+
+    # The files are checked in the worker processes, each in its own row
+    filePids = {_['pid'] for _ in spans if _['cat'] == 'file'}
+    processNames = {
+        _['pid']: _['args']['name'] for _ in events if _['ph'] == 'M'
+    }
+    assert set(processNames) == {_['pid'] for _ in spans}
+    assert all('worker' in processNames[_] for _ in filePids)
+
+
+def testDaemonWritesTraceFile(tmp_path: Path) -> None:
+    (tmp_path / 'a.py').write_text('def f(x):\n    pass\n', encoding='utf-8')
+    traceFile = tmp_path / 'trace.json'
+    state = DaemonState(
+        {'style': 'numpy', 'exclude': EXCLUDE_PATTERN},
+        traceFile=str(traceFile),
+    )
+    request = {'command': 'check', 'cwd': str(tmp_path), 'paths': ['a.py']}
+    for _ in range(2):
+        assert state.handleRequest(request)['ok']
+
+    # The trace is rewritten after each request, with all the requests
+    events = json.loads(traceFile.read_text(encoding='utf-8'))['traceEvents']
+    names = [_['name'] for _ in events if _['ph'] == 'X']
+    assert names.count('request') == 2
+    assert names.count('a.py') == 2
+    assert names.count('parse') == 1  # the second one is served from memory
@@ -1,5 +1,8 @@
+import ast
+
 import pytest
 
+from pydoclint.utils import return_anno
 from pydoclint.utils.return_anno import ReturnAnnotation
 
 
@@ -33,3 +36,42 @@ from pydoclint.utils.return_anno import ReturnAnnotation
 def testIsTuple(annotation: str, expected: bool) -> None:
     retAnno = ReturnAnnotation(annotation=annotation)
     assert retAnno._isTuple() == expected
+
+
+def _returnAnnotationNode(annotation: str) -> ast.expr:
+    returns = ast.parse(f'def f() -> {annotation}: pass').body[0].returns
+    assert returns is not None
+    return returns
+
+
+@pytest.mark.parametrize(
+    ('annotation', 'expected'),
+    [
+        ('int', ['int']),
+        ('Tuple[int]', ['int']),
+        ('Tuple[int, str]', ['int', 'str']),
+        ('tuple[int | str, Dict[str, Any]]', ['int | str', 'Dict[str, Any]']),
+        ('Tuple[int, ...]', ['Tuple[int, ...]']),
+        ('tuple[()]', []),
+        ('Tuple["MyClass", int]', ['MyClass', 'int']),
+        ('"tuple[int, int, str]"', ['int', 'int', 'str']),
+        ('Tuple[Literal["a", "b"], int]', ["Literal['a', 'b']", 'int']),
+    ],
+)
+def testDecompose(annotation: str, expected: list[str]) -> None:
+    fromText = ReturnAnnotation(annotation=annotation)
+    fromNode = ReturnAnnotation.fromAstNode(_returnAnnotationNode(annotation))
+    assert fromText.decompose() == expected
+    assert fromNode.decompose() == expected
+
+
+def testFromAstNodeDoesNotParseAgain(monkeypatch: pytest.MonkeyPatch) -> None:
+    def parseAnnotation(annotation: str) -> ast.expr:
+        raise AssertionError(f'Unexpected parsing of {annotation}')
+
+    monkeypatch.setattr(return_anno, 'parseAnnotation', parseAnnotation)
+
+    node = _returnAnnotationNode('Tuple[int, List[str]]')
+    retAnno = ReturnAnnotation.fromAstNode(node)
+    assert retAnno.node is node
+    assert retAnno.decompose() == ['int', 'List[str]']
@@ -5,6 +5,7 @@ import pytest
 from pydoclint.utils.ast_types import FuncOrAsyncFuncDef
 from pydoclint.utils.generic import getFunctionId
 from pydoclint.utils.return_yield_raise import (
+    FunctionBodySummary,
     GeneratorAnnotationKind,
     getGeneratorAnnotationKind,
     getRaisedExceptions,
@@ -14,7 +15,9 @@ from pydoclint.utils.return_yield_raise import (
     hasReturnAnnotation,
     hasReturnStatements,
     hasYieldStatements,
+    summarizeFunctionBody,
 )
+from pydoclint.utils.scope_index import ScopeIndex
 
 src1 = """
 def func1():
@@ -112,6 +115,20 @@ def func10():
 """
 
 
+src11 = """
+def func11():
+    def func11_child1():
+        return 1
+
+    # The return statement after the nested function (like in a pluggy
+    # hook wrapper) belongs to the outer function
+    try:
+        return (yield)
+    finally:
+        pass
+"""
+
+
 @pytest.mark.parametrize(
     ('src', 'expected'),
     [
@@ -124,6 +141,7 @@ def func10():
         (src8, True),
         (src9, False),
         (src10, True),
+        (src11, True),
     ],
 )
 def testHasReturnStatements(src: str, expected: bool) -> None:
@@ -145,6 +163,7 @@ def testHasReturnStatements(src: str, expected: bool) -> None:
         (src8, True),
         (src9, False),
         (src10, True),
+        (src11, False),
     ],
 )
 def testHasBareReturnStatements(src: str, expected: bool) -> None:
@@ -635,3 +654,60 @@ def testWhichRaiseStatements() -> None:
     }
 
     assert result == expected
+
+
+def testSummarizeFunctionBody_nestedScopes() -> None:
+    src = """
+def outer(x):
+    def inner1():
+        return 1
+
+    async def inner2():
+        assert x
+        yield 2
+
+    try:
+        pass
+    except ValueError:
+        try:
+            pass
+        except KeyError:
+            pass
+
+        raise
+
+    if x:
+        return
+"""
+    tree = ast.parse(src)
+    outer = tree.body[0]
+    assert isinstance(outer, ast.FunctionDef)
+    inner1, inner2 = outer.body[:2]
+    assert isinstance(inner1, ast.FunctionDef)
+    assert isinstance(inner2, ast.AsyncFunctionDef)
+
+    scopeIndex = ScopeIndex(tree)
+    summaries: dict[FuncOrAsyncFuncDef, FunctionBodySummary] = {}
+    summary = summarizeFunctionBody(outer, summaries, scopeIndex)
+    assert summary == FunctionBodySummary(
+        hasYield=False,
+        hasReturn=True,
+        hasBareReturn=True,
+        hasRaise=True,
+        hasAssert=False,
+        raisedExceptions=frozenset({'ValueError'}),
+    )
+
+    assert summaries == {outer: summary}
+    assert summarizeFunctionBody(outer, summaries, scopeIndex) is summary
+
+    inner1Summary = summarizeFunctionBody(inner1, summaries, scopeIndex)
+    assert inner1Summary.hasReturn
+    assert not inner1Summary.hasBareReturn
+
+    inner2Summary = summarizeFunctionBody(inner2, summaries, scopeIndex)
+    assert inner2Summary.hasYield
+    assert inner2Summary.getRaisedExceptions(True) == [  # noqa: FBT003
+        'AssertionError (implicitly from the `assert` statement)'
+    ]
+    assert inner2Summary == summarizeFunctionBody(inner2)  # without index
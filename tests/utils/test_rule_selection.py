@@ -0,0 +1,58 @@
+import pytest
+
+from pydoclint.utils.rule_selection import (
+    ARG_CODES,
+    CLASS_ATTRIBUTE_CODES,
+    RuleSelection,
+    parseCodePrefixes,
+)
+
+
+@pytest.mark.parametrize(
+    ('value', 'expected'),
+    [
+        ('', ()),
+        ('DOC1', ('DOC1',)),
+        (' doc1 , DOC501,', ('DOC1', 'DOC501')),
+        ('DOC', ('DOC',)),
+    ],
+)
+def testParseCodePrefixes(value: str, expected: tuple[str, ...]) -> None:
+    assert parseCodePrefixes(value) == expected
+
+
+@pytest.mark.parametrize('value', ['E501', 'DOC1x', 'DOC5012', 'DOC 1'])
+def testParseCodePrefixesInvalid(value: str) -> None:
+    with pytest.raises(ValueError, match='Invalid violation code prefix'):
+        parseCodePrefixes(value)
+
+
+@pytest.mark.parametrize(
+    ('select', 'ignore', 'enabled', 'disabled'),
+    [
+        ('', '', [1, 101, 503, 607], []),
+        ('DOC1', '', [101, 111], [1, 3, 201, 601]),
+        ('', 'DOC6,DOC003', [1, 101, 503], [3, 601, 607]),
+        ('DOC5', 'DOC5', [], [501, 502]),  # ignore wins ties
+        ('DOC501', 'DOC5', [501], [502, 503, 504, 101]),
+        ('DOC5', 'DOC501', [502, 503, 504], [501, 101]),
+        ('doc', 'DOC0', [101, 607], [1, 2, 3]),
+    ],
+)
+def testRuleSelection(
+        select: str,
+        ignore: str,
+        enabled: list[int],
+        disabled: list[int],
+) -> None:
+    rules = RuleSelection(select=select, ignore=ignore)
+    assert all(rules.isEnabled(_) for _ in enabled)
+    assert not any(rules.isEnabled(_) for _ in disabled)
+    assert rules.selectsAll == (select == '' and ignore == '')
+
+
+def testRuleSelectionFamilies() -> None:
+    rules = RuleSelection(ignore='DOC6')
+    assert rules.anyEnabled(ARG_CODES)
+    assert not rules.anyEnabled(CLASS_ATTRIBUTE_CODES)
+    assert RuleSelection(ignore='DOC601').anyEnabled(CLASS_ATTRIBUTE_CODES)
@@ -0,0 +1,95 @@
+import ast
+
+from pydoclint.utils.scope_index import ScopeIndex
+
+src = """
+x = 1
+
+def func1():
+    if x:
+        return 1
+
+    class Nested:
+        y = 2
+
+        def method1(self):
+            try:
+                pass
+            except ValueError:
+                raise
+
+    match x:
+        case 1:
+            raise KeyError
+"""
+
+
+def testScopeIndex() -> None:
+    tree = ast.parse(src)
+    index = ScopeIndex(tree)
+
+    moduleAssign, func1 = tree.body
+    assert isinstance(func1, ast.FunctionDef)
+    ifStmt, nestedClass, matchStmt = func1.body
+    assert isinstance(nestedClass, ast.ClassDef)
+    classAssign, method1 = nestedClass.body
+    assert isinstance(method1, ast.FunctionDef)
+
+    assert index.getEnclosingFunction(moduleAssign) is None
+    assert index.getEnclosingFunction(func1) is None
+    assert index.getEnclosingFunction(ifStmt.body[0]) is func1
+    # Class bodies are transparent
+    assert index.getEnclosingFunction(classAssign) is func1
+    assert index.getEnclosingFunction(method1) is func1
+
+    assert func1 in index
+    assert method1 in index
+    assert {type(_) for _ in index.getOwnStatements(func1)} == {
+        ast.If,
+        ast.Return,
+        ast.ClassDef,
+        ast.Assign,
+        ast.FunctionDef,
+        ast.Match,
+        ast.Raise,
+    }
+
+    tryStmt = method1.body[0]
+    assert isinstance(tryStmt, ast.Try)
+    bareRaise = tryStmt.handlers[0].body[0]
+    assert isinstance(bareRaise, ast.Raise)
+    assert index.getOwnStatements(method1) == [
+        tryStmt,
+        tryStmt.body[0],  # pass
+        bareRaise,
+    ]
+    assert index.getEnclosingExceptHandler(bareRaise) is tryStmt.handlers[0]
+
+    raiseInMatch = matchStmt.cases[0].body[0]
+    assert isinstance(raiseInMatch, ast.Raise)
+    assert index.getEnclosingFunction(raiseInMatch) is func1
+    assert index.getEnclosingExceptHandler(raiseInMatch) is None
+
+
+def testScopeIndexOnDeeplyNestedCode() -> None:
+    func = ast.FunctionDef(
+        name='f',
+        args=ast.arguments(
+            posonlyargs=[],
+            args=[],
+            kwonlyargs=[],
+            kw_defaults=[],
+            defaults=[],
+        ),
+        body=[],
+        decorator_list=[],
+    )
+    # Build the nested ifs directly, as the parser limits the nesting depth.
+    # A recursive traversal would exceed Python's recursion limit here.
+    body: list[ast.stmt] = [ast.Return(value=ast.Constant(value=1))]
+    for _ in range(5000):
+        body = [ast.If(test=ast.Name(id='x'), body=body, orelse=[])]
+
+    func.body = body
+    index = ScopeIndex(func)
+    assert len(index.getOwnStatements(func)) == 5001
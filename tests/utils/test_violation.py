@@ -0,0 +1,73 @@
+import pickle  # noqa: S403  # only loads what the test itself pickles
+
+import pytest
+
+from pydoclint.utils.edge_case_error import EdgeCaseError
+from pydoclint.utils.return_arg import ReturnArg
+from pydoclint.utils.violation import VIOLATION_CODES, Violation
+from pydoclint.utils.yield_arg import YieldArg
+
+
+def testViolation_invalidCode() -> None:
+    with pytest.raises(EdgeCaseError, match='Invalid violation code'):
+        Violation(line=1, code=999999)
+
+
+def testViolation_msgIsRenderedLazily() -> None:
+    violation = Violation(line=1, code=101, msgPrefix='Function `f`:')
+    assert violation._msg is None
+    assert violation.msg == f'Function `f`: {VIOLATION_CODES[101]}'
+    assert violation._msg is violation.msg  # rendered only once
+
+
+def testViolation_appendMoreMsg() -> None:
+    violation = Violation(
+        line=3,
+        code=103,
+        msgPrefix='Function `f`:',
+        msgPostfix='(Postfix)',
+    )
+    newViolation = violation.appendMoreMsg('More message')
+
+    assert newViolation is not violation
+    assert violation.moreMsg is None
+    assert newViolation.line == 3
+    assert newViolation.code == 103
+    assert newViolation.msg == (
+        f'Function `f`: {VIOLATION_CODES[103]} More message (Postfix)'
+    )
+
+
+def testViolation_pickleRoundTrip() -> None:
+    violation = Violation(line=3, code=105, msgPrefix='Method `A.f`:')
+    violation = violation.appendMoreMsg('More message')
+    renderedMsg: str = violation.msg
+
+    restored = pickle.loads(pickle.dumps(violation))  # noqa: S301
+    assert restored._msg is None
+    assert restored.moreMsg == 'More message'
+    assert restored == violation
+    assert restored.msg == renderedMsg
+
+
+@pytest.mark.parametrize(
+    'obj',
+    [
+        Violation(line=1, code=101),
+        ReturnArg(argName='a', argType='int', argDescr=''),
+        YieldArg(argName='a', argType='int', argDescr=''),
+    ],
+)
+def testValueTypes_haveNoInstanceDict(obj: object) -> None:
+    assert not hasattr(obj, '__dict__')
+
+
+def testReturnArgAndYieldArg_areFrozen() -> None:
+    returnArg = ReturnArg(argName='a', argType='int', argDescr='')
+    yieldArg = YieldArg(argName='a', argType='int', argDescr='')
+
+    with pytest.raises(AttributeError):
+        returnArg.argType = 'str'  # type: ignore[misc]
+
+    with pytest.raises(AttributeError):
+        yieldArg.argType = 'str'  # type: ignore[misc]
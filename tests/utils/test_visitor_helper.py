@@ -203,6 +203,58 @@ def testExtractYieldTypeFromGeneratorOrIteratorAnnotation(
     assert extracted == expected
 
 
+@pytest.mark.parametrize(
+    ('returnAnnoText', 'generatorAnnotationKind', 'hasIter'),
+    [
+        (
+            'Generator[int, None, str]',
+            GeneratorAnnotationKind.GENERATOR,
+            False,
+        ),
+        ('Generator["MyClass"]', GeneratorAnnotationKind.GENERATOR, False),
+        (
+            'AsyncGenerator[int, str]',
+            GeneratorAnnotationKind.ASYNC_GENERATOR,
+            False,
+        ),
+        (
+            'Generator[int, str, bool, bytes]',
+            GeneratorAnnotationKind.GENERATOR,
+            False,
+        ),
+        ('Iterator[Dict[str, Any]]', None, True),
+        ('Iterable', None, True),
+    ],
+)
+def testExtractFromAnnotationNode(
+        returnAnnoText: str,
+        generatorAnnotationKind: GeneratorAnnotationKind | None,
+        hasIter: bool,
+) -> None:
+    """Verify the syntax tree of the annotation gives the same results."""
+    returns = ast.parse(f'def f() -> {returnAnnoText}: pass').body[0].returns
+    returnAnno = ReturnAnnotation.fromAstNode(returns)
+    assert extractYieldTypeFromGeneratorOrIteratorAnnotation(
+        returnAnnoText=returnAnno.annotation,
+        generatorAnnotationKind=generatorAnnotationKind,
+        hasIteratorOrIterableAsReturnAnnotation=hasIter,
+        returnAnnoNode=returnAnno.node,
+    ) == extractYieldTypeFromGeneratorOrIteratorAnnotation(
+        returnAnnoText=returnAnnoText,
+        generatorAnnotationKind=generatorAnnotationKind,
+        hasIteratorOrIterableAsReturnAnnotation=hasIter,
+    )
+    if generatorAnnotationKind is not None:
+        assert extractReturnTypeFromGeneratorAnnotation(
+            returnAnno.annotation,
+            generatorAnnotationKind=generatorAnnotationKind,
+            returnAnnoNode=returnAnno.node,
+        ) == extractReturnTypeFromGeneratorAnnotation(
+            returnAnnoText,
+            generatorAnnotationKind=generatorAnnotationKind,
+        )
+
+
 @pytest.mark.parametrize(
     ('returnAnnoText', 'generatorAnnotationKind', 'expected'),
     [